@@ -0,0 +1 @@
+"""Throughput benchmarks for training and inference."""
@@ -0,0 +1,131 @@
+"""The benchmarked operations, across network shapes, batch sizes and dtypes."""
+
+import contextlib
+import io
+import itertools
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from bin.neuralnetwork import train_add
+from emell.activation import Identity, ReLU
+from emell.computation import delta_quadratic_loss, quadratic_loss
+from emell.initializer import Normal
+from emell.loss import QuadraticLoss
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network
+
+INPUTS = 32
+OUTPUTS = 8
+WIDTHS = (64, 256)
+DEPTHS = (1, 3)
+BATCH_SIZES = (1, 32, 256)
+DTYPES = (np.float32, np.float64)
+
+# What each kind of process imports before it can do any work.
+IMPORTS = (
+    ('numpy', 'import numpy'),
+    ('emell', 'import emell'),
+    ('predict', 'from emell.serialization import load'),
+    ('serve_model', 'import bin.neuralnetwork.serve_model'),
+    ('train_add', 'import bin.neuralnetwork.train_add'),
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_network(width, depth, dtype, compile_batch_size=None):
+    """
+    Makes a network of ReLU hidden layers with a linear output layer.
+    """
+    network = Network(INPUTS, flat_parameters=True, dtype=dtype)
+    for seed in range(depth):
+        network.add_layer(DenseLayer(width, ReLU(), initializer=Normal(seed=seed)))
+    network.add_layer(DenseLayer(OUTPUTS, Identity(), initializer=Normal(seed=depth)))
+    if compile_batch_size is not None:
+        network.compile(compile_batch_size)
+    return network
+
+
+def network_cases():
+    """
+    Yields the name, example count and function of each network benchmark.
+
+    Every benchmark runs on the same batch on every call, so that the timings
+    only cover the network.
+    """
+    rng = np.random.default_rng(0)
+    for width, depth, batch_size, dtype in itertools.product(
+            WIDTHS, DEPTHS, BATCH_SIZES, DTYPES):
+        x = rng.normal(size=(batch_size, INPUTS)).astype(dtype)
+        y = rng.normal(size=(batch_size, OUTPUTS)).astype(dtype)
+        suffix = 'width=%s/depth=%s/batch=%s/%s' % (
+            width, depth, batch_size, np.dtype(dtype).name)
+
+        network = make_network(width, depth, dtype)
+        yield 'compute/' + suffix, batch_size, _bind(network.compute, x)
+
+        network = make_network(width, depth, dtype, batch_size)
+        yield 'predict_compiled/' + suffix, batch_size, _bind(network.predict, x)
+
+        backpropagation = Backpropagation(
+            make_network(width, depth, dtype),
+            quadratic_loss, delta_quadratic_loss, 0.0001)
+        yield ('train_batch/' + suffix, batch_size,
+               _bind(backpropagation.train_batch, x, y))
+
+        backpropagation = Backpropagation(
+            make_network(width, depth, dtype, batch_size),
+            QuadraticLoss(), None, 0.0001)
+        yield ('train_batch_compiled/' + suffix, batch_size,
+               _bind(backpropagation.train_batch, x, y))
+
+        if batch_size == 1:
+            # The per-example algorithm takes one example vector at a time.
+            backpropagation = Backpropagation(
+                make_network(width, depth, dtype),
+                quadratic_loss, delta_quadratic_loss, 0.0001)
+            yield 'train/' + suffix, 1, _bind(backpropagation.train, x[0], y[0])
+
+
+def demo_cases():
+    """
+    Yields the name, example count and function of each end-to-end demo.
+
+    The demos train until their validation loss stops improving, so a call is
+    one whole demo, and the throughput is in demos per second.
+    """
+    for name in ('add', 'formula'):
+        yield 'train_add/' + name, 1, _quiet(getattr(train_add, name))
+
+
+def import_cases():
+    """
+    Yields the name, example count and function of each cold start.
+
+    Each call starts a fresh interpreter that runs the imports and exits, so
+    a call covers the startup of a whole process. numpy is included as the
+    floor that every process pays.
+    """
+    for name, statement in IMPORTS:
+        command = [sys.executable, '-c', statement]
+        yield 'import/' + name, 1, _bind(
+            subprocess.run, command, check=True, cwd=ROOT)
+
+
+def _bind(function, *args, **kwargs):
+    """
+    Binds the arguments of a function.
+    """
+    return lambda: function(*args, **kwargs)
+
+
+def _quiet(function):
+    """
+    Discards everything that a function prints, and seeds its random data.
+    """
+    def call():
+        np.random.seed(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+    return call
@@ -0,0 +1,32 @@
+"""Compares benchmark results against a baseline."""
+
+
+def compare(results, baseline, tolerance):
+    """
+    Finds the benchmarks whose throughput moved by more than the tolerance.
+
+    Parameters
+    ----------
+    results : dict
+        The results of this run, by benchmark name.
+    baseline : dict
+        The results of the baseline run, by benchmark name. Benchmarks missing
+        from either are skipped.
+    tolerance : float
+        The fraction that throughput can drop by before it's a regression.
+
+    Returns
+    -------
+    The regressions and the improvements, as lists of
+    (name, baseline samples/sec, samples/sec) tuples.
+    """
+    regressions = []
+    improvements = []
+    for name in sorted(set(results) & set(baseline)):
+        expected = baseline[name]['samples_per_sec']
+        actual = results[name]['samples_per_sec']
+        if actual < expected * (1 - tolerance):
+            regressions.append((name, expected, actual))
+        elif actual > expected * (1 + tolerance):
+            improvements.append((name, expected, actual))
+    return regressions, improvements
@@ -0,0 +1,107 @@
+"""Runs the benchmarks, and compares them to a stored baseline."""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+
+import numpy as np
+
+from benchmarks.cases import demo_cases, import_cases, network_cases
+from benchmarks.compare import compare
+from benchmarks.timing import measure
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def run(pattern, min_time, rounds):
+    """
+    Runs every benchmark whose name contains the pattern.
+
+    The whole suite runs several times, and the round with the highest
+    throughput is kept for each benchmark, so that a burst of load from other
+    processes only costs a round.
+    """
+    results = {}
+    for _ in range(rounds):
+        for cases, case_min_time in ((network_cases(), min_time),
+                                     (import_cases(), min_time),
+                                     (demo_cases(), 0)):
+            for name, samples, function in cases:
+                if pattern not in name:
+                    continue
+                result = measure(function, samples, case_min_time,
+                                 min_calls=5 if case_min_time else 3)
+                if (name not in results or result['samples_per_sec']
+                        > results[name]['samples_per_sec']):
+                    results[name] = result
+
+    for name, result in results.items():
+        print('%-60s %14.1f samples/s  p50 %9.3f ms  p99 %9.3f ms' % (
+            name, result['samples_per_sec'], result['latency_ms']['p50'],
+            result['latency_ms']['p99']), file=sys.stderr)
+    return results
+
+
+def main():
+    """
+    Benchmarks the library, writes the results as JSON, and flags regressions.
+
+    Exits with status 1 if any benchmark is slower than the baseline by more
+    than the tolerance.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output', help='Where to write the JSON results. '
+                        'Pass the baseline path to update the baseline.')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='The JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The fraction that throughput may drop by')
+    parser.add_argument('--filter', default='',
+                        help='Only run benchmarks whose names contain this')
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='The least time to spend on each benchmark per round, '
+                        'in seconds')
+    parser.add_argument('--rounds', type=int, default=3,
+                        help='How many times to run the suite, keeping the best round')
+    args = parser.parse_args()
+
+    report = {
+        'metadata': {
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': run(args.filter, args.min_time, args.rounds),
+    }
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions, improvements = compare(
+            report['results'], baseline['results'], args.tolerance)
+        for label, changes in (('Improved', improvements), ('REGRESSED', regressions)):
+            for name, expected, actual in changes:
+                print('%s %s: %.1f -> %.1f samples/s (%+.0f%%)' % (
+                    label, name, expected, actual, 100 * (actual / expected - 1)),
+                      file=sys.stderr)
+        report['regressions'] = [name for name, _, _ in regressions]
+
+    encoded = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(encoded + '\n')
+    else:
+        print(encoded)
+
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
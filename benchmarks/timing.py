@@ -0,0 +1,54 @@
+"""Times repeated calls of a function."""
+
+import time
+
+import numpy as np
+
+PERCENTILES = (50, 90, 99)
+
+
+def measure(function, samples, min_time=0.2, min_calls=5, warmup=2):
+    """
+    Calls a function until enough time has passed, and summarizes the calls.
+
+    Parameters
+    ----------
+    function : function() -> Any
+        The work to time.
+    samples : int
+        The number of examples that each call processes.
+    min_time : float
+        The least total time to spend in timed calls, in seconds.
+    min_calls : int
+        The least number of timed calls.
+    warmup : int
+        Untimed calls made first, so that buffers and caches are filled.
+
+    Returns
+    -------
+    A dictionary with the examples processed per second by a typical call, and
+    the latency percentiles of a call in milliseconds.
+    """
+    for _ in range(warmup):
+        function()
+
+    latencies = []
+    total = 0.0
+    while total < min_time or len(latencies) < min_calls:
+        start = time.perf_counter()
+        function()
+        latency = time.perf_counter() - start
+        latencies.append(latency)
+        total += latency
+
+    # The throughput comes from the median call, so that a few calls slowed
+    # down by other processes don't skew it.
+    milliseconds = np.array(latencies) * 1000
+    return {
+        'samples_per_sec': samples * 1000 / float(np.median(milliseconds)),
+        'latency_ms': {
+            'p%s' % percentile: float(np.percentile(milliseconds, percentile))
+            for percentile in PERCENTILES
+        },
+        'calls': len(latencies),
+    }
@@ -0,0 +1,59 @@
+"""A script to search for the best way to train a network on a formula."""
+
+import itertools
+
+from emell.computation import identity, constant, quadratic_loss, delta_quadratic_loss
+from emell.computation import relu, relu_prime
+from emell.data import ArrayDataset
+from emell.neuralnetwork import Network, DenseLayer, Backpropagation
+from emell.optimizer import Adam
+from emell.parallel import SuccessiveHalving
+
+import numpy as np
+
+EXAMPLES = 10000
+BATCH_SIZE = 100
+
+
+def formula(x0, x1):
+    """The formula being learned."""
+    return .5 * x0 + x1 + 1
+
+
+def make_dataset():
+    """Creates a dataset of random inputs and the formula's outputs."""
+    x = np.random.uniform(-10, 10, size=(EXAMPLES, 2))
+    return ArrayDataset(x, formula(x[:, :1], x[:, 1:]), BATCH_SIZE, shuffle=True)
+
+
+def build(configuration):
+    """
+    Builds a network with an optional hidden layer, trained by Adam.
+
+    This runs in the worker processes, so it must be a top-level function.
+    """
+    network = Network(2)
+    if configuration['width']:
+        network.add_layer(DenseLayer(configuration['width'], relu, relu_prime))
+    network.add_layer(DenseLayer(1, identity, constant(1)))
+
+    alpha = configuration['alpha']
+    return Backpropagation(
+        network, quadratic_loss, delta_quadratic_loss, alpha, optimizer=Adam(alpha))
+
+
+def main():
+    """
+    Searches over learning rates and hidden layer widths.
+    """
+    configurations = [
+        {'alpha': alpha, 'width': width}
+        for alpha, width in itertools.product([.0001, .001, .01, .1], [0, 4, 16])
+    ]
+    search = SuccessiveHalving(build, make_dataset(), make_dataset(), max_epochs=27)
+    for trial in search.search(configurations):
+        print('%s trained for %s epochs. Validation error: %s' % (
+            trial.configuration, len(trial.losses), trial.losses[-1]))
+
+if __name__ == '__main__':
+    main()
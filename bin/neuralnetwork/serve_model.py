@@ -0,0 +1,37 @@
+"""A script to serve predictions from a saved network."""
+
+import argparse
+
+from emell.serialization import load
+from emell.serving import MicroBatcher, Server
+
+
+def main():
+    """
+    Serves a network saved with emell.serialization.save.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('model', help='The saved network')
+    parser.add_argument('address', help='A Unix socket path, or a TCP port')
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-latency', type=float, default=0.002,
+                        help='The longest wait for a batch to fill, in seconds')
+    args = parser.parse_args()
+
+    address = args.address
+    if address.isdigit():
+        address = ('127.0.0.1', int(address))
+
+    batcher = MicroBatcher(load(args.model), args.max_batch_size, args.max_latency)
+    server = Server(batcher, address)
+    print('Serving %s on %s' % (args.model, server.address))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        batcher.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,46 @@
 """A script to train a neural network to add two numbers."""
 
 from emell.computation import identity, constant, quadratic_loss, delta_quadratic_loss
-from emell.neuralnetwork import Network, DenseLayer, Backpropagation
+from emell.data import ArrayDataset, Prefetcher
+from emell.neuralnetwork import Network, DenseLayer, Backpropagation, Trainer
+from emell.optimizer import Adam
 
 import numpy as np
-from random import randint, random
+
+# Each epoch trains on mini-batches, so the demos see up to 1M examples apiece.
+EPOCHS = 10
+EXAMPLES_PER_EPOCH = 100000
+BATCH_SIZE = 100
+
+
+def make_dataset(formula, examples):
+    """
+    Creates a shuffled dataset of random inputs and the formula's outputs.
+
+    The batches are gathered on a background thread while the network trains.
+    """
+    x = np.random.randint(-50, 51, size=(examples, 2))
+    y = formula(x[:, :1], x[:, 1:])
+    return Prefetcher(ArrayDataset(x, y, BATCH_SIZE, shuffle=True))
+
+
+def train(backpropagation, formula):
+    """
+    Trains until the validation error stops improving, and prints each epoch.
+    """
+    trainer = Trainer(backpropagation, patience=2, min_delta=1e-12)
+    history = trainer.fit(
+        make_dataset(formula, EXAMPLES_PER_EPOCH),
+        EPOCHS,
+        make_dataset(formula, EXAMPLES_PER_EPOCH // 10))
+
+    for epoch, (error, validation_error) in enumerate(
+            zip(history.training_losses, history.validation_losses)):
+        print('Epoch %s. Error: %s. Validation error: %s' % (
+            epoch, error, validation_error))
+
+    if history.stopped_early:
+        print('Stopped early, using the weights from epoch %s' % history.best_epoch)
 
 
 def add():
@@ -15,22 +51,14 @@ def add():
     neural networks with backpropagation.
     """
     print("Learning x1 + x2 = y")
-    alpha = .0001
+    alpha = .001
 
     network = Network(2)
     network.add_layer(DenseLayer(1, identity, constant(1)))
+    network.compile(BATCH_SIZE)
 
     backpropagation = Backpropagation(network, quadratic_loss, delta_quadratic_loss, alpha)
-    
-    for i in range(100000):
-        x0 = randint(-50, 50)
-        x1 = randint(-50, 50)
-        y = x0 + x1
-        error = backpropagation.train(np.array([x0, x1]), np.array([y]))
-
-        # Print the error every 1000 training examples.
-        if (i % 10000) == 0:
-            print('%s%% done. Error: %s' % (100.0*i/100000.0, error))
+    train(backpropagation, lambda x0, x1: x0 + x1)
 
     # Print the weights and bias at the end.
     print('Final network configuration for straight addition')
@@ -46,26 +74,21 @@ def formula():
     neural networks with backpropagation.
     """
     print("Learning .5 * x1 + x2 + 1 = y")
-    alpha = .0001
+    alpha = .001
 
     network = Network(2)
     network.add_layer(DenseLayer(1, identity, constant(1)))
+    network.compile(BATCH_SIZE)
 
-    backpropagation = Backpropagation(network, quadratic_loss, delta_quadratic_loss, alpha)
-    
-    for i in range(100000):
-        x0 = randint(-50, 50)
-        x1 = randint(-50, 50)
-        y = .5 * x0 + x1 + 1
-        error = backpropagation.train(np.array([x0, x1]), np.array([y]))
-
-        # Print the error every 1000 training examples.
-        if (i % 10000) == 0:
-            print('%s%% done. Error at this step: %s' % (100.0*i/100000.0, error))
+    # Adam gives the bias its own step size, so it isn't held back by how small
+    # its gradient is compared to the weights'.
+    backpropagation = Backpropagation(
+        network, quadratic_loss, delta_quadratic_loss, alpha, optimizer=Adam(0.1))
+    train(backpropagation, lambda x0, x1: .5 * x0 + x1 + 1)
 
     # Print the weights and bias at the end.
     print('Final network configuration for the formula addition')
-    print('This is not expected to converge to the correct weights')
+    print('Mini-batch gradients are expected to converge to the correct weights')
     print(network.layers[1].weights, network.layers[1].bias)
 
 
@@ -8,8 +8,40 @@ Jake Voytko - https://bitlog.com/
 
 Packages
 --------
+activation: Activation functions with in-place and fused kernels.
 computation: Pure math functions used by the ML routines.
+data: Datasets that feed mini-batches of examples to training.
+initializer: Initializers that fill in the starting weights of a layer.
+loss: Loss functions that compute their value and gradient in one pass.
 neuralnetwork: Allows definition and computation on neural network
     architectures.
+optimizer: Optimizers that update network parameters from their gradients.
+parallel: Trains networks across several processes or threads.
+serialization: Saves and loads networks in a binary model format.
+serving: Serves predictions from networks to other processes.
+sparse: Sparse matrices for high-dimensional inputs that are mostly zero.
+
+Each package is imported when it is first used, and so is each module within
+it, so that short-lived processes only pay for what they use.
 
 """
+
+from emell.lazy_import import lazy_import
+
+lazy_import(
+    __name__,
+    {},
+    [
+        "activation",
+        "computation",
+        "data",
+        "initializer",
+        "loss",
+        "neuralnetwork",
+        "optimizer",
+        "parallel",
+        "serialization",
+        "serving",
+        "sparse",
+    ],
+)
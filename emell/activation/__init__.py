@@ -0,0 +1,40 @@
+"""Activation functions with in-place and fused kernels."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.activation.activation import Activation
+    from emell.activation.identity import Identity
+    from emell.activation.leaky_relu import LeakyReLU
+    from emell.activation.relu import ReLU
+    from emell.activation.sigmoid import Sigmoid
+    from emell.activation.softmax import Softmax
+    from emell.activation.softplus import Softplus
+    from emell.activation.tanh import Tanh
+
+__all__ = [
+    "Activation",
+    "Identity",
+    "LeakyReLU",
+    "ReLU",
+    "Sigmoid",
+    "Softmax",
+    "Softplus",
+    "Tanh",
+]
+
+lazy_import(
+    __name__,
+    {
+        "Activation": "activation",
+        "Identity": "identity",
+        "LeakyReLU": "leaky_relu",
+        "ReLU": "relu",
+        "Sigmoid": "sigmoid",
+        "Softmax": "softmax",
+        "Softplus": "softplus",
+        "Tanh": "tanh",
+    },
+)
@@ -0,0 +1,110 @@
+"""Contains the abstract definition of an activation function."""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class Activation:
+    """
+    A base representation of an activation function.
+
+    Activations operate element-wise. Every kernel writes into `out` when it is
+    given, rather than allocating, and `out` may be the input itself.
+    `forward_and_derivative` computes the output and the derivative together,
+    so that the derivative reuses the work of the forward pass, like the mask
+    of a ReLU, rather than redoing it during backpropagation.
+
+    Activations are callable, so they can be used wherever a plain activation
+    function is.
+
+    This is intended to be a protocol in Python 3.8.
+    """
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        Returns
+        -------
+        The activation, in `out` if it was given.
+
+        """
+        raise NotImplementedError("The activation protocol is not usable.")
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative of the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        Returns
+        -------
+        The derivative, in `out` if it was given.
+
+        """
+        raise NotImplementedError("The activation protocol is not usable.")
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the activation and save its derivative for backpropagation.
+
+        The default computes the two separately. Activations override this to
+        share work between them.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        Returns
+        -------
+        The activation, in `out`.
+
+        """
+        self.prime(x, out=derivative)
+        return self(x, out=out)
+
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get the arguments that recreate the activation.
+
+        Returns
+        -------
+        The keyword arguments of the constructor.
+
+        """
+        return {}
+
+    @staticmethod
+    def make_output(x: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Return `out`, or allocate a buffer matching `x` if it was not given.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The input of a kernel.
+        out : np.ndarray, optional
+            The buffer passed to the kernel.
+
+        """
+        return np.empty_like(x) if out is None else out
@@ -0,0 +1,44 @@
+"""Contains the identity activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class Identity(Activation):
+    """Returns its input, for layers with linear outputs like regressions."""
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copy the input, unless it is already in `out`.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        if out is not x:
+            np.copyto(out, x)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, which is always 1.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        out.fill(1)
+        return out
@@ -0,0 +1,96 @@
+"""Contains the leaky rectified linear unit activation."""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class LeakyReLU(Activation):
+    """
+    A ReLU that scales negative inputs by a small slope rather than zeroing them.
+
+    Negative inputs keep a gradient, so neurons can't get stuck at 0.
+    """
+
+    def __init__(self, slope: float = 0.01):
+        """
+        Initialize the activation.
+
+        Parameters
+        ----------
+        slope : float
+            The slope below 0, between 0 and 1.
+
+        """
+        super().__init__()
+        if not 0 <= slope <= 1:
+            raise ValueError("The slope must be between 0 and 1")
+
+        self.slope = slope
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        if out is x:
+            np.multiply(x, self.slope, out=out, where=x < 0)
+            return out
+
+        # With a slope of at most 1, the larger of x and slope * x is the one
+        # on the right side of 0.
+        out = self.make_output(x, out)
+        np.multiply(x, self.slope, out=out)
+        np.maximum(out, x, out=out)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, which is the slope below 0 and 1 from 0 up.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.greater_equal(x, 0, out=out)
+        out *= 1 - self.slope
+        out += self.slope
+        return out
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the derivative, and scale the input by it to get the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        """
+        self.prime(x, out=derivative)
+        np.multiply(x, derivative, out=out)
+        return out
+
+    def get_config(self) -> Dict[str, Any]:
+        """Get the slope, which recreates the activation."""
+        return {"slope": self.slope}
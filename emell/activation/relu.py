@@ -0,0 +1,67 @@
+"""Contains the rectified linear unit activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class ReLU(Activation):
+    """
+    Rectified Linear Unit, which returns the input clamped to at least 0.
+
+    https://www.bitlog.com/knowledge-base/machine-learning/activation-function/#relu
+    """
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.maximum(x, 0, out=out)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, which is 0 below 0 and 1 from 0 up.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.greater_equal(x, 0, out=out)
+        return out
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the mask once, and apply it to the input to get the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        """
+        np.greater_equal(x, 0, out=derivative)
+        np.multiply(x, derivative, out=out)
+        return out
@@ -0,0 +1,77 @@
+"""Contains the logistic sigmoid activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class Sigmoid(Activation):
+    """
+    The logistic function, which squashes inputs into (0, 1).
+
+    Computed as 0.5 * tanh(0.5 * x) + 0.5, which equals 1 / (1 + exp(-x)) but
+    can't overflow.
+    """
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.multiply(x, 0.5, out=out)
+        np.tanh(out, out=out)
+        out *= 0.5
+        out += 0.5
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, sigmoid(x) * (1 - sigmoid(x)).
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        # Equal to 0.25 * (1 - tanh(0.5 * x) ** 2).
+        out = self.make_output(x, out)
+        np.multiply(x, 0.5, out=out)
+        np.tanh(out, out=out)
+        np.square(out, out=out)
+        np.subtract(1, out, out=out)
+        out *= 0.25
+        return out
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the activation, and the derivative from it.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        """
+        self(x, out=out)
+        np.subtract(1, out, out=derivative)
+        derivative *= out
+        return out
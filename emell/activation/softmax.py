@@ -0,0 +1,57 @@
+"""Contains the softmax activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class Softmax(Activation):
+    """
+    Turns each row of inputs into probabilities that sum to 1.
+
+    Unlike other activations, softmax mixes the values of a row, so its
+    derivative is not element-wise. It is meant for the output layer of a
+    classifier trained with SoftmaxCrossEntropyLoss, which takes its gradient
+    with respect to the inputs of the softmax directly. The derivative is
+    reported as 1 so that the gradient passes through unchanged, which is
+    wrong for any other loss, so Backpropagation rejects other pairings.
+    """
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation of each row.
+
+        The largest value of each row is subtracted first, so that large
+        inputs can't overflow.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.subtract(x, np.max(x, axis=-1, keepdims=True), out=out)
+        np.exp(out, out=out)
+        out /= np.sum(out, axis=-1, keepdims=True)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Report a derivative of 1, deferring to SoftmaxCrossEntropyLoss.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        out.fill(1)
+        return out
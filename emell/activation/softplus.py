@@ -0,0 +1,72 @@
+"""Contains the softplus activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+from emell.activation.sigmoid import Sigmoid
+
+
+class Softplus(Activation):
+    """A smooth approximation of ReLU, log(1 + exp(x))."""
+
+    def __init__(self) -> None:
+        """Initialize the activation."""
+        super().__init__()
+        self._sigmoid = Sigmoid()
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        # log(exp(0) + exp(x)), computed without overflowing.
+        out = self.make_output(x, out)
+        np.logaddexp(0, x, out=out)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, which is the logistic sigmoid.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        return self._sigmoid(x, out=out)
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the activation, and the derivative from it.
+
+        The sigmoid of x is 1 - exp(-softplus(x)).
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        """
+        self(x, out=out)
+        np.negative(out, out=derivative)
+        np.expm1(derivative, out=derivative)
+        np.negative(derivative, out=derivative)
+        return out
@@ -0,0 +1,66 @@
+"""Contains the hyperbolic tangent activation."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.activation.activation import Activation
+
+
+class Tanh(Activation):
+    """The hyperbolic tangent, which squashes inputs into (-1, 1)."""
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the activation.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the activation into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.tanh(x, out=out)
+        return out
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the derivative, 1 - tanh(x) ** 2.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray, optional
+            The buffer to write the derivative into. Allocated if not given.
+
+        """
+        out = self.make_output(x, out)
+        np.tanh(x, out=out)
+        np.square(out, out=out)
+        np.subtract(1, out, out=out)
+        return out
+
+    def forward_and_derivative(
+        self, x: np.ndarray, out: np.ndarray, derivative: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the activation, and the derivative from it.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The weighted outputs of a layer.
+        out : np.ndarray
+            The buffer to write the activation into. May be `x`.
+        derivative : np.ndarray
+            The buffer to write the derivative into.
+
+        """
+        np.tanh(x, out=out)
+        np.square(out, out=derivative)
+        np.subtract(1, derivative, out=derivative)
+        return out
@@ -0,0 +1,34 @@
+"""Contains tests for activation.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Activation
+
+
+class ActivationTest(unittest.TestCase):
+    """Contains tests for the Activation base class."""
+
+    def test_protocol(self) -> None:
+        """Verifies that the protocol cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            Activation()(np.zeros(2))
+
+        with self.assertRaises(NotImplementedError):
+            Activation().prime(np.zeros(2))
+
+        self.assertEqual({}, Activation().get_config())
+
+    def test_make_output(self) -> None:
+        """Verifies that buffers are only allocated when none is given."""
+        x = np.zeros(3, np.float32)
+        out = np.empty(3, np.float32)
+        self.assertIs(out, Activation.make_output(x, out))
+        allocated = Activation.make_output(x, None)
+        self.assertEqual((3,), allocated.shape)
+        self.assertEqual(np.float32, allocated.dtype)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+"""Contains tests for identity.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Identity
+from emell.testutil import check_activation
+
+
+class IdentityTest(unittest.TestCase):
+    """Contains tests for the Identity activation."""
+
+    def test_identity(self) -> None:
+        """Verifies that the input is returned with a derivative of 1."""
+        x = np.array([-2.0, 0.0, 3.0])
+        np.testing.assert_array_equal(x, Identity()(x))
+        np.testing.assert_array_equal(np.ones(3), Identity().prime(x))
+        check_activation(Identity(), np.linspace(-3, 3, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Contains tests for leaky_relu.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import LeakyReLU
+from emell.testutil import check_activation
+
+
+class LeakyReLUTest(unittest.TestCase):
+    """Contains tests for the LeakyReLU activation."""
+
+    def test_leaky_relu(self) -> None:
+        """Verifies that negative inputs are scaled by the slope."""
+        activation = LeakyReLU(0.1)
+        x = np.array([-2.0, 0.0, 3.0])
+        np.testing.assert_allclose(np.array([-0.2, 0.0, 3.0]), activation(x))
+        np.testing.assert_allclose(np.array([0.1, 1.0, 1.0]), activation.prime(x))
+        check_activation(activation, np.array([-2.5, -1.0, 0.5, 3.0]))
+        self.assertEqual({"slope": 0.1}, activation.get_config())
+
+    def test_slope(self) -> None:
+        """Verifies that slopes outside [0, 1] are rejected."""
+        with self.assertRaises(ValueError):
+            LeakyReLU(-0.1)
+
+        with self.assertRaises(ValueError):
+            LeakyReLU(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Contains tests for relu.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import ReLU
+from emell.computation import relu, relu_prime
+from emell.testutil import check_activation
+
+
+class ReLUTest(unittest.TestCase):
+    """Contains tests for the ReLU activation."""
+
+    def test_relu(self) -> None:
+        """Verifies that the activation matches the relu function."""
+        x = np.array([-1, 0, 0.5, 1])
+        np.testing.assert_array_equal(relu(x), ReLU()(x))
+        np.testing.assert_array_equal(relu_prime(x), ReLU().prime(x))
+        check_activation(ReLU(), np.array([-2.5, -1.0, 0.5, 3.0]))
+
+    def test_fused_mask(self) -> None:
+        """Verifies that the fused kernel saves the mask as the derivative."""
+        x = np.array([[-1.0, 2.0], [0.0, -3.0]])
+        out = np.empty_like(x)
+        derivative = np.empty_like(x)
+        ReLU().forward_and_derivative(x, out, derivative)
+        np.testing.assert_array_equal(np.array([[0.0, 2.0], [0.0, 0.0]]), out)
+        np.testing.assert_array_equal(np.array([[0.0, 1.0], [1.0, 0.0]]), derivative)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+"""Contains tests for sigmoid.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Sigmoid
+from emell.testutil import check_activation
+
+
+class SigmoidTest(unittest.TestCase):
+    """Contains tests for the Sigmoid activation."""
+
+    def test_sigmoid(self) -> None:
+        """Verifies the activation against the logistic function."""
+        x = np.linspace(-6, 6, 13)
+        np.testing.assert_allclose(1 / (1 + np.exp(-x)), Sigmoid()(x))
+        check_activation(Sigmoid(), x)
+
+    def test_extremes(self) -> None:
+        """Verifies that large inputs saturate without warnings."""
+        with np.errstate(all="raise"):
+            np.testing.assert_allclose(
+                np.array([0.0, 1.0]), Sigmoid()(np.array([-1000.0, 1000.0]))
+            )
+            np.testing.assert_allclose(
+                np.zeros(2), Sigmoid().prime(np.array([-1000.0, 1000.0]))
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
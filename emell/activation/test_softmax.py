@@ -0,0 +1,33 @@
+"""Contains tests for softmax.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Softmax
+
+
+class SoftmaxTest(unittest.TestCase):
+    """Contains tests for the Softmax activation."""
+
+    def test_softmax(self) -> None:
+        """Verifies that each row becomes probabilities."""
+        x = np.array([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+        expected = np.exp(x) / np.sum(np.exp(x), axis=1, keepdims=True)
+        np.testing.assert_allclose(expected, Softmax()(x))
+
+        out = x.copy()
+        self.assertIs(out, Softmax()(out, out=out))
+        np.testing.assert_allclose(expected, out)
+        np.testing.assert_array_equal(np.ones((2, 3)), Softmax().prime(x))
+
+    def test_extremes(self) -> None:
+        """Verifies that large inputs don't overflow."""
+        with np.errstate(over="raise", invalid="raise"):
+            np.testing.assert_allclose(
+                np.array([[0.0, 1.0]]), Softmax()(np.array([[-1000.0, 1000.0]]))
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
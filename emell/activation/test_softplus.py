@@ -0,0 +1,29 @@
+"""Contains tests for softplus.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Softplus
+from emell.testutil import check_activation
+
+
+class SoftplusTest(unittest.TestCase):
+    """Contains tests for the Softplus activation."""
+
+    def test_softplus(self) -> None:
+        """Verifies the activation against log(1 + exp(x))."""
+        x = np.linspace(-6, 6, 13)
+        np.testing.assert_allclose(np.log1p(np.exp(x)), Softplus()(x))
+        check_activation(Softplus(), x)
+
+    def test_extremes(self) -> None:
+        """Verifies that large inputs don't overflow."""
+        with np.errstate(over="raise", invalid="raise"):
+            np.testing.assert_allclose(
+                np.array([0.0, 1000.0]), Softplus()(np.array([-1000.0, 1000.0]))
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+"""Contains tests for tanh.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Tanh
+from emell.testutil import check_activation
+
+
+class TanhTest(unittest.TestCase):
+    """Contains tests for the Tanh activation."""
+
+    def test_tanh(self) -> None:
+        """Verifies the activation against numpy's tanh."""
+        x = np.linspace(-3, 3, 13)
+        np.testing.assert_allclose(np.tanh(x), Tanh()(x))
+        check_activation(Tanh(), x)
+
+
+if __name__ == "__main__":
+    unittest.main()
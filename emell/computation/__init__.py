@@ -1,17 +1,23 @@
 """Pure math functions used by the ML routines."""
 
-from emell.computation.constant import constant
-from emell.computation.identity import identity
-from emell.computation.l1_loss import l1_loss
-from emell.computation.l2_loss import l2_loss
-from emell.computation.quadratic_cost import quadratic_cost
-from emell.computation.quadratic_loss import delta_quadratic_loss, quadratic_loss
-from emell.computation.relu import relu, relu_prime
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.computation.constant import constant
+    from emell.computation.identity import identity, identity_prime
+    from emell.computation.l1_loss import l1_loss
+    from emell.computation.l2_loss import l2_loss
+    from emell.computation.quadratic_cost import quadratic_cost
+    from emell.computation.quadratic_loss import delta_quadratic_loss, quadratic_loss
+    from emell.computation.relu import relu, relu_prime
 
 __all__ = [
     "constant",
     "delta_quadratic_loss",
     "identity",
+    "identity_prime",
     "l1_loss",
     "l2_loss",
     "relu",
@@ -19,3 +25,19 @@ __all__ = [
     "quadratic_cost",
     "quadratic_loss",
 ]
+
+lazy_import(
+    __name__,
+    {
+        "constant": "constant",
+        "delta_quadratic_loss": "quadratic_loss",
+        "identity": "identity",
+        "identity_prime": "identity",
+        "l1_loss": "l1_loss",
+        "l2_loss": "l2_loss",
+        "relu": "relu",
+        "relu_prime": "relu",
+        "quadratic_cost": "quadratic_cost",
+        "quadratic_loss": "quadratic_loss",
+    },
+)
@@ -2,6 +2,8 @@
 
 from typing import TypeVar
 
+import numpy as np
+
 T = TypeVar("T")
 
 
@@ -16,3 +18,16 @@ def identity(x: T) -> T:
 
     """
     return x
+
+
+def identity_prime(x: np.ndarray) -> np.ndarray:
+    """
+    Compute the derivative of the identity function, which is always 1.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The input
+
+    """
+    return np.ones_like(x)
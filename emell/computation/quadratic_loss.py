@@ -7,18 +7,18 @@ import numpy as np
 
 def quadratic_loss(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     """
-    Calculate the vectorized quadratic loss for a single example.
+    Calculate the vectorized quadratic loss.
 
     Parameters
     ----------
     x : np.ndarray
-        A vector of the predicted values.
+        A vector of the predicted values, or a (batch, outputs) matrix of them.
     y : np.ndarray
         A vector of the expected values. Must match x's dimensions.
 
     """
-    if x.ndim != 1:
-        raise ValueError("Can only compute the quadratic cost for vectors")
+    if x.ndim not in (1, 2):
+        raise ValueError("Can only compute the quadratic cost for vectors or batches")
 
     if x.shape != y.shape:
         raise ValueError(
@@ -33,10 +33,11 @@ def delta_quadratic_loss(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     """
     Calculate the vectorization of the derivative of quadratic loss.
 
-    Partial derivative taken with respect to x.
+    Partial derivative taken with respect to x. Accepts the same vectors or
+    (batch, outputs) matrices as `quadratic_loss`.
     """
-    if x.ndim != 1:
-        raise ValueError("Can only compute the quadratic cost for vectors")
+    if x.ndim not in (1, 2):
+        raise ValueError("Can only compute the quadratic cost for vectors or batches")
 
     if x.shape != y.shape:
         raise ValueError(
@@ -18,8 +18,8 @@ def relu(x: np.ndarray) -> np.ndarray:
         The input
 
     """
-    result = x.copy()
-    result[result < 0] = 0
+    result = np.empty_like(x)
+    np.maximum(x, 0, out=result)
     return result
 
 
@@ -35,7 +35,6 @@ def relu_prime(x: np.ndarray) -> np.ndarray:
         The input
 
     """
-    result = x.copy()
-    result.fill(1)
-    result[x < 0] = 0
+    result = np.empty_like(x)
+    np.greater_equal(x, 0, out=result)
     return result
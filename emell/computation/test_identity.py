@@ -2,7 +2,9 @@
 
 import unittest
 
-from emell.computation import identity
+import numpy as np
+
+from emell.computation import identity, identity_prime
 
 
 class TestIdentity(unittest.TestCase):
@@ -14,6 +16,12 @@ class TestIdentity(unittest.TestCase):
         self.assertEqual(5, identity(5))
         self.assertEqual([3], identity([3]))
 
+    def test_identity_prime(self) -> None:
+        """Checks that the derivative is 1 everywhere, in the input's dtype."""
+        x = np.array([-2.0, 0.0, 3.5], np.float32)
+        np.testing.assert_array_equal(np.ones(3), identity_prime(x))
+        self.assertEqual(np.float32, identity_prime(x).dtype)
+
 
 if __name__ == "__main__":
     unittest.main()
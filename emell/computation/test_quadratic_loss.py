@@ -78,6 +78,13 @@ class TestQuadraticLoss(unittest.TestCase):
             ),
         )
 
+    def test_dtype(self) -> None:
+        """Test that float32 inputs are not promoted."""
+        x = np.array([[0, 1], [0.5, -1]], np.float32)
+        y = np.array([[1, 1], [0.25, 1]], np.float32)
+        self.assertEqual(np.float32, quadratic_loss(x, y).dtype)
+        self.assertEqual(np.float32, delta_quadratic_loss(x, y).dtype)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,12 @@ class TestRelu(unittest.TestCase):
             np.array([0, 1, 1, 1]), relu_prime(np.array([-1, 0, 0.5, 1])),
         )
 
+    def test_dtype(self) -> None:
+        """Tests that float32 inputs are not promoted."""
+        x = np.array([-1, 0, 0.5, 1], np.float32)
+        self.assertEqual(np.float32, relu(x).dtype)
+        self.assertEqual(np.float32, relu_prime(x).dtype)
+
 
 if __name__ == "__main__":
     unittest.main()
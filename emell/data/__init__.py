@@ -0,0 +1,31 @@
+"""Datasets that feed mini-batches of examples to training."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.data.array_dataset import ArrayDataset
+    from emell.data.dataset import Dataset
+    from emell.data.generator_dataset import GeneratorDataset
+    from emell.data.memmap_dataset import MemmapDataset
+    from emell.data.prefetcher import Prefetcher
+
+__all__ = [
+    "ArrayDataset",
+    "Dataset",
+    "GeneratorDataset",
+    "MemmapDataset",
+    "Prefetcher",
+]
+
+lazy_import(
+    __name__,
+    {
+        "ArrayDataset": "array_dataset",
+        "Dataset": "dataset",
+        "GeneratorDataset": "generator_dataset",
+        "MemmapDataset": "memmap_dataset",
+        "Prefetcher": "prefetcher",
+    },
+)
@@ -0,0 +1,86 @@
+"""Contains a dataset that serves mini-batches from in-memory arrays."""
+
+from typing import Iterator, Union
+
+import numpy as np
+
+from emell.data.dataset import Dataset
+
+
+class ArrayDataset(Dataset):
+    """
+    Serves mini-batches from a pair of arrays of examples.
+
+    Without shuffling, each batch is a view into the arrays. With shuffling,
+    each batch is gathered into new contiguous arrays.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        seed: Union[None, int, np.random.Generator] = None,
+    ):
+        """
+        Initialize the dataset.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The (examples, inputs) inputs.
+        y : np.ndarray
+            The (examples, outputs) expected outputs.
+        batch_size : int
+            The number of examples in each batch.
+        shuffle : bool
+            Whether to visit the examples in a new random order each epoch.
+        drop_last : bool
+            Whether to skip the last batch if it is smaller than batch_size.
+        seed : int or np.random.Generator, optional
+            Seeds the shuffling.
+
+        """
+        super().__init__()
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("The examples must be (examples, values) matrices")
+
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("The inputs and outputs must have the same length")
+
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least one")
+
+        self.x = np.ascontiguousarray(x)
+        self.y = np.ascontiguousarray(y)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.generator = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """Return the number of batches in each epoch."""
+        if self.drop_last:
+            return int(self.x.shape[0] // self.batch_size)
+
+        return int(-(-self.x.shape[0] // self.batch_size))
+
+    def __iter__(self) -> Iterator[Dataset.Batch]:
+        """Iterate over one epoch of mini-batches."""
+        order = self.generator.permutation(self.x.shape[0]) if self.shuffle else None
+        for batch in range(len(self)):
+            start = batch * self.batch_size
+            end = start + self.batch_size
+            if order is None:
+                yield Dataset.Batch(self.x[start:end], self.y[start:end])
+            else:
+                indices = self._batch_indices(order[start:end])
+                yield Dataset.Batch(
+                    np.take(self.x, indices, axis=0), np.take(self.y, indices, axis=0)
+                )
+
+    def _batch_indices(self, indices: np.ndarray) -> np.ndarray:
+        """Choose the order of the examples gathered into a shuffled batch."""
+        return indices
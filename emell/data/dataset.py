@@ -0,0 +1,34 @@
+"""Contains the abstract definition of a dataset."""
+
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+
+class Dataset:
+    """
+    A base representation of a dataset.
+
+    Iterating over a dataset yields one epoch of mini-batches. Each batch is a
+    pair of C-contiguous (batch, inputs) and (batch, outputs) matrices, ready to
+    be passed to `Backpropagation.train_batch`.
+
+    This is intended to be a protocol in Python 3.8.
+    """
+
+    def __iter__(self) -> Iterator["Dataset.Batch"]:
+        """
+        Iterate over one epoch of mini-batches.
+
+        Returns
+        -------
+        An iterator of batches.
+
+        """
+        raise NotImplementedError("The dataset protocol is not usable.")
+
+    class Batch(NamedTuple):
+        """Represents a mini-batch of training examples."""
+
+        x: np.ndarray
+        y: np.ndarray
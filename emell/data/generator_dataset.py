@@ -0,0 +1,88 @@
+"""Contains a dataset that batches examples from a generator."""
+
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from emell.data.dataset import Dataset
+
+Example = Tuple[np.ndarray, np.ndarray]
+
+
+class GeneratorDataset(Dataset):
+    """
+    Collects examples from a generator into contiguous mini-batches.
+
+    Examples can be shuffled through a fixed-size buffer. Once the buffer is
+    full, each new example replaces a randomly chosen one, which is emitted.
+    This mixes examples that are up to about the buffer's size apart, without
+    holding the whole dataset in memory.
+    """
+
+    def __init__(
+        self,
+        make_examples: Callable[[], Iterable[Example]],
+        batch_size: int,
+        examples_per_epoch: Optional[int] = None,
+        shuffle_buffer_size: int = 0,
+        seed: Union[None, int, np.random.Generator] = None,
+    ):
+        """
+        Initialize the dataset.
+
+        Parameters
+        ----------
+        make_examples : function() -> iterable
+            Called at the start of each epoch. Yields (input, output) pairs of
+            vectors.
+        batch_size : int
+            The number of examples in each batch. The last batch of an epoch
+            may be smaller.
+        examples_per_epoch : int, optional
+            Ends each epoch after this many examples. Required if make_examples
+            never stops.
+        shuffle_buffer_size : int
+            The number of examples to shuffle between. 0 disables shuffling.
+        seed : int or np.random.Generator, optional
+            Seeds the shuffling.
+
+        """
+        super().__init__()
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least one")
+
+        self.make_examples = make_examples
+        self.batch_size = batch_size
+        self.examples_per_epoch = examples_per_epoch
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.generator = np.random.default_rng(seed)
+
+    def __iter__(self) -> Iterator[Dataset.Batch]:
+        """Iterate over one epoch of mini-batches."""
+        examples = iter(self.make_examples())
+        if self.examples_per_epoch is not None:
+            examples = islice(examples, self.examples_per_epoch)
+
+        if self.shuffle_buffer_size > 0:
+            examples = self._shuffle(examples)
+
+        while True:
+            batch = list(islice(examples, self.batch_size))
+            if not batch:
+                return
+
+            yield Dataset.Batch(
+                np.stack([x for x, _ in batch]), np.stack([y for _, y in batch])
+            )
+
+    def _shuffle(self, examples: Iterator[Example]) -> Iterator[Example]:
+        """Shuffle the examples through a buffer."""
+        buffer: List[Example] = list(islice(examples, self.shuffle_buffer_size))
+        for example in examples:
+            index = int(self.generator.integers(len(buffer)))
+            yield buffer[index]
+            buffer[index] = example
+
+        for index in self.generator.permutation(len(buffer)):
+            yield buffer[index]
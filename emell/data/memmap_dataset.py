@@ -0,0 +1,61 @@
+"""Contains a dataset that serves mini-batches from memory-mapped .npy files."""
+
+from typing import Union
+
+import numpy as np
+
+from emell.data.array_dataset import ArrayDataset
+
+
+class MemmapDataset(ArrayDataset):  # pylint: disable=too-few-public-methods
+    """
+    Serves mini-batches from .npy files without loading them into memory.
+
+    The files are memory-mapped read-only, so only the pages that a batch
+    touches are read from disk. Without shuffling, each batch is a zero-copy
+    slice of the files. With shuffling, each batch gathers its examples in file
+    order so that the reads move forward through the file. The shuffled order
+    is an index per example, which is much smaller than the examples.
+
+    The files can be written incrementally with `np.lib.format.open_memmap`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        x_path: str,
+        y_path: str,
+        batch_size: int,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        seed: Union[None, int, np.random.Generator] = None,
+    ):
+        """
+        Initialize the dataset.
+
+        Parameters
+        ----------
+        x_path : str
+            The .npy file of (examples, inputs) inputs.
+        y_path : str
+            The .npy file of (examples, outputs) expected outputs.
+        batch_size : int
+            The number of examples in each batch.
+        shuffle : bool
+            Whether to visit the examples in a new random order each epoch.
+        drop_last : bool
+            Whether to skip the last batch if it is smaller than batch_size.
+        seed : int or np.random.Generator, optional
+            Seeds the shuffling.
+
+        """
+        x = np.load(x_path, mmap_mode="r")
+        y = np.load(y_path, mmap_mode="r")
+        if not (x.flags["C_CONTIGUOUS"] and y.flags["C_CONTIGUOUS"]):
+            # Making them contiguous would read the whole file into memory.
+            raise ValueError("The .npy files must be stored in C order")
+
+        super().__init__(x, y, batch_size, shuffle, drop_last, seed)
+
+    def _batch_indices(self, indices: np.ndarray) -> np.ndarray:
+        """Gather the examples of a shuffled batch in file order."""
+        return np.sort(indices)
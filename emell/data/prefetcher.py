@@ -0,0 +1,75 @@
+"""Contains a dataset wrapper that prepares batches on a background thread."""
+
+import queue
+import threading
+from typing import Iterator, Union
+
+from emell.data.dataset import Dataset
+
+
+class Prefetcher(Dataset):
+    """
+    Prepares the next batches of a dataset on a background thread.
+
+    While training runs on one batch, the following batches are read, shuffled
+    and stacked. NumPy releases the GIL for most of that work, as it does for
+    the matrix products in training, so the two overlap.
+    """
+
+    def __init__(self, dataset: Dataset, depth: int = 2):
+        """
+        Initialize the prefetcher.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to prefetch from.
+        depth : int
+            The number of batches to prepare ahead of the training loop.
+
+        """
+        super().__init__()
+        if depth < 1:
+            raise ValueError("The prefetch depth must be at least one")
+
+        self.dataset = dataset
+        self.depth = depth
+
+    def __iter__(self) -> Iterator[Dataset.Batch]:
+        """Iterate over one epoch of mini-batches."""
+        batches: "queue.Queue[Union[Dataset.Batch, Exception, None]]"
+        batches = queue.Queue(self.depth)
+        stop = threading.Event()
+
+        def put(item: Union[Dataset.Batch, Exception, None]) -> bool:
+            # Waits for room in the queue, unless the consumer has left.
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in self.dataset:
+                    if not put(batch):
+                        return
+                put(None)
+            except Exception as error:  # pylint: disable=broad-except
+                put(error)
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
@@ -0,0 +1,64 @@
+"""Contains tests for array_dataset.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.data import ArrayDataset
+
+
+class ArrayDatasetTest(unittest.TestCase):
+    """Contains tests for the ArrayDataset class."""
+
+    def test_batches(self) -> None:
+        """Verifies that unshuffled batches are views in order."""
+        x = np.arange(10).reshape((5, 2))
+        y = np.arange(5).reshape((5, 1))
+        dataset = ArrayDataset(x, y, batch_size=2)
+
+        batches = list(dataset)
+        self.assertEqual(3, len(dataset))
+        self.assertEqual(3, len(batches))
+        np.testing.assert_array_equal(np.array([[0, 1], [2, 3]]), batches[0].x)
+        np.testing.assert_array_equal(np.array([[4]]), batches[2].y)
+        self.assertTrue(np.shares_memory(x, batches[1].x))
+
+    def test_drop_last(self) -> None:
+        """Verifies that a short last batch can be skipped."""
+        dataset = ArrayDataset(
+            np.zeros((5, 2)), np.zeros((5, 1)), batch_size=2, drop_last=True
+        )
+        self.assertEqual(2, len(dataset))
+        self.assertEqual([2, 2], [batch.x.shape[0] for batch in dataset])
+
+    def test_shuffle(self) -> None:
+        """Verifies that shuffled batches keep examples paired and contiguous."""
+        x = np.arange(20).reshape((10, 2))
+        y = np.arange(10).reshape((10, 1))
+        dataset = ArrayDataset(x, y, batch_size=4, shuffle=True, seed=0)
+
+        first = list(dataset)
+        second = list(dataset)
+        for batch in first:
+            self.assertTrue(batch.x.flags["C_CONTIGUOUS"])
+            np.testing.assert_array_equal(batch.x[:, 0], 2 * batch.y[:, 0])
+
+        first_order = np.concatenate([batch.y[:, 0] for batch in first])
+        second_order = np.concatenate([batch.y[:, 0] for batch in second])
+        np.testing.assert_array_equal(np.arange(10), np.sort(first_order))
+        self.assertFalse(np.array_equal(first_order, second_order))
+
+    def test_errors(self) -> None:
+        """Verifies that mismatched arrays are rejected."""
+        with self.assertRaises(ValueError):
+            ArrayDataset(np.zeros((5, 2)), np.zeros((4, 1)), batch_size=2)
+
+        with self.assertRaises(ValueError):
+            ArrayDataset(np.zeros(5), np.zeros(5), batch_size=2)
+
+        with self.assertRaises(ValueError):
+            ArrayDataset(np.zeros((5, 2)), np.zeros((5, 1)), batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+"""Contains tests for dataset.py."""
+
+import unittest
+
+from emell.data import Dataset
+
+
+class DatasetTest(unittest.TestCase):
+    """Contains tests for the Dataset base class."""
+
+    def test_iter(self) -> None:
+        """Verifies that the protocol cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            iter(Dataset())
+
+
+if __name__ == "__main__":
+    unittest.main()
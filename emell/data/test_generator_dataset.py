@@ -0,0 +1,58 @@
+"""Contains tests for generator_dataset.py."""
+
+import unittest
+from itertools import count
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from emell.data import GeneratorDataset
+
+
+def make_examples() -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield an endless sequence of examples whose output is their index."""
+    for index in count():
+        yield np.array([index, -index]), np.array([index])
+
+
+class GeneratorDatasetTest(unittest.TestCase):
+    """Contains tests for the GeneratorDataset class."""
+
+    def test_batches(self) -> None:
+        """Verifies that examples are stacked into batches."""
+        dataset = GeneratorDataset(make_examples, batch_size=3, examples_per_epoch=7)
+        batches = list(dataset)
+        self.assertEqual([3, 3, 1], [batch.x.shape[0] for batch in batches])
+        np.testing.assert_array_equal(
+            np.array([[0, 0], [1, -1], [2, -2]]), batches[0].x
+        )
+        np.testing.assert_array_equal(np.array([[6]]), batches[2].y)
+        self.assertTrue(batches[1].x.flags["C_CONTIGUOUS"])
+
+        # Each epoch starts a new generator.
+        np.testing.assert_array_equal(batches[0].y, next(iter(dataset)).y)
+
+    def test_finite_generator(self) -> None:
+        """Verifies that an epoch ends with the generator."""
+        dataset = GeneratorDataset(lambda: [(np.ones(2), np.ones(1))] * 5, batch_size=2)
+        self.assertEqual([2, 2, 1], [batch.x.shape[0] for batch in dataset])
+
+    def test_shuffle(self) -> None:
+        """Verifies that the shuffle buffer reorders every example once."""
+        dataset = GeneratorDataset(
+            make_examples,
+            batch_size=10,
+            examples_per_epoch=100,
+            shuffle_buffer_size=20,
+            seed=0,
+        )
+        order = np.concatenate([batch.y[:, 0] for batch in dataset])
+        np.testing.assert_array_equal(np.arange(100), np.sort(order))
+        self.assertFalse(np.array_equal(np.arange(100), order))
+
+        for batch in dataset:
+            np.testing.assert_array_equal(batch.x[:, 0], batch.y[:, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
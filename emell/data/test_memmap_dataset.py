@@ -0,0 +1,58 @@
+"""Contains tests for memmap_dataset.py."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from emell.data import MemmapDataset
+
+
+class MemmapDatasetTest(unittest.TestCase):
+    """Contains tests for the MemmapDataset class."""
+
+    def setUp(self) -> None:
+        """Write a small dataset to disk."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.x_path = os.path.join(self.directory.name, "x.npy")
+        self.y_path = os.path.join(self.directory.name, "y.npy")
+        np.save(self.x_path, np.arange(20, dtype=np.float32).reshape((10, 2)))
+        np.save(self.y_path, np.arange(10, dtype=np.float32).reshape((10, 1)))
+
+    def tearDown(self) -> None:
+        """Delete the dataset."""
+        self.directory.cleanup()
+
+    def test_batches(self) -> None:
+        """Verifies that unshuffled batches are slices of the mapped files."""
+        dataset = MemmapDataset(self.x_path, self.y_path, batch_size=4)
+        batches = list(dataset)
+        self.assertEqual([4, 4, 2], [batch.x.shape[0] for batch in batches])
+        np.testing.assert_array_equal(np.array([[8, 9], [10, 11]]), batches[1].x[:2])
+        for batch in batches:
+            self.assertTrue(np.shares_memory(dataset.x, batch.x))
+            self.assertTrue(np.shares_memory(dataset.y, batch.y))
+            self.assertFalse(batch.x.flags["WRITEABLE"])
+
+    def test_shuffle(self) -> None:
+        """Verifies that shuffled batches are gathered in file order."""
+        dataset = MemmapDataset(
+            self.x_path, self.y_path, batch_size=4, shuffle=True, seed=0
+        )
+        batches = list(dataset)
+        order = np.concatenate([batch.y[:, 0] for batch in batches])
+        np.testing.assert_array_equal(np.arange(10), np.sort(order))
+        for batch in batches:
+            np.testing.assert_array_equal(np.sort(batch.y[:, 0]), batch.y[:, 0])
+            np.testing.assert_array_equal(batch.x[:, 0], 2 * batch.y[:, 0])
+
+    def test_fortran_order(self) -> None:
+        """Verifies that files that would need to be copied are rejected."""
+        np.save(self.x_path, np.asfortranarray(np.ones((10, 2))))
+        with self.assertRaises(ValueError):
+            MemmapDataset(self.x_path, self.y_path, batch_size=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Contains tests for prefetcher.py."""
+
+import threading
+import unittest
+from typing import Iterator
+
+import numpy as np
+
+from emell.data import ArrayDataset, Dataset, Prefetcher
+
+
+class FailingDataset(Dataset):
+    """A dataset that fails after its first batch."""
+
+    def __iter__(self) -> Iterator[Dataset.Batch]:
+        """Yield one batch, then raise."""
+        yield Dataset.Batch(np.zeros((1, 1)), np.zeros((1, 1)))
+        raise RuntimeError("Could not read the next batch")
+
+
+class PrefetcherTest(unittest.TestCase):
+    """Contains tests for the Prefetcher class."""
+
+    def test_batches(self) -> None:
+        """Verifies that the batches of the dataset are yielded in order."""
+        dataset = ArrayDataset(
+            np.arange(20).reshape((10, 2)), np.arange(10).reshape((10, 1)), 3
+        )
+        prefetched = list(Prefetcher(dataset, depth=2))
+        expected = list(dataset)
+        self.assertEqual(len(expected), len(prefetched))
+        for actual, batch in zip(prefetched, expected):
+            np.testing.assert_array_equal(batch.x, actual.x)
+            np.testing.assert_array_equal(batch.y, actual.y)
+
+    def test_error(self) -> None:
+        """Verifies that errors in the background thread are raised."""
+        batches = iter(Prefetcher(FailingDataset()))
+        next(batches)
+        with self.assertRaises(RuntimeError):
+            next(batches)
+
+    def test_early_exit(self) -> None:
+        """Verifies that the background thread stops if iteration stops."""
+        threads = threading.active_count()
+        dataset = ArrayDataset(np.zeros((100, 1)), np.zeros((100, 1)), 1)
+        for _ in Prefetcher(dataset, depth=1):
+            break
+        self.assertEqual(threads, threading.active_count())
+
+
+if __name__ == "__main__":
+    unittest.main()
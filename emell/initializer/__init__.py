@@ -0,0 +1,34 @@
+"""Initializers that fill in the starting weights of a layer."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.initializer.function_initializer import FunctionInitializer
+    from emell.initializer.he import He
+    from emell.initializer.initializer import Initializer
+    from emell.initializer.normal import Normal
+    from emell.initializer.uniform import Uniform
+    from emell.initializer.xavier import Xavier
+
+__all__ = [
+    "FunctionInitializer",
+    "He",
+    "Initializer",
+    "Normal",
+    "Uniform",
+    "Xavier",
+]
+
+lazy_import(
+    __name__,
+    {
+        "FunctionInitializer": "function_initializer",
+        "He": "he",
+        "Initializer": "initializer",
+        "Normal": "normal",
+        "Uniform": "uniform",
+        "Xavier": "xavier",
+    },
+)
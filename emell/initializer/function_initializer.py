@@ -0,0 +1,54 @@
+"""Contains an initializer that calls a function for each weight."""
+
+from typing import Callable, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer.initializer import Initializer
+
+
+class FunctionInitializer(Initializer):
+    """
+    Fills a weight matrix by calling a function once per weight.
+
+    This is slow for large layers, but it lets tests inject exact weights with
+    `emell.testutil.make_random_function`. Weights are filled one neuron at a
+    time.
+    """
+
+    def __init__(self, random_function: Callable[[], float], scale: float = 0.01):
+        """
+        Initialize the initializer.
+
+        Parameters
+        ----------
+        random_function : function() -> float
+            Called to produce each weight.
+        scale : float
+            Every weight is multiplied by this.
+
+        """
+        super().__init__()
+        self.random_function = random_function
+        self.scale = scale
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        """
+        return np.array(
+            [
+                [self.scale * self.random_function() for _ in range(shape[1])]
+                for _ in range(shape[0])
+            ],
+            dtype=dtype,
+        ).reshape(shape)
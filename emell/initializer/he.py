@@ -0,0 +1,58 @@
+"""Contains the He initializer."""
+
+import math
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer.initializer import Initializer, Seed
+from emell.initializer.normal import Normal
+from emell.initializer.uniform import Uniform
+
+
+class He(Initializer):
+    """
+    Scales random weights by the fan-in of the layer.
+
+    Accounts for ReLU zeroing half of its inputs, so it suits ReLU layers.
+
+    https://arxiv.org/abs/1502.01852
+    """
+
+    def __init__(self, uniform: bool = False, seed: Seed = None):
+        """
+        Initialize the initializer.
+
+        Parameters
+        ----------
+        uniform : bool
+            Whether to draw from a uniform distribution. Otherwise, the weights
+            are drawn from a normal distribution with the same variance.
+        seed : int or np.random.Generator, optional
+            Seeds the random numbers, or provides the generator to draw from.
+
+        """
+        super().__init__()
+        self.uniform = uniform
+        self.generator = np.random.default_rng(seed)
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        """
+        fan_in = shape[1]
+        if self.uniform:
+            limit = math.sqrt(6 / fan_in)
+            return Uniform(-limit, limit, self.generator).initialize(shape, dtype)
+
+        standard_deviation = math.sqrt(2 / fan_in)
+        return Normal(0, standard_deviation, self.generator).initialize(shape, dtype)
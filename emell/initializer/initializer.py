@@ -0,0 +1,41 @@
+"""Contains the abstract definition of a weight initializer."""
+
+from typing import Tuple, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+# Anything that np.random.default_rng() accepts: None for fresh entropy, an int
+# seed, or an existing generator to share.
+Seed = Union[None, int, np.random.Generator]
+
+
+class Initializer:
+    """
+    A base representation of a weight initializer.
+
+    An initializer fills a whole weight matrix in one call, rather than asking
+    for one random number per weight.
+
+    This is intended to be a protocol in Python 3.8.
+    """
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix. The number of inputs is
+            the fan-in of each neuron, and the number of neurons is the fan-out
+            of each input.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        Returns
+        -------
+        The weight matrix.
+
+        """
+        raise NotImplementedError("The initializer protocol is not usable.")
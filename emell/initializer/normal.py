@@ -0,0 +1,51 @@
+"""Contains an initializer that draws from a normal distribution."""
+
+from typing import Any, Tuple, cast
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer.initializer import Initializer, Seed
+
+
+class Normal(Initializer):
+    """Draws each weight from a normal distribution."""
+
+    def __init__(
+        self, mean: float = 0.0, standard_deviation: float = 0.01, seed: Seed = None
+    ):
+        """
+        Initialize the initializer.
+
+        Parameters
+        ----------
+        mean : float
+            The mean of the weights.
+        standard_deviation : float
+            The standard deviation of the weights.
+        seed : int or np.random.Generator, optional
+            Seeds the random numbers, or provides the generator to draw from.
+
+        """
+        super().__init__()
+        self.mean = mean
+        self.standard_deviation = standard_deviation
+        self.generator = np.random.default_rng(seed)
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        """
+        # The generator draws float32 weights directly, without a float64 pass.
+        weights = self.generator.standard_normal(shape, cast(Any, dtype))
+        weights *= self.standard_deviation
+        weights += self.mean
+        return weights
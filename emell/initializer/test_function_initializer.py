@@ -0,0 +1,30 @@
+"""Contains tests for function_initializer.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.initializer import FunctionInitializer
+from emell.testutil import make_random_function
+
+
+class FunctionInitializerTest(unittest.TestCase):
+    """Contains tests for the FunctionInitializer class."""
+
+    def test_initialize(self) -> None:
+        """Verifies that weights are filled one neuron at a time."""
+        initializer = FunctionInitializer(
+            make_random_function([1, 2, 3, 4, 5, 6]), scale=0.5
+        )
+        weights = initializer.initialize((2, 3), np.float32)
+        np.testing.assert_array_equal(np.array([[0.5, 1, 1.5], [2, 2.5, 3]]), weights)
+        self.assertEqual(np.float32, weights.dtype)
+
+    def test_initialize_empty(self) -> None:
+        """Verifies the shape of a layer without inputs."""
+        initializer = FunctionInitializer(make_random_function([]))
+        self.assertEqual((2, 0), initializer.initialize((2, 0), np.float64).shape)
+
+
+if __name__ == "__main__":
+    unittest.main()
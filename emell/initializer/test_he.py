@@ -0,0 +1,31 @@
+"""Contains tests for he.py."""
+
+import math
+import unittest
+
+import numpy as np
+
+from emell.initializer import He
+
+
+class HeTest(unittest.TestCase):
+    """Contains tests for the He initializer."""
+
+    def test_normal(self) -> None:
+        """Verifies that the variance of the weights depends on the fan-in."""
+        weights = He(seed=0).initialize((300, 50), np.float32)
+        self.assertEqual(np.float32, weights.dtype)
+        self.assertAlmostEqual(math.sqrt(2 / 50), float(weights.std()), delta=0.01)
+        self.assertAlmostEqual(0, float(weights.mean()), delta=0.01)
+
+    def test_uniform(self) -> None:
+        """Verifies that uniform weights are bounded by the fan-in."""
+        weights = He(uniform=True, seed=0).initialize((300, 50), np.float64)
+        limit = math.sqrt(6 / 50)
+        self.assertGreaterEqual(weights.min(), -limit)
+        self.assertLess(weights.max(), limit)
+        self.assertAlmostEqual(math.sqrt(2 / 50), float(weights.std()), delta=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+"""Contains tests for initializer.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.initializer import Initializer
+
+
+class InitializerTest(unittest.TestCase):
+    """Contains tests for the Initializer base class."""
+
+    def test_initialize(self) -> None:
+        """Verifies that the protocol cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            Initializer().initialize((2, 2), np.float64)
+
+
+if __name__ == "__main__":
+    unittest.main()
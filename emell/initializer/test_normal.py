@@ -0,0 +1,31 @@
+"""Contains tests for normal.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.initializer import Normal
+
+
+class NormalTest(unittest.TestCase):
+    """Contains tests for the Normal initializer."""
+
+    def test_initialize(self) -> None:
+        """Verifies the moments, shape and dtype of the weights."""
+        for dtype in (np.float32, np.float64):
+            weights = Normal(1, 2, seed=0).initialize((200, 100), dtype)
+            self.assertEqual((200, 100), weights.shape)
+            self.assertEqual(dtype, weights.dtype)
+            self.assertAlmostEqual(1, float(weights.mean()), delta=0.05)
+            self.assertAlmostEqual(2, float(weights.std()), delta=0.05)
+
+    def test_seed(self) -> None:
+        """Verifies that seeded initializers are reproducible."""
+        np.testing.assert_array_equal(
+            Normal(seed=1).initialize((3, 4), np.float64),
+            Normal(seed=1).initialize((3, 4), np.float64),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Contains tests for uniform.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.initializer import Uniform
+
+
+class UniformTest(unittest.TestCase):
+    """Contains tests for the Uniform initializer."""
+
+    def test_initialize(self) -> None:
+        """Verifies the range, shape and dtype of the weights."""
+        for dtype in (np.float32, np.float64):
+            weights = Uniform(-2, 3, seed=0).initialize((100, 50), dtype)
+            self.assertEqual((100, 50), weights.shape)
+            self.assertEqual(dtype, weights.dtype)
+            self.assertGreaterEqual(weights.min(), -2)
+            self.assertLess(weights.max(), 3)
+            self.assertAlmostEqual(0.5, float(weights.mean()), delta=0.1)
+
+    def test_seed(self) -> None:
+        """Verifies that seeded initializers are reproducible."""
+        np.testing.assert_array_equal(
+            Uniform(seed=1).initialize((3, 4), np.float64),
+            Uniform(seed=1).initialize((3, 4), np.float64),
+        )
+
+        # A shared generator gives different weights to each layer.
+        generator = np.random.default_rng(1)
+        first = Uniform(seed=generator).initialize((3, 4), np.float64)
+        second = Uniform(seed=generator).initialize((3, 4), np.float64)
+        self.assertFalse(np.array_equal(first, second))
+
+
+if __name__ == "__main__":
+    unittest.main()
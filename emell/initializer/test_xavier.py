@@ -0,0 +1,31 @@
+"""Contains tests for xavier.py."""
+
+import math
+import unittest
+
+import numpy as np
+
+from emell.initializer import Xavier
+
+
+class XavierTest(unittest.TestCase):
+    """Contains tests for the Xavier initializer."""
+
+    def test_uniform(self) -> None:
+        """Verifies that uniform weights are bounded by the fan-in and fan-out."""
+        weights = Xavier(seed=0).initialize((300, 100), np.float32)
+        limit = math.sqrt(6 / 400)
+        self.assertEqual(np.float32, weights.dtype)
+        self.assertGreaterEqual(weights.min(), -limit)
+        self.assertLess(weights.max(), limit)
+        self.assertAlmostEqual(limit / math.sqrt(3), float(weights.std()), delta=0.01)
+
+    def test_normal(self) -> None:
+        """Verifies the variance of normal weights."""
+        weights = Xavier(uniform=False, seed=0).initialize((300, 100), np.float64)
+        self.assertAlmostEqual(math.sqrt(2 / 400), float(weights.std()), delta=0.01)
+        self.assertAlmostEqual(0, float(weights.mean()), delta=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
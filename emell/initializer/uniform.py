@@ -0,0 +1,49 @@
+"""Contains an initializer that draws from a uniform distribution."""
+
+from typing import Any, Tuple, cast
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer.initializer import Initializer, Seed
+
+
+class Uniform(Initializer):
+    """Draws each weight uniformly from [low, high)."""
+
+    def __init__(self, low: float = 0.0, high: float = 0.01, seed: Seed = None):
+        """
+        Initialize the initializer.
+
+        Parameters
+        ----------
+        low : float
+            The smallest possible weight.
+        high : float
+            The upper bound of the weights.
+        seed : int or np.random.Generator, optional
+            Seeds the random numbers, or provides the generator to draw from.
+
+        """
+        super().__init__()
+        self.low = low
+        self.high = high
+        self.generator = np.random.default_rng(seed)
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        """
+        # The generator draws float32 weights directly, without a float64 pass.
+        weights = self.generator.random(shape, cast(Any, dtype))
+        weights *= self.high - self.low
+        weights += self.low
+        return weights
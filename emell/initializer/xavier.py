@@ -0,0 +1,59 @@
+"""Contains the Xavier (Glorot) initializer."""
+
+import math
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer.initializer import Initializer, Seed
+from emell.initializer.normal import Normal
+from emell.initializer.uniform import Uniform
+
+
+class Xavier(Initializer):
+    """
+    Scales random weights by the fan-in and fan-out of the layer.
+
+    Keeps the variance of the activations and gradients roughly the same from
+    layer to layer, which suits symmetric activations like tanh and sigmoid.
+
+    http://proceedings.mlr.press/v9/glorot10a/glorot10a.pdf
+    """
+
+    def __init__(self, uniform: bool = True, seed: Seed = None):
+        """
+        Initialize the initializer.
+
+        Parameters
+        ----------
+        uniform : bool
+            Whether to draw from a uniform distribution. Otherwise, the weights
+            are drawn from a normal distribution with the same variance.
+        seed : int or np.random.Generator, optional
+            Seeds the random numbers, or provides the generator to draw from.
+
+        """
+        super().__init__()
+        self.uniform = uniform
+        self.generator = np.random.default_rng(seed)
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """
+        Create a weight matrix.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (neurons, inputs) shape of the matrix.
+        dtype : np.dtype
+            The floating point type of the matrix.
+
+        """
+        fan_out, fan_in = shape
+        if self.uniform:
+            limit = math.sqrt(6 / (fan_in + fan_out))
+            return Uniform(-limit, limit, self.generator).initialize(shape, dtype)
+
+        standard_deviation = math.sqrt(2 / (fan_in + fan_out))
+        return Normal(0, standard_deviation, self.generator).initialize(shape, dtype)
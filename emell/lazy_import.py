@@ -0,0 +1,79 @@
+"""Contains the lazy loading of the names that a package exports."""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Dict, FrozenSet, List, Sequence
+
+
+def lazy_import(
+    package: str, exports: Dict[str, str], subpackages: Sequence[str] = ()
+) -> None:
+    """
+    Make a package import the modules of its exports on first use.
+
+    Call this from the package's `__init__`. Accessing an export, including
+    through `from package import name`, then imports its module and caches the
+    value in the package, so later accesses are plain attribute lookups. The
+    package should still import every export under `if TYPE_CHECKING:`, so
+    that type checkers see them.
+
+    Parameters
+    ----------
+    package : str
+        The `__name__` of the package.
+    exports : dict of str to str
+        Maps each exported name to the module that defines it, relative to
+        the package.
+    subpackages : sequence of str
+        Subpackages to import when they are first accessed as attributes.
+
+    """
+    module = sys.modules[package]
+    module.__class__ = _LazyModule
+    module.__dict__["_lazy_exports"] = exports
+    module.__dict__["_lazy_subpackages"] = frozenset(subpackages)
+
+
+class _LazyModule(ModuleType):
+    """A package that imports the modules of its exports on first use."""
+
+    _lazy_exports: Dict[str, str]
+    _lazy_subpackages: FrozenSet[str]
+
+    def __getattr__(self, name: str) -> Any:
+        """Import the module of an export, and cache the export."""
+        if name in self._lazy_subpackages:
+            return importlib.import_module(f"{self.__name__}.{name}")
+
+        if name not in self._lazy_exports:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        submodule = importlib.import_module(
+            f"{self.__name__}.{self._lazy_exports[name]}"
+        )
+        value = getattr(submodule, name)
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, keeping exports that share a name with their module.
+
+        Importing a submodule sets it as an attribute of the package. When an
+        export has the same name as its module, like `save` from the `save`
+        module, the export is kept instead.
+        """
+        if (
+            isinstance(value, ModuleType)
+            and self._lazy_exports.get(name) == name
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        """List the attributes of the package, including unloaded exports."""
+        return sorted(
+            set(self.__dict__) | set(self._lazy_exports) | self._lazy_subpackages
+        )
@@ -0,0 +1,34 @@
+"""Loss functions that compute their value and gradient in one pass."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.loss.huber_loss import HuberLoss
+    from emell.loss.l1_loss import L1Loss
+    from emell.loss.l2_loss import L2Loss
+    from emell.loss.loss import Loss
+    from emell.loss.quadratic_loss import QuadraticLoss
+    from emell.loss.softmax_cross_entropy_loss import SoftmaxCrossEntropyLoss
+
+__all__ = [
+    "HuberLoss",
+    "L1Loss",
+    "L2Loss",
+    "Loss",
+    "QuadraticLoss",
+    "SoftmaxCrossEntropyLoss",
+]
+
+lazy_import(
+    __name__,
+    {
+        "HuberLoss": "huber_loss",
+        "L1Loss": "l1_loss",
+        "L2Loss": "l2_loss",
+        "Loss": "loss",
+        "QuadraticLoss": "quadratic_loss",
+        "SoftmaxCrossEntropyLoss": "softmax_cross_entropy_loss",
+    },
+)
@@ -0,0 +1,62 @@
+"""Contains the Huber loss."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.loss.loss import Loss
+
+
+class HuberLoss(Loss):
+    """
+    Quadratic for small errors and linear for large ones.
+
+    Behaves like the quadratic loss near the answer, but outliers pull on the
+    gradient no harder than `delta`.
+    """
+
+    def __init__(self, delta: float = 1.0, reduction: str = "mean"):
+        """
+        Initialize the loss.
+
+        Parameters
+        ----------
+        delta : float
+            The size of error where the loss turns from quadratic to linear.
+        reduction : str
+            "mean", "sum" or "none".
+
+        """
+        super().__init__(reduction)
+        if delta <= 0:
+            raise ValueError("The delta must be positive")
+
+        self.delta = delta
+        self._residuals: Optional[np.ndarray] = None
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """
+        Compute the loss and gradient of every value.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values.
+        y : np.ndarray
+            The expected values, of the same shape.
+        values : np.ndarray
+            The buffer to write the loss of each value into.
+        gradients : np.ndarray
+            The buffer to write the gradient of each value into.
+
+        """
+        # With the error r clipped to c, the loss is c * (r - c / 2), and the
+        # gradient is c.
+        self._residuals = self._scratch(self._residuals, x)
+        residuals = np.subtract(x, y, out=self._residuals)
+        np.clip(residuals, -self.delta, self.delta, out=gradients)
+        np.multiply(gradients, 0.5, out=values)
+        np.subtract(residuals, values, out=values)
+        values *= gradients
@@ -0,0 +1,37 @@
+"""Contains the L1 loss."""
+
+import numpy as np
+
+from emell.loss.loss import Loss
+
+
+class L1Loss(Loss):
+    """
+    The absolute value of the error.
+
+    The gradient is taken to be 0 where the error is exactly 0.
+
+    https://www.bitlog.com/knowledge-base/machine-learning/loss-function/#l1-error
+    """
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """
+        Compute the loss and gradient of every value.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values.
+        y : np.ndarray
+            The expected values, of the same shape.
+        values : np.ndarray
+            The buffer to write the loss of each value into.
+        gradients : np.ndarray
+            The buffer to write the gradient of each value into.
+
+        """
+        np.subtract(x, y, out=gradients)
+        np.abs(gradients, out=values)
+        np.sign(gradients, out=gradients)
@@ -0,0 +1,148 @@
+"""Contains the abstract definition of a loss function."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+REDUCTIONS = ("mean", "sum", "none")
+
+
+class Loss:
+    """
+    A base representation of a loss function.
+
+    A loss compares (batch, outputs) predictions to the expected values, and
+    computes the loss and its gradient with respect to the predictions in one
+    pass. The loss of each output is then reduced over the batch:
+
+    - "mean" averages it, and scales the gradient to match.
+    - "sum" adds it up.
+    - "none" keeps the loss of every example.
+
+    Buffers for the results can be passed in with `out` and `grad_out`. The
+    unreduced loss is computed into a scratch buffer that is kept between
+    calls, so an instance should not be shared between threads.
+
+    This is intended to be a protocol in Python 3.8.
+    """
+
+    # Whether the loss compares the weighted outputs of the final layer, rather
+    # than its activations, to the expected values.
+    takes_logits = False
+
+    def __init__(self, reduction: str = "mean"):
+        """
+        Initialize the loss.
+
+        Parameters
+        ----------
+        reduction : str
+            "mean", "sum" or "none".
+
+        """
+        super().__init__()
+        if reduction not in REDUCTIONS:
+            raise ValueError(f"The reduction must be one of {', '.join(REDUCTIONS)}")
+
+        self.reduction = reduction
+        self._values: Optional[np.ndarray] = None
+        self._gradients: Optional[np.ndarray] = None
+
+    def __call__(
+        self, x: np.ndarray, y: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compute the reduced loss.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values, as a (batch, outputs) matrix.
+        y : np.ndarray
+            The expected values. Must match the shape of x.
+        out : np.ndarray, optional
+            The buffer to write the loss into.
+
+        """
+        self._gradients = self._scratch(self._gradients, x)
+        return self.value_and_grad(x, y, out, self._gradients)[0]
+
+    def value_and_grad(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        grad_out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the reduced loss and its gradient with respect to x.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values, as a (batch, outputs) matrix.
+        y : np.ndarray
+            The expected values. Must match the shape of x.
+        out : np.ndarray, optional
+            The buffer to write the loss into. Shaped like x without a
+            reduction, and like one row of x otherwise.
+        grad_out : np.ndarray, optional
+            The buffer to write the gradient into. Shaped like x.
+
+        Returns
+        -------
+        The loss and the gradient, in `out` and `grad_out` if they were given.
+
+        """
+        if x.ndim not in (1, 2):
+            raise ValueError("Can only compute the loss of vectors or batches")
+
+        if x.shape != y.shape:
+            raise ValueError("The predicted and expected values must match")
+
+        if grad_out is None:
+            grad_out = np.empty_like(x)
+
+        if self.reduction == "none":
+            if out is None:
+                out = np.empty_like(x)
+            self.compute(x, y, out, grad_out)
+            return out, grad_out
+
+        self._values = self._scratch(self._values, x)
+        self.compute(x, y, self._values, grad_out)
+        if out is None:
+            out = np.empty(x.shape[1:], x.dtype)
+        np.sum(self._values, axis=0, out=out)
+
+        if self.reduction == "mean":
+            out /= x.shape[0]
+            grad_out /= x.shape[0]
+        return out, grad_out
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """
+        Compute the loss and gradient of every value, without reducing them.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values.
+        y : np.ndarray
+            The expected values, of the same shape.
+        values : np.ndarray
+            The buffer to write the loss of each value into.
+        gradients : np.ndarray
+            The buffer to write the gradient of each value into.
+
+        """
+        raise NotImplementedError("The loss protocol is not usable.")
+
+    @staticmethod
+    def _scratch(buffer: Optional[np.ndarray], x: np.ndarray) -> np.ndarray:
+        """Return the buffer if it matches x, or allocate one that does."""
+        if buffer is None or buffer.shape != x.shape or buffer.dtype != x.dtype:
+            return np.empty_like(x)
+        return buffer
@@ -0,0 +1,35 @@
+"""Contains the quadratic loss."""
+
+import numpy as np
+
+from emell.loss.loss import Loss
+
+
+class QuadraticLoss(Loss):
+    """
+    Half the square of the error, so that the gradient is the error itself.
+
+    https://www.bitlog.com/knowledge-base/machine-learning/cost-function/#quadratic-cost
+    """
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """
+        Compute the loss and gradient of every value.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The predicted values.
+        y : np.ndarray
+            The expected values, of the same shape.
+        values : np.ndarray
+            The buffer to write the loss of each value into.
+        gradients : np.ndarray
+            The buffer to write the gradient of each value into.
+
+        """
+        np.subtract(x, y, out=gradients)
+        np.square(gradients, out=values)
+        values *= 0.5
@@ -0,0 +1,77 @@
+"""Contains the softmax cross-entropy loss."""
+
+from typing import Optional
+
+import numpy as np
+
+from emell.loss.loss import Loss
+
+
+class SoftmaxCrossEntropyLoss(Loss):
+    """
+    The cross-entropy of the softmax of the predictions, for classifiers.
+
+    Takes logits, which are the weighted outputs of the final layer before any
+    softmax, and expected probabilities, usually one-hot rows. Both are
+    computed from one log-sum-exp pass, which can't overflow:
+
+    - log p = x - max(x) - log(sum(exp(x - max(x))))
+    - The loss of each value is -y * log p. The rows sum to the cross-entropy
+      of each example.
+    - The gradient with respect to the logits is p - y, as long as each row of
+      y sums to 1.
+
+    Backpropagation hands this loss the weighted outputs of the final layer,
+    which should use the Softmax or Identity activation.
+    """
+
+    takes_logits = True
+
+    def __init__(self, reduction: str = "mean"):
+        """
+        Initialize the loss.
+
+        Parameters
+        ----------
+        reduction : str
+            "mean", "sum" or "none".
+
+        """
+        super().__init__(reduction)
+        self._rows: Optional[np.ndarray] = None
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """
+        Compute the loss and gradient of every value.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The logits.
+        y : np.ndarray
+            The expected probabilities, of the same shape.
+        values : np.ndarray
+            The buffer to write the loss of each value into.
+        gradients : np.ndarray
+            The buffer to write the gradient of each value into.
+
+        """
+        shape = x.shape[:-1] + (1,)
+        if self._rows is None or self._rows.shape != shape:
+            self._rows = np.empty(shape, x.dtype)
+        rows = self._rows
+
+        # log p, from the log of the sum of the shifted exponents.
+        np.max(x, axis=-1, keepdims=True, out=rows)
+        np.subtract(x, rows, out=gradients)
+        np.exp(gradients, out=values)
+        np.sum(values, axis=-1, keepdims=True, out=rows)
+        np.log(rows, out=rows)
+        gradients -= rows
+
+        np.multiply(y, gradients, out=values)
+        np.negative(values, out=values)
+        np.exp(gradients, out=gradients)
+        gradients -= y
@@ -0,0 +1,40 @@
+"""Contains tests for huber_loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.loss import HuberLoss
+
+
+class HuberLossTest(unittest.TestCase):
+    """Contains tests for the HuberLoss class."""
+
+    def test_huber_loss(self) -> None:
+        """Verifies that the loss is quadratic inside delta and linear outside."""
+        x = np.array([[-3.0, -0.5, 0.0, 1.0, 4.0]])
+        value, gradient = HuberLoss(2.0, "none").value_and_grad(x, np.zeros_like(x))
+        np.testing.assert_allclose(np.array([[4.0, 0.125, 0.0, 0.5, 6.0]]), value)
+        np.testing.assert_allclose(np.array([[-2.0, -0.5, 0.0, 1.0, 2.0]]), gradient)
+
+    def test_gradient(self) -> None:
+        """Verifies the gradient against central differences."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(scale=3, size=(5, 4))
+        y = rng.normal(size=(5, 4))
+        loss = HuberLoss(reduction="none")
+        step = 1e-6
+        np.testing.assert_allclose(
+            (loss(x + step, y) - loss(x - step, y)) / (2 * step),
+            loss.value_and_grad(x, y)[1],
+            rtol=1e-5,
+        )
+
+    def test_delta(self) -> None:
+        """Verifies that delta must be positive."""
+        with self.assertRaises(ValueError):
+            HuberLoss(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+"""Contains tests for l1_loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.computation import l1_loss
+from emell.loss import L1Loss
+
+
+class L1LossTest(unittest.TestCase):
+    """Contains tests for the L1Loss class."""
+
+    def test_l1_loss(self) -> None:
+        """Verifies the loss and gradient of a batch."""
+        x = np.array([[1.0, -2.0], [0.5, 3.0]])
+        y = np.array([[0.0, 1.0], [0.5, 1.0]])
+        value, gradient = L1Loss("none").value_and_grad(x, y)
+        np.testing.assert_allclose(np.vectorize(l1_loss)(x, y), value)
+        np.testing.assert_allclose(np.array([[1.0, -1.0], [0.0, 1.0]]), gradient)
+
+
+if __name__ == "__main__":
+    unittest.main()
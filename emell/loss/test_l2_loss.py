@@ -0,0 +1,24 @@
+"""Contains tests for l2_loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.computation import l2_loss
+from emell.loss import L2Loss
+
+
+class L2LossTest(unittest.TestCase):
+    """Contains tests for the L2Loss class."""
+
+    def test_l2_loss(self) -> None:
+        """Verifies the loss and gradient of a batch."""
+        x = np.array([[1.0, -2.0], [0.5, 3.0]])
+        y = np.array([[0.0, 1.0], [0.5, 1.0]])
+        value, gradient = L2Loss("none").value_and_grad(x, y)
+        np.testing.assert_allclose(np.vectorize(l2_loss)(x, y), value)
+        np.testing.assert_allclose(2 * (x - y), gradient)
+
+
+if __name__ == "__main__":
+    unittest.main()
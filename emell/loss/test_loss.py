@@ -0,0 +1,74 @@
+"""Contains tests for loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.loss import Loss, QuadraticLoss
+
+
+class LossTest(unittest.TestCase):
+    """Contains tests for the Loss base class."""
+
+    def setUp(self) -> None:
+        """Make a batch of predictions and expected values."""
+        self.x = np.array([[1.0, 2.0], [3.0, -1.0], [0.0, 0.0]])
+        self.y = np.array([[0.0, 2.0], [1.0, 1.0], [1.0, 0.0]])
+        # 0.5 * (x - y) ** 2 and x - y.
+        self.values = np.array([[0.5, 0.0], [2.0, 2.0], [0.5, 0.0]])
+        self.gradients = np.array([[1.0, 0.0], [2.0, -2.0], [-1.0, 0.0]])
+
+    def test_reductions(self) -> None:
+        """Verifies that each reduction scales the loss and gradient."""
+        value, gradient = QuadraticLoss("none").value_and_grad(self.x, self.y)
+        np.testing.assert_allclose(self.values, value)
+        np.testing.assert_allclose(self.gradients, gradient)
+
+        value, gradient = QuadraticLoss("sum").value_and_grad(self.x, self.y)
+        np.testing.assert_allclose(np.array([3.0, 2.0]), value)
+        np.testing.assert_allclose(self.gradients, gradient)
+
+        value, gradient = QuadraticLoss().value_and_grad(self.x, self.y)
+        np.testing.assert_allclose(np.array([1.0, 2.0 / 3]), value)
+        np.testing.assert_allclose(self.gradients / 3, gradient)
+        np.testing.assert_allclose(value, QuadraticLoss()(self.x, self.y))
+
+    def test_out(self) -> None:
+        """Verifies that results are written into the given buffers."""
+        loss = QuadraticLoss("sum")
+        out = np.empty(2)
+        grad_out = np.empty((3, 2))
+        value, gradient = loss.value_and_grad(self.x, self.y, out, grad_out)
+        self.assertIs(out, value)
+        self.assertIs(grad_out, gradient)
+        self.assertIs(out, loss(self.x, self.y, out))
+
+        # The scratch buffers are reused between calls of the same shape.
+        values = loss._values  # pylint: disable=protected-access
+        loss.value_and_grad(self.y, self.x, out, grad_out)
+        self.assertIs(values, loss._values)  # pylint: disable=protected-access
+        np.testing.assert_allclose(-self.gradients, grad_out)
+
+    def test_vectors(self) -> None:
+        """Verifies that a vector is reduced to a scalar."""
+        value = QuadraticLoss().value_and_grad(np.array([1.0, 3.0]), np.zeros(2))[0]
+        self.assertEqual((), value.shape)
+        self.assertAlmostEqual(2.5, float(value))
+
+    def test_invalid(self) -> None:
+        """Verifies that invalid reductions and shapes are rejected."""
+        with self.assertRaises(ValueError):
+            QuadraticLoss("max")
+
+        with self.assertRaises(ValueError):
+            QuadraticLoss()(self.x, self.y[:2])
+
+        with self.assertRaises(ValueError):
+            QuadraticLoss()(np.zeros((1, 2, 3)), np.zeros((1, 2, 3)))
+
+        with self.assertRaises(NotImplementedError):
+            Loss()(self.x, self.y)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+"""Contains tests for quadratic_loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.computation import delta_quadratic_loss, quadratic_loss
+from emell.loss import QuadraticLoss
+
+
+class QuadraticLossTest(unittest.TestCase):
+    """Contains tests for the QuadraticLoss class."""
+
+    def test_matches_functions(self) -> None:
+        """Verifies that the loss matches the quadratic loss functions."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(4, 3))
+        y = rng.normal(size=(4, 3))
+        value, gradient = QuadraticLoss("none").value_and_grad(x, y)
+        np.testing.assert_allclose(quadratic_loss(x, y), value)
+        np.testing.assert_allclose(delta_quadratic_loss(x, y), gradient)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Contains tests for softmax_cross_entropy_loss.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.loss import SoftmaxCrossEntropyLoss
+
+
+class SoftmaxCrossEntropyLossTest(unittest.TestCase):
+    """Contains tests for the SoftmaxCrossEntropyLoss class."""
+
+    def test_loss(self) -> None:
+        """Verifies the loss and gradient against separate softmax and log."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(4, 5))
+        y = np.eye(5)[[0, 3, 4, 1]]
+        p = np.exp(x) / np.sum(np.exp(x), axis=1, keepdims=True)
+
+        value, gradient = SoftmaxCrossEntropyLoss("none").value_and_grad(x, y)
+        np.testing.assert_allclose(-y * np.log(p), value)
+        np.testing.assert_allclose(p - y, gradient)
+
+        value, gradient = SoftmaxCrossEntropyLoss().value_and_grad(x, y)
+        self.assertAlmostEqual(float(np.mean(-np.log(p[y == 1]))), float(np.sum(value)))
+        np.testing.assert_allclose((p - y) / 4, gradient)
+
+    def test_gradient(self) -> None:
+        """Verifies the gradient against central differences."""
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=(3, 4))
+        y = rng.dirichlet(np.ones(4), size=3)
+        loss = SoftmaxCrossEntropyLoss("sum")
+        step = 1e-6
+        numerical = np.zeros_like(x)
+        for index in np.ndindex(*x.shape):
+            above = x.copy()
+            above[index] += step
+            below = x.copy()
+            below[index] -= step
+            numerical[index] = (np.sum(loss(above, y)) - np.sum(loss(below, y))) / (
+                2 * step
+            )
+        np.testing.assert_allclose(
+            numerical, loss.value_and_grad(x, y)[1], rtol=1e-5, atol=1e-8
+        )
+
+    def test_extremes(self) -> None:
+        """Verifies that large logits don't overflow."""
+        x = np.array([[1000.0, -1000.0, 0.0]])
+        y = np.array([[0.0, 1.0, 0.0]])
+        with np.errstate(over="raise", invalid="raise"):
+            value, gradient = SoftmaxCrossEntropyLoss("none").value_and_grad(x, y)
+        np.testing.assert_allclose(np.array([[0.0, 2000.0, 0.0]]), value)
+        np.testing.assert_allclose(np.array([[1.0, -1.0, 0.0]]), gradient)
+
+
+if __name__ == "__main__":
+    unittest.main()
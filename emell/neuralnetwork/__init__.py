@@ -1,17 +1,49 @@
 """Allows definition and computation on neural network architectures."""
 
-from emell.neuralnetwork.backpropagation import Backpropagation
-from emell.neuralnetwork.dense_layer import DenseLayer
-from emell.neuralnetwork.input_layer import InputLayer
-from emell.neuralnetwork.layer import Layer
-from emell.neuralnetwork.network import Network
-from emell.neuralnetwork.neuron import Neuron
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.neuralnetwork.allocation_tracker import AllocationTracker
+    from emell.neuralnetwork.backpropagation import Backpropagation
+    from emell.neuralnetwork.dense_layer import DenseLayer
+    from emell.neuralnetwork.embedding_layer import EmbeddingLayer
+    from emell.neuralnetwork.execution_plan import ExecutionPlan
+    from emell.neuralnetwork.input_layer import InputLayer
+    from emell.neuralnetwork.layer import Layer
+    from emell.neuralnetwork.network import Network
+    from emell.neuralnetwork.neuron import Neuron
+    from emell.neuralnetwork.profiler import Profiler
+    from emell.neuralnetwork.trainer import Trainer
 
 __all__ = [
+    "AllocationTracker",
     "Backpropagation",
     "DenseLayer",
+    "EmbeddingLayer",
+    "ExecutionPlan",
     "InputLayer",
     "Layer",
     "Neuron",
     "Network",
+    "Profiler",
+    "Trainer",
 ]
+
+lazy_import(
+    __name__,
+    {
+        "AllocationTracker": "allocation_tracker",
+        "Backpropagation": "backpropagation",
+        "DenseLayer": "dense_layer",
+        "EmbeddingLayer": "embedding_layer",
+        "ExecutionPlan": "execution_plan",
+        "InputLayer": "input_layer",
+        "Layer": "layer",
+        "Neuron": "neuron",
+        "Network": "network",
+        "Profiler": "profiler",
+        "Trainer": "trainer",
+    },
+)
@@ -0,0 +1,273 @@
+"""Contains a profiler that also tracks the memory allocated by each layer."""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
+
+from emell.neuralnetwork.layer import Layer
+from emell.neuralnetwork.profiler import Profiler
+from emell.sparse import CSRMatrix
+
+T = TypeVar("T")
+
+# tracemalloc.reset_peak was added in Python 3.9. Without it, the peak of each
+# pass cannot be measured.
+_RESETS_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class AllocationTracker(Profiler):
+    """
+    Records the memory allocated by each layer, on top of what Profiler records.
+
+    Memory is measured with tracemalloc, which NumPy reports its array data to,
+    so it only works between `start` and `stop`, or within a `with` block.
+    Outside of those, the tracker only profiles time like a Profiler. Tracing
+    slows down every allocation, so the timings are inflated while it runs.
+
+    For each layer and pass, the tracker records the bytes allocated, which is
+    the highest memory use above what was in use when the pass started, and the
+    bytes retained once the pass returned. Wrapping a train or predict call in
+    `step` records the same for the whole step, along with the passes of each
+    layer within it.
+
+    tracemalloc counts every allocation of the process, so the tracker should
+    only be used from one thread at a time. Measuring memory needs Python 3.9
+    or later. On earlier versions, `start` and `step` raise a RuntimeError,
+    and the tracker only profiles time.
+    """
+
+    def __init__(
+        self, max_events: int = 100000, clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize the tracker.
+
+        Parameters
+        ----------
+        max_events : int
+            The number of calls to keep for the Chrome trace.
+        clock : function() -> float
+            Returns the current time in seconds.
+
+        """
+        super().__init__(max_events, clock)
+        self._started = False
+        self._memory: Dict[Tuple[int, str], Dict[str, int]] = {}
+        self._steps: List[Dict[str, Any]] = []
+        self._step: Optional[Dict[str, Any]] = None
+        self._step_peak = 0
+        self._last_peak = 0
+
+    def start(self) -> None:
+        """Start tracing allocations, unless they are already traced."""
+        self._check_supported()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations, if `start` started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def __enter__(self) -> "AllocationTracker":
+        """Start tracing allocations."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop tracing allocations."""
+        self.stop()
+
+    def measure(
+        self,
+        index: int,
+        phase: str,
+        layer: Layer,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        function: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """
+        Call a function that runs one pass of a layer, and record it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the layer in the network.
+        phase : str
+            Profiler.FORWARD or Profiler.BACKWARD.
+        layer : Layer
+            The layer, which the costs are estimated from.
+        layer_input : np.ndarray or CSRMatrix
+            The input to the pass, which the batch size is taken from.
+        function : function(*args) -> Any
+            Runs the pass.
+        args : Any
+            The arguments of the function.
+
+        Returns
+        -------
+        The result of the function.
+
+        """
+        if not _RESETS_PEAK or not tracemalloc.is_tracing():
+            return super().measure(index, phase, layer, layer_input, function, *args)
+
+        before = self._reset_peak()
+        result = super().measure(index, phase, layer, layer_input, function, *args)
+        after = self._reset_peak()
+        allocated = self._last_peak - before
+        retained = after - before
+
+        with self._lock:
+            memory = self._memory.get((index, phase))
+            if memory is None:
+                memory = {"allocated_bytes": 0, "peak_bytes": 0, "retained_bytes": 0}
+                self._memory[(index, phase)] = memory
+            memory["allocated_bytes"] += allocated
+            memory["peak_bytes"] = max(memory["peak_bytes"], allocated)
+            memory["retained_bytes"] += retained
+            if self._step is not None:
+                self._step["layers"].append(
+                    {
+                        "layer": index,
+                        "phase": phase,
+                        "allocated_bytes": allocated,
+                        "retained_bytes": retained,
+                    }
+                )
+        return result
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Record the memory allocated by a train or predict step.
+
+        Starts tracing allocations for the duration of the step if they are
+        not already traced. Steps cannot be nested.
+
+        Parameters
+        ----------
+        name : str
+            Identifies the step in the report.
+
+        Returns
+        -------
+        A context manager that yields the record of the step, which is filled
+        in when the block exits. The record has the name, the bytes allocated
+        and retained by the whole step, and the same for each layer's passes.
+
+        """
+        self._check_supported()
+        if self._step is not None:
+            raise ValueError("Steps cannot be nested")
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        record: Dict[str, Any] = {"name": name, "layers": []}
+        self._step = record
+        before = self._reset_peak()
+        self._step_peak = before
+        try:
+            yield record
+        finally:
+            after = self._reset_peak()
+            self._step = None
+            if started:
+                tracemalloc.stop()
+
+        record["allocated_bytes"] = self._step_peak - before
+        record["retained_bytes"] = after - before
+        with self._lock:
+            self._steps.append(record)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Get the aggregated statistics of each layer and pass.
+
+        Returns
+        -------
+        The summary of Profiler, where each entry also has the total bytes
+        allocated and retained, and the most bytes allocated by one call.
+        Passes that ran without tracing count as allocating nothing.
+
+        """
+        summary = super().summary()
+        with self._lock:
+            for stats in summary:
+                stats.update(
+                    self._memory.get(
+                        (stats["layer"], stats["phase"]),
+                        {"allocated_bytes": 0, "peak_bytes": 0, "retained_bytes": 0},
+                    )
+                )
+        return summary
+
+    def steps(self) -> List[Dict[str, Any]]:
+        """
+        Get the record of every step so far.
+
+        Returns
+        -------
+        The records yielded by `step`, in order.
+
+        """
+        with self._lock:
+            return list(self._steps)
+
+    def write_json(self, path: str) -> None:
+        """
+        Write the summary and the steps to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            The file to write. Holds an object with "layers" for the summary
+            and "steps" for the steps.
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"layers": self.summary(), "steps": self.steps()}, file, indent=2)
+
+    def clear(self) -> None:
+        """Forget every recorded call and step."""
+        super().clear()
+        with self._lock:
+            self._memory.clear()
+            self._steps.clear()
+
+    @staticmethod
+    def _check_supported() -> None:
+        """Raise an error if this version of Python cannot measure peaks."""
+        if not _RESETS_PEAK:
+            raise RuntimeError("Tracking allocations needs Python 3.9 or later")
+
+    def _reset_peak(self) -> int:
+        """
+        Get the memory in use, and start measuring a new peak from it.
+
+        The peak since the last reset is kept as `_last_peak`, and counted
+        toward the peak of the current step.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._last_peak = peak
+        self._step_peak = max(self._step_peak, peak)
+        return current
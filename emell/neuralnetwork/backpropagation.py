@@ -1,10 +1,17 @@
 """Contains the backpropagation algorithm."""
 
-from typing import Callable
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
+from emell.activation import Identity, Softmax
+from emell.loss import Loss
+from emell.neuralnetwork.embedding_layer import EmbeddingLayer
+from emell.neuralnetwork.layer import Layer
 from emell.neuralnetwork.network import Network
+from emell.neuralnetwork.profiler import Profiler
+from emell.optimizer import SGD, Optimizer
+from emell.sparse import CSRMatrix
 
 
 class Backpropagation:
@@ -18,9 +25,10 @@ class Backpropagation:
     def __init__(
         self,
         network: Network,
-        loss_function: Callable[[np.ndarray, np.ndarray], np.ndarray],
-        loss_delta_function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        loss_function: Union[Loss, Callable[[np.ndarray, np.ndarray], np.ndarray]],
+        loss_delta_function: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]],
         alpha: float,
+        optimizer: Optional[Optimizer] = None,
     ):
         """
         Initialize the environment for the backpropagation algorithm.
@@ -30,23 +38,39 @@ class Backpropagation:
         network -> Network
             The network to train.
 
-        loss_function -> callable
-            The loss function.
+        loss_function -> Loss or callable
+            The loss function. A Loss must use the mean reduction, as training
+            follows the mean loss of each batch. A Loss that takes logits is
+            given the weighted outputs of the final layer.
 
         loss_delta -> callable
             The vectorized derivative of the loss function with respect to each
-            output.
+            output. Only used, and required, with a plain loss function.
 
         alpha -> float
-            The training rate.
+            The training rate. Only used by the default optimizer.
+
+        optimizer -> Optimizer
+            Updates the parameters from their gradients. Defaults to plain
+            stochastic gradient descent with a learning rate of alpha.
         """
         super().__init__()
+        if isinstance(loss_function, Loss):
+            if loss_function.reduction != "mean":
+                raise ValueError("The loss must use the mean reduction")
+            self.loss = loss_function
+        elif loss_delta_function is None:
+            raise ValueError("A plain loss function needs a loss_delta_function")
+        else:
+            self.loss = _FunctionLoss(loss_function, loss_delta_function)
+
         self.network = network
-        self.loss_function: Callable[
-            [np.ndarray, np.ndarray], np.ndarray
-        ] = loss_function
+        self.loss_function = loss_function
         self.loss_delta_function = loss_delta_function
+        self._output_delta: Optional[np.ndarray] = None
         self.alpha = alpha
+        self.optimizer = optimizer if optimizer is not None else SGD(alpha)
+        self._check_loss()
 
     def train(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
         """
@@ -64,6 +88,19 @@ class Backpropagation:
         The loss for the given training example.
 
         """
+        if isinstance(self.loss_function, Loss) or self.loss_delta_function is None:
+            raise ValueError("train needs plain loss functions, use train_batch")
+
+        self._check_loss()
+
+        if any(isinstance(layer, EmbeddingLayer) for layer in self.network.layers):
+            raise ValueError("train cannot train embedding layers, use train_batch")
+
+        # Every gradient is written in full.
+        for gradient_rows in self.network.layer_gradient_rows:
+            gradient_rows[:] = [None] * len(gradient_rows)
+
+        y = np.asarray(y, self.network.dtype)
         result = self.network.compute(x)
         layer_results = result.results
 
@@ -75,33 +112,286 @@ class Backpropagation:
         # for the final layer.
         delta_loss = self.loss_delta_function(y, result.output)
         delta_next_layer = delta_loss * layer_results[-1].layer.activation_prime(
-            layer_results[-1].weighted_output
+            np.asarray(layer_results[-1].weighted_output)
         )
-        previous_layer_result = None
+        profiler = self.network.profiler
+
+        for index in range(len(layer_results) - 1, -1, -1):
+            previous_index = index + 1 if index < len(layer_results) - 1 else None
+            if profiler is None:
+                delta_next_layer = self._train_layer(
+                    layer_results, index, previous_index, delta_next_layer
+                )
+            else:
+                delta_next_layer = profiler.measure(
+                    index,
+                    Profiler.BACKWARD,
+                    layer_results[index].layer,
+                    layer_results[index].output,
+                    self._train_layer,
+                    layer_results,
+                    index,
+                    previous_index,
+                    delta_next_layer,
+                )
+
+        self._step()
 
-        for layer_result in reversed(result.results):
-            layer = layer_result.layer
-            weighted_output = layer_result.weighted_output
-            output = layer_result.output
+        # The loss isn't used in backpropagation. It's just interesting to know.
+        return self.loss_function(y, result.output)
 
-            # Calculate the rate of change of the error at the current layer.
-            delta_layer = delta_next_layer * layer.activation_prime(weighted_output)
+    def train_batch(self, x: Union[np.ndarray, CSRMatrix], y: np.ndarray) -> np.ndarray:
+        """
+        Perform backpropagation on a mini-batch of examples.
 
-            # The rate of change w.r.t. the bias is the error at the layer.
-            layer.update_bias(self.alpha * delta_layer)
+        The whole batch is pushed through the network at once, so each layer
+        does one matrix-matrix product. The gradients are averaged over the
+        batch before they are handed to the optimizer. Embedding tables are
+        only updated in the rows of the ids in the batch.
 
-            # Calculate and cache updates needed to get results for the next
-            # layer.
-            if previous_layer_result is not None:
-                # The vectorized rate of change of the weights of the next
-                # layer is the activation of this layer times the error in
-                # the next layer.
-                weight_update = self.alpha * (output @ delta_next_layer)
-                previous_layer_result.layer.update_weights(weight_update)
+        Parameters
+        ----------
+        x -> np.ndarray or CSRMatrix
+            The input training examples, as a (batch, inputs) matrix. Sparse
+            examples only touch the weights of their nonzero inputs.
+        y -> np.ndarray
+            The expected outputs, as a (batch, outputs) matrix.
 
-            # Precompute for the next iteration.
-            delta_next_layer = np.transpose(layer.get_weights()) @ delta_layer
-            previous_layer_result = layer_result
+        Returns
+        -------
+        The loss for each output, averaged over the batch.
 
-        # The loss isn't used in backpropagation. It's just interesting to know.
-        return self.loss_function(y, result.output)
+        """
+        loss = self.compute_gradients(x, y)
+        self._step()
+        return loss
+
+    def compute_gradients(
+        self, x: Union[np.ndarray, CSRMatrix], y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the gradients of a mini-batch without updating the network.
+
+        The gradient of the mean loss w.r.t. each parameter is written into the
+        gradient buffers of the network. The loss and its gradient are computed
+        together, once per batch. A compiled network runs through its
+        execution plan.
+
+        Parameters
+        ----------
+        x -> np.ndarray or CSRMatrix
+            The input training examples, as a (batch, inputs) matrix. Sparse
+            examples only touch the weights of their nonzero inputs.
+        y -> np.ndarray
+            The expected outputs, as a (batch, outputs) matrix.
+
+        Returns
+        -------
+        The loss for each output, averaged over the batch.
+
+        """
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("Can only train on (batch, values) matrices")
+
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("The inputs and outputs must have the same batch size")
+
+        self._check_loss()
+        y = np.asarray(y, self.network.dtype)
+        plan = self.network.plan
+        if plan is not None and x.shape[0] <= plan.max_batch_size:
+            output = plan.forward(x)
+            if self.loss.takes_logits:
+                output = plan.weighted_output
+            loss, output_delta = self._value_and_grad(output, y)
+            plan.backward(output_delta)
+            return loss
+
+        result = self.network.compute(x)
+        layer_results = result.results
+
+        # The rate of change of the mean loss w.r.t. the weighted output of the
+        # final layer. The loss already averages its gradient over the batch.
+        # Only the outputs of the input layer can be sparse.
+        last_result = layer_results[-1]
+        weighted_output = np.asarray(last_result.weighted_output)
+        output = weighted_output if self.loss.takes_logits else result.output
+        loss, output_delta = self._value_and_grad(output, y)
+        delta = output_delta * last_result.layer.activation_prime(weighted_output)
+
+        # The input layer has no weights, so stop once its outputs are used.
+        profiler = self.network.profiler
+        for index in range(len(layer_results) - 1, 0, -1):
+            if profiler is None:
+                delta = self._backward_layer(layer_results, index, delta)
+            else:
+                delta = profiler.measure(
+                    index,
+                    Profiler.BACKWARD,
+                    layer_results[index].layer,
+                    delta,
+                    self._backward_layer,
+                    layer_results,
+                    index,
+                    delta,
+                )
+
+        return loss
+
+    def _check_loss(self) -> None:
+        """
+        Raise an error if the loss does not suit the final activation.
+
+        Softmax reports a derivative of 1, which is only right for a loss that
+        takes logits, and such a loss skips the derivative of the final layer.
+        This is checked on every step, as layers can be added at any time.
+        """
+        activation = self.network.layers[-1].activation
+        if isinstance(activation, Softmax) and not self.loss.takes_logits:
+            raise ValueError("A Softmax output layer needs a loss that takes logits")
+
+        if self.loss.takes_logits and not isinstance(activation, (Softmax, Identity)):
+            raise ValueError(
+                "A loss that takes logits needs a Softmax or Identity output"
+            )
+
+    def _train_layer(
+        self,
+        layer_results: List[Layer.Result],
+        index: int,
+        previous_index: Optional[int],
+        delta_next_layer: np.ndarray,
+    ) -> np.ndarray:
+        """Run one step of `train`, and return the next `delta_next_layer`."""
+        layer_result = layer_results[index]
+        layer = layer_result.layer
+        weighted_output = np.asarray(layer_result.weighted_output)
+        output = layer_result.output
+        gradients = self.network.layer_gradients[index]
+
+        # Calculate the rate of change of the error at the current layer.
+        delta_layer = delta_next_layer * layer.activation_prime(weighted_output)
+
+        # The rate of change w.r.t. the bias is the error at the layer. The
+        # error points downhill, so the gradient is its negation.
+        if gradients:
+            gradients[1][...] = -delta_layer
+
+        # Calculate and cache updates needed to get results for the next
+        # layer.
+        if previous_index is not None:
+            # The vectorized rate of change of the weights of the next
+            # layer is the activation of this layer times the error in
+            # the next layer.
+            weight_update = output @ delta_next_layer
+            self.network.layer_gradients[previous_index][0].fill(-weight_update)
+
+        # Precompute for the next iteration.
+        delta_next_layer = np.transpose(layer.get_weights()) @ delta_layer
+        return delta_next_layer
+
+    def _backward_layer(
+        self, layer_results: List[Layer.Result], index: int, delta: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the gradients of a layer from its delta.
+
+        Returns the delta of the layer before it, or the same delta for the
+        first layer.
+        """
+        layer = layer_results[index].layer
+        previous_result = layer_results[index - 1]
+        if isinstance(layer, EmbeddingLayer):
+            self._backward_embedding(layer, index, previous_result.output, delta)
+            return delta
+
+        weight_gradient, bias_gradient = self.network.layer_gradients[index]
+        gradient_rows = self.network.layer_gradient_rows[index]
+        if isinstance(previous_result.output, CSRMatrix):
+            # Only the columns of the nonzero inputs get a gradient, so the
+            # columns written by the last batch are zeroed first.
+            if gradient_rows[0] is None:
+                weight_gradient.fill(0)
+            else:
+                weight_gradient[gradient_rows[0]] = 0
+            previous_result.output.transposed_matmul(
+                delta, out=weight_gradient.T, zero=False
+            )
+            gradient_rows[0] = (slice(None), previous_result.output.nonzero_columns())
+        else:
+            np.matmul(delta.T, previous_result.output, out=weight_gradient)
+            gradient_rows[0] = None
+        np.sum(delta, axis=0, out=bias_gradient)
+
+        if index == 1:
+            return delta
+
+        previous_delta: np.ndarray = (delta @ layer.get_weights()) * (
+            previous_result.layer.activation_prime(
+                np.asarray(previous_result.weighted_output)
+            )
+        )
+        return previous_delta
+
+    def _backward_embedding(
+        self,
+        layer: EmbeddingLayer,
+        index: int,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        delta: np.ndarray,
+    ) -> None:
+        """
+        Compute the gradient of the rows of the ids in the batch.
+
+        The rows written by the last batch are zeroed first, so the rest of
+        the gradient stays zero without touching the whole table.
+        """
+        (gradient,) = self.network.layer_gradients[index]
+        gradient_rows = self.network.layer_gradient_rows[index]
+        gradient[gradient_rows[0]] = 0
+
+        ids = layer.get_ids(layer_input)
+        rows, inverse = np.unique(ids, return_inverse=True)
+        row_gradient = np.zeros((rows.size, layer.dimension), gradient.dtype)
+        np.add.at(row_gradient, inverse.reshape(-1), delta.reshape(-1, layer.dimension))
+        gradient[rows] = row_gradient
+        gradient_rows[0] = rows
+
+    def _step(self) -> None:
+        """Update the parameters, only in the rows with a gradient if possible."""
+        rows = self.network.gradient_rows()
+        if rows is None:
+            self.optimizer.step(self.network.parameters(), self.network.gradients())
+        else:
+            self.optimizer.step(
+                self.network.parameters(), self.network.gradients(), rows
+            )
+
+    def _value_and_grad(
+        self, output: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the mean loss, and its gradient into a reused buffer."""
+        if self._output_delta is None or self._output_delta.shape != output.shape:
+            self._output_delta = np.empty_like(output)
+        return self.loss.value_and_grad(output, y, grad_out=self._output_delta)
+
+
+class _FunctionLoss(Loss):
+    """Adapts a plain loss function and its derivative to the protocol."""
+
+    def __init__(
+        self,
+        loss_function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        loss_delta_function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    ):
+        """Wrap the functions."""
+        super().__init__()
+        self.loss_function = loss_function
+        self.loss_delta_function = loss_delta_function
+
+    def compute(
+        self, x: np.ndarray, y: np.ndarray, values: np.ndarray, gradients: np.ndarray
+    ) -> None:
+        """Call both functions, and copy their results."""
+        np.copyto(values, self.loss_function(x, y))
+        np.copyto(gradients, self.loss_delta_function(x, y))
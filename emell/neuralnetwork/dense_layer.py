@@ -1,11 +1,15 @@
 """Contains the implementation of a densely-connected neural network layer."""
 
-from random import random
-from typing import Callable, Optional
+import random
+from typing import Callable, List, Optional, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from emell.activation import Activation
+from emell.initializer import FunctionInitializer, Initializer, Uniform
 from emell.neuralnetwork.layer import Layer
+from emell.sparse import CSRMatrix
 
 
 class DenseLayer(Layer):
@@ -20,8 +24,9 @@ class DenseLayer(Layer):
         self,
         neuron_count: int,
         activation: Callable[[np.ndarray], np.ndarray],
-        activation_prime: Callable[[np.ndarray], np.ndarray],
-        random_function: Callable[[], float] = random,
+        activation_prime: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        random_function: Optional[Callable[[], float]] = None,
+        initializer: Optional[Initializer] = None,
     ):
         """
         Initialize the dense layer.
@@ -30,23 +35,40 @@ class DenseLayer(Layer):
         ----------
         neuron_count : int
             The number of neurons in the layer
-        activation : function(np.ndarray) -> np.ndarray
+        activation : Activation or function(np.ndarray) -> np.ndarray
             The activation function for the layer. Must operate element-wise on
             the input vector.
-        activation_prime : function(np.ndarray) -> np.ndarray
+        activation_prime : function(np.ndarray) -> np.ndarray, optional
             The derivative of the activation function. Must also operate
-            element-wise on the input vector.
-        random_function : function() -> float
-            A function to produce random numbers.
+            element-wise on the input vector. Defaults to the derivative of an
+            Activation, and is required for plain functions.
+        random_function : function() -> float, optional
+            Called once per weight to produce numbers in [0.0, 1.0), which are
+            scaled by 0.01. Slow, but useful to inject exact weights in tests.
+        initializer : Initializer, optional
+            Creates the weight matrix in one call. Defaults to drawing from
+            [0.0, 0.01), the same as the default random_function would, with
+            a seed drawn from the random module.
 
         """
+        if activation_prime is None:
+            if not isinstance(activation, Activation):
+                raise ValueError("activation_prime is required for plain functions")
+            activation_prime = activation.prime
+
         super().__init__(neuron_count, activation, activation_prime)
         self.neuron_count = neuron_count
-        self.random = random_function
+        if random_function is not None:
+            initializer = FunctionInitializer(random_function)
+        if initializer is None:
+            # The weights used to be drawn from the random module, so seeding
+            # it still makes networks repeatable.
+            initializer = Uniform(seed=random.getrandbits(64))
+        self.initializer = initializer
         self.bias = np.zeros((neuron_count))
         self.weights: Optional[np.ndarray] = None
 
-    def add_weights(self, weights_count: int) -> None:
+    def add_weights(self, weights_count: int, dtype: DTypeLike = np.float64) -> None:
         """
         Add weights to the dense layer.
 
@@ -54,14 +76,16 @@ class DenseLayer(Layer):
         ----------
         weights_count : int
             The number of input weights for each neuron.
+        dtype : np.dtype
+            The floating point type of the weights. The bias is converted to
+            match.
 
         """
-        self.weights = np.array(
-            [
-                [0.01 * self.random() for _ in range(weights_count)]
-                for x in range(self.neuron_count)
-            ]
+        self.dtype = np.dtype(dtype)
+        self.weights = self.initializer.initialize(
+            (self.neuron_count, weights_count), self.dtype
         )
+        self.bias = self.bias.astype(self.dtype)
 
     def get_weights(self) -> np.ndarray:
         """
@@ -78,6 +102,34 @@ class DenseLayer(Layer):
 
         return self.weights
 
+    def get_parameters(self) -> List[np.ndarray]:
+        """
+        Get the parameters of the layer.
+
+        Returns
+        -------
+        The weight matrix followed by the bias vector.
+
+        """
+        return [self.get_weights(), self.bias]
+
+    def set_parameters(self, parameters: List[np.ndarray]) -> None:
+        """
+        Replace the weight matrix and bias vector of the layer.
+
+        Parameters
+        ----------
+        parameters : list
+            The new weight matrix followed by the new bias vector.
+
+        """
+        weights, bias = parameters
+        if weights.shape != self.get_weights().shape or bias.shape != self.bias.shape:
+            raise ValueError("The parameters do not match the shape of the layer")
+
+        self.weights = weights
+        self.bias = bias
+
     def update_weights(self, delta: np.ndarray) -> None:
         """
         Update the weights.
@@ -102,16 +154,56 @@ class DenseLayer(Layer):
         """
         self.bias += delta
 
-    def compute(self, layer_input: np.ndarray) -> Layer.Result:
+    def compute(self, layer_input: Union[np.ndarray, CSRMatrix]) -> Layer.Result:
         """
         Compute the output of the dense layer.
 
         Parameters
         ----------
-        layer_input : np.ndarray
-            The input to the layer.
+        layer_input : np.ndarray or CSRMatrix
+            The input to the layer. Either a single example vector or a
+            (batch, inputs) matrix, in which case one matrix-matrix product is
+            computed for the whole batch. A sparse batch only reads the
+            weights of its nonzero inputs.
 
         """
-        weighted_output = np.dot(self.weights, layer_input) + self.bias
+        if isinstance(layer_input, CSRMatrix):
+            weighted_output = layer_input.matmul(self.get_weights().T)
+            weighted_output += self.bias
+        else:
+            weighted_output = np.dot(layer_input, self.get_weights().T) + self.bias
         output = self.activation(weighted_output)
-        return Layer.Result(layer=self, weighted_output=weighted_output, output=output,)
+        return Layer.Result(
+            layer=self,
+            weighted_output=weighted_output,
+            output=output,
+        )
+
+    def predict(
+        self,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Compute the output of the dense layer for a batch.
+
+        The weighted output is written into `out` rather than a new array, and
+        is not kept for backpropagation.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the layer.
+        out : np.ndarray, optional
+            A (batch, neuron_count) buffer for the output.
+
+        """
+        if out is None:
+            out = np.empty((layer_input.shape[0], self.neuron_count), self.dtype)
+
+        if isinstance(layer_input, CSRMatrix):
+            layer_input.matmul(self.get_weights().T, out=out)
+        else:
+            np.dot(layer_input, self.get_weights().T, out=out)
+        np.add(out, self.bias, out=out)
+        return self.activation(out)
@@ -0,0 +1,203 @@
+"""Contains the implementation of an embedding layer."""
+
+from typing import List, Optional, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.activation import Identity
+from emell.initializer import Initializer, Normal
+from emell.neuralnetwork.layer import Layer
+from emell.sparse import CSRMatrix
+
+
+class EmbeddingLayer(Layer):
+    """
+    Maps integer ids to rows of a trainable table.
+
+    Takes the place of one-hot encoding categorical features into a wide
+    input. Each input of the network is an id between 0 and the vocabulary
+    size, and the layer outputs the row of the table for each id, one after
+    the other. An example of k ids has k * dimension outputs.
+
+    Backpropagation only writes the gradient of the rows that were looked up,
+    and the optimizer only updates those rows, so a step costs time in
+    proportion to the batch rather than the vocabulary. An embedding layer
+    must be the first layer after the input, as ids have no gradient.
+    """
+
+    def __init__(
+        self,
+        vocabulary_size: int,
+        dimension: int,
+        initializer: Optional[Initializer] = None,
+    ):
+        """
+        Initialize the embedding layer.
+
+        Parameters
+        ----------
+        vocabulary_size : int
+            The number of ids, and rows in the table.
+        dimension : int
+            The size of each row.
+        initializer : Initializer, optional
+            Creates the (vocabulary_size, dimension) table. Defaults to
+            drawing from a normal distribution with a standard deviation of
+            0.01.
+
+        """
+        if vocabulary_size < 1 or dimension < 1:
+            raise ValueError("The vocabulary size and dimension must be positive")
+
+        activation = Identity()
+        super().__init__(dimension, activation, activation.prime)
+        self.vocabulary_size = vocabulary_size
+        self.dimension = dimension
+        self.initializer = initializer if initializer is not None else Normal()
+        self.table: Optional[np.ndarray] = None
+
+    def add_weights(self, weights_count: int, dtype: DTypeLike = np.float64) -> None:
+        """
+        Create the table of the embedding layer.
+
+        Parameters
+        ----------
+        weights_count : int
+            The number of ids in each example. The layer has `dimension`
+            outputs for each of them.
+        dtype : np.dtype
+            The floating point type of the table. Ids are passed through the
+            network in this type, so it must represent each of them exactly.
+
+        """
+        self.dtype = np.dtype(dtype)
+        mantissa_bits = np.finfo(self.dtype).nmant  # pylint: disable=no-member
+        if self.vocabulary_size > 2 ** (mantissa_bits + 1):
+            raise ValueError(f"Some ids cannot be represented as {self.dtype}")
+
+        self.neuron_count = weights_count * self.dimension
+        self.table = self.initializer.initialize(
+            (self.vocabulary_size, self.dimension), self.dtype
+        )
+
+    def get_weights(self) -> np.ndarray:
+        """
+        Get the table of the layer.
+
+        Returns
+        -------
+        The (vocabulary_size, dimension) table, with one row for each id.
+
+        """
+        if self.table is None:
+            raise RuntimeError("Cannot get weights for an unimplemented layer.")
+
+        return self.table
+
+    def get_parameters(self) -> List[np.ndarray]:
+        """
+        Get the parameters of the layer.
+
+        Returns
+        -------
+        The table.
+
+        """
+        return [self.get_weights()]
+
+    def set_parameters(self, parameters: List[np.ndarray]) -> None:
+        """
+        Replace the table of the layer.
+
+        Parameters
+        ----------
+        parameters : list
+            The new table.
+
+        """
+        (table,) = parameters
+        if table.shape != self.get_weights().shape:
+            raise ValueError("The parameters do not match the shape of the layer")
+
+        self.table = table
+
+    def update_weights(self, delta: np.ndarray) -> None:
+        """
+        Update the table.
+
+        Parameters
+        ----------
+        delta -> np.ndarray
+            The amount to add to the table.
+
+        """
+        self.table += delta
+
+    def update_bias(self, delta: np.ndarray) -> None:
+        """Update bias does nothing, as an embedding layer has no bias."""
+
+    def compute(self, layer_input: Union[np.ndarray, CSRMatrix]) -> Layer.Result:
+        """
+        Look up the rows for the ids.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray
+            The ids. Either a single example vector or a (batch, ids) matrix.
+
+        """
+        ids = self.get_ids(layer_input)
+        output = self.get_weights()[ids].reshape(ids.shape[:-1] + (-1,))
+        return Layer.Result(layer=self, weighted_output=output, output=output)
+
+    def predict(
+        self,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Look up the rows for a batch of ids.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray
+            The (batch, ids) input to the layer.
+        out : np.ndarray, optional
+            A (batch, neuron_count) buffer for the output.
+
+        """
+        ids = self.get_ids(layer_input)
+        if out is None:
+            out = np.empty((ids.shape[0], self.neuron_count), self.dtype)
+
+        np.take(
+            self.get_weights(),
+            ids,
+            axis=0,
+            out=out.reshape(ids.shape + (self.dimension,)),
+        )
+        return out
+
+    def get_ids(self, layer_input: Union[np.ndarray, CSRMatrix]) -> np.ndarray:
+        """
+        Convert the input of the layer to ids.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray
+            The ids, in the floating point type of the network.
+
+        Returns
+        -------
+        The ids as integers, in the same shape.
+
+        """
+        if isinstance(layer_input, CSRMatrix):
+            raise ValueError("An embedding layer cannot take sparse input")
+
+        ids = np.asarray(layer_input).astype(np.intp)
+        if ids.size and (ids.min() < 0 or ids.max() >= self.vocabulary_size):
+            raise ValueError("The ids must be between 0 and the vocabulary size")
+
+        return ids
@@ -0,0 +1,318 @@
+"""Contains a compiled forward and backward pass over a network."""
+
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+import numpy as np
+
+from emell.activation import Activation
+from emell.neuralnetwork.dense_layer import DenseLayer
+from emell.neuralnetwork.profiler import Profiler
+from emell.sparse import CSRMatrix
+
+if TYPE_CHECKING:
+    from emell.neuralnetwork.network import Network
+
+
+class ExecutionPlan:  # pylint: disable=too-many-instance-attributes
+    """
+    A forward and backward pass over a network, frozen ahead of time.
+
+    The weights, biases, transposed weights and activation functions of every
+    layer are looked up once. Inputs, weighted outputs, outputs, derivatives
+    and deltas are written into buffers allocated for the largest batch, and
+    the views of those buffers are kept for the last batch size. A steady batch
+    size then allocates nothing, as long as every layer uses an Activation.
+    Plain activation functions still allocate their results.
+
+    `forward` saves the derivative of each activation as it goes, so that
+    `backward` reuses it rather than recomputing it.
+
+    Sparse batches are used as they are rather than copied into the input
+    buffer. The first layer then gathers the weights of the nonzero inputs,
+    which allocates in proportion to the number of nonzeros, and only writes
+    the gradient of their columns.
+
+    The plan holds on to the parameter arrays of the network, so the network
+    rebuilds it whenever a layer is added or the parameters are moved. The
+    profiler of the network is looked up on every call, so it can be attached
+    or removed at any time.
+    """
+
+    def __init__(self, network: "Network", max_batch_size: int):
+        """
+        Compile the plan.
+
+        Parameters
+        ----------
+        network : Network
+            The network to compile. Every layer after the input must be a
+            DenseLayer.
+        max_batch_size : int
+            The largest batch that the plan can run.
+
+        """
+        super().__init__()
+        layers: List[DenseLayer] = []
+        for layer in network.layers[1:]:
+            if not isinstance(layer, DenseLayer):
+                raise ValueError("Only networks of dense layers can be compiled")
+            layers.append(layer)
+
+        if max_batch_size < 1:
+            raise ValueError("The batch size must be at least one")
+
+        self.network = network
+        self.max_batch_size = max_batch_size
+        self.input_count = network.layers[0].neuron_count
+        self._layers = layers
+
+        self._weights = [layer.get_weights() for layer in layers]
+        self._transposed_weights = [weights.T for weights in self._weights]
+        self._biases = [layer.bias for layer in layers]
+        self._activations = [
+            (
+                layer.activation
+                if isinstance(layer.activation, Activation)
+                else _FunctionActivation(layer.activation, layer.activation_prime)
+            )
+            for layer in layers
+        ]
+        self._gradients = network.layer_gradients[1:]
+        self._gradient_rows = network.layer_gradient_rows[1:]
+
+        dtype = network.dtype
+        self._input = np.empty((max_batch_size, self.input_count), dtype)
+        shapes = [(max_batch_size, layer.neuron_count) for layer in layers]
+        self._weighted_outputs = [np.empty(shape, dtype) for shape in shapes]
+        self._outputs = [np.empty(shape, dtype) for shape in shapes]
+        self._derivatives = [np.empty(shape, dtype) for shape in shapes]
+        self._deltas = [np.empty(shape, dtype) for shape in shapes]
+
+        self._batch_size = 0
+        self._input_view = self._input
+        self._sparse_input: Optional[CSRMatrix] = None
+        self._weighted_output_views: List[np.ndarray] = []
+        self._output_views: List[np.ndarray] = []
+        self._derivative_views: List[np.ndarray] = []
+        self._delta_views: List[np.ndarray] = []
+        self._resize(max_batch_size)
+
+    def predict(self, network_input: Union[np.ndarray, CSRMatrix]) -> np.ndarray:
+        """
+        Compute the output for a batch of inputs.
+
+        Parameters
+        ----------
+        network_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the network.
+
+        Returns
+        -------
+        The output buffer of the final layer, which is overwritten by the next
+        call.
+
+        """
+        previous_output = self._load_input(network_input)
+        profiler = self.network.profiler
+        for index, layer in enumerate(self._layers):
+            if profiler is None:
+                previous_output = self._forward_layer(index, previous_output, False)
+            else:
+                previous_output = profiler.measure(
+                    index + 1,
+                    Profiler.FORWARD,
+                    layer,
+                    previous_output,
+                    self._forward_layer,
+                    index,
+                    previous_output,
+                    False,
+                )
+        return np.asarray(previous_output)
+
+    def forward(self, network_input: Union[np.ndarray, CSRMatrix]) -> np.ndarray:
+        """
+        Compute the output for a batch, keeping what `backward` needs.
+
+        Parameters
+        ----------
+        network_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the network.
+
+        Returns
+        -------
+        The output buffer of the final layer, which is overwritten by the next
+        call.
+
+        """
+        previous_output = self._load_input(network_input)
+        profiler = self.network.profiler
+        for index, layer in enumerate(self._layers):
+            if profiler is None:
+                previous_output = self._forward_layer(index, previous_output, True)
+            else:
+                previous_output = profiler.measure(
+                    index + 1,
+                    Profiler.FORWARD,
+                    layer,
+                    previous_output,
+                    self._forward_layer,
+                    index,
+                    previous_output,
+                    True,
+                )
+        return np.asarray(previous_output)
+
+    def backward(self, output_delta: np.ndarray) -> None:
+        """
+        Compute the gradients of the last batch passed to `forward`.
+
+        The gradients are written into the gradient buffers of the network.
+
+        Parameters
+        ----------
+        output_delta : np.ndarray
+            The rate of change of the loss with respect to each output of the
+            network, as a (batch, outputs) matrix.
+
+        """
+        delta = np.multiply(
+            output_delta, self._derivative_views[-1], out=self._delta_views[-1]
+        )
+
+        profiler = self.network.profiler
+        for index in range(len(self._layers) - 1, -1, -1):
+            if profiler is None:
+                delta = self._backward_layer(index, delta)
+            else:
+                delta = profiler.measure(
+                    index + 1,
+                    Profiler.BACKWARD,
+                    self._layers[index],
+                    delta,
+                    self._backward_layer,
+                    index,
+                    delta,
+                )
+
+    @property
+    def weighted_output(self) -> np.ndarray:
+        """Get the weighted output of the final layer for the last batch."""
+        return self._weighted_output_views[-1]
+
+    def _load_input(
+        self, network_input: Union[np.ndarray, CSRMatrix]
+    ) -> Union[np.ndarray, CSRMatrix]:
+        """Check the input, and copy it into the input buffer unless sparse."""
+        if network_input.ndim != 2 or network_input.shape[1] != self.input_count:
+            raise ValueError("Can only run on (batch, inputs) matrices")
+
+        batch_size = network_input.shape[0]
+        if batch_size != self._batch_size:
+            if not 0 < batch_size <= self.max_batch_size:
+                raise ValueError("The batch size must be between 1 and the maximum")
+            self._resize(batch_size)
+
+        if isinstance(network_input, CSRMatrix):
+            self._sparse_input = network_input.astype(self._input.dtype)
+            return self._sparse_input
+
+        self._sparse_input = None
+        np.copyto(self._input_view, network_input)
+        return self._input_view
+
+    def _forward_layer(
+        self, index: int, layer_input: Union[np.ndarray, CSRMatrix], training: bool
+    ) -> np.ndarray:
+        """Compute the output of a layer, and its derivative when training."""
+        weighted_output = self._weighted_output_views[index]
+        if isinstance(layer_input, CSRMatrix):
+            layer_input.matmul(self._transposed_weights[index], out=weighted_output)
+        else:
+            np.matmul(layer_input, self._transposed_weights[index], out=weighted_output)
+        weighted_output += self._biases[index]
+
+        if training:
+            return self._activations[index].forward_and_derivative(
+                weighted_output,
+                self._output_views[index],
+                self._derivative_views[index],
+            )
+        return self._activations[index](weighted_output, out=self._output_views[index])
+
+    def _backward_layer(self, index: int, delta: np.ndarray) -> np.ndarray:
+        """
+        Compute the gradients of a layer from its delta.
+
+        Returns the delta of the layer before it, or the same delta for the
+        first layer.
+        """
+        weight_gradient, bias_gradient = self._gradients[index]
+        if index:
+            np.matmul(delta.T, self._output_views[index - 1], out=weight_gradient)
+        elif self._sparse_input is not None:
+            # Only the columns of the nonzero inputs get a gradient, so the
+            # columns written by the last batch are zeroed first.
+            gradient_rows = self._gradient_rows[0]
+            if gradient_rows[0] is None:
+                weight_gradient.fill(0)
+            else:
+                weight_gradient[gradient_rows[0]] = 0
+            self._sparse_input.transposed_matmul(
+                delta, out=weight_gradient.T, zero=False
+            )
+            gradient_rows[0] = (slice(None), self._sparse_input.nonzero_columns())
+        else:
+            np.matmul(delta.T, self._input_view, out=weight_gradient)
+            self._gradient_rows[0][0] = None
+        np.sum(delta, axis=0, out=bias_gradient)
+
+        if not index:
+            return delta
+
+        previous_delta = self._delta_views[index - 1]
+        np.matmul(delta, self._weights[index], out=previous_delta)
+        previous_delta *= self._derivative_views[index - 1]
+        return previous_delta
+
+    def _resize(self, batch_size: int) -> None:
+        """Make views of the buffers for a new batch size."""
+        self._batch_size = batch_size
+        self._input_view = self._input[:batch_size]
+        self._weighted_output_views = [
+            buffer[:batch_size] for buffer in self._weighted_outputs
+        ]
+        self._output_views = [buffer[:batch_size] for buffer in self._outputs]
+        self._derivative_views = [buffer[:batch_size] for buffer in self._derivatives]
+        self._delta_views = [buffer[:batch_size] for buffer in self._deltas]
+
+
+class _FunctionActivation(Activation):
+    """Adapts a plain activation function and its derivative to the protocol."""
+
+    def __init__(
+        self,
+        activation: Callable[[np.ndarray], np.ndarray],
+        activation_prime: Callable[[np.ndarray], np.ndarray],
+    ):
+        """Wrap the functions."""
+        super().__init__()
+        self.activation = activation
+        self.activation_prime = activation_prime
+
+    def __call__(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the activation, and copy it into `out`."""
+        return self._copy(self.activation(x), out)
+
+    def prime(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the derivative, and copy it into `out`."""
+        return self._copy(self.activation_prime(x), out)
+
+    @staticmethod
+    def _copy(result: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Copy a result into `out`, broadcasting constants like `constant(1)`."""
+        if out is None:
+            return result
+
+        np.copyto(out, result)
+        return out
@@ -1,9 +1,13 @@
 """Contains the definition of an input layer for a neural network."""
 
+from typing import List, Optional, Union
+
 import numpy as np
+from numpy.typing import DTypeLike
 
 from emell.computation import constant, identity
 from emell.neuralnetwork.layer import Layer
+from emell.sparse import CSRMatrix
 
 
 class InputLayer(Layer):
@@ -15,7 +19,7 @@ class InputLayer(Layer):
     network.
     """
 
-    def __init__(self, input_count: int):
+    def __init__(self, input_count: int, dtype: DTypeLike = np.float64):
         """
         Initialize the input layer.
 
@@ -23,41 +27,92 @@ class InputLayer(Layer):
         ----------
         input_count : int
             The number of parameters that are added to the network.
+        dtype : np.dtype
+            The floating point type of the network. Inputs are converted to it.
 
         """
         super().__init__(
             neuron_count=input_count,
             activation=identity,
-            activation_prime=constant(np.zeros(input_count)),
+            activation_prime=constant(np.zeros(input_count, dtype)),
+            dtype=dtype,
         )
 
-    def add_weights(self, weights_count: int) -> None:
+    def add_weights(self, weights_count: int, dtype: DTypeLike = np.float64) -> None:
         """Raise an error, as there are no input weights to the network."""
         raise NotImplementedError("An input layer cannot be given weights")
 
-    def compute(self, layer_input: np.ndarray) -> "Layer.Result":
+    def compute(self, layer_input: Union[np.ndarray, CSRMatrix]) -> "Layer.Result":
         """
         Compute the output of the input layer.
 
+        The input is converted to the layer's dtype, without a copy if it
+        already matches.
+
         Parmaeters
         ----------
-        layer_input : np.ndarray
-            The input to the layer. Also the input to the network.
+        layer_input : np.ndarray or CSRMatrix
+            The input to the layer. Also the input to the network. Either a
+            single example vector or a (batch, inputs) matrix of examples,
+            which may be sparse.
 
         """
-        if layer_input.ndim != 1:
-            raise ValueError("Can only work on vectors")
+        if layer_input.ndim not in (1, 2):
+            raise ValueError("Can only work on vectors or batches of vectors")
 
-        if layer_input.shape[0] != self.neuron_count:
+        if layer_input.shape[-1] != self.neuron_count:
             raise ValueError("The layer input does not match the declared input size")
 
+        layer_input = self._convert(layer_input)
         return Layer.Result(
             layer=self, weighted_output=layer_input, output=layer_input,
         )
 
+    def predict(
+        self,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, CSRMatrix]:
+        """
+        Check and return the batch that is input to the network.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the network.
+        out : np.ndarray, optional
+            Unused, as the input is returned as-is.
+
+        """
+        if layer_input.ndim != 2:
+            raise ValueError("Can only predict on (batch, inputs) matrices")
+
+        if layer_input.shape[1] != self.neuron_count:
+            raise ValueError("The layer input does not match the declared input size")
+
+        return self._convert(layer_input)
+
+    def get_parameters(self) -> List[np.ndarray]:
+        """Return no parameters, as the input layer has none."""
+        return []
+
+    def set_parameters(self, parameters: List[np.ndarray]) -> None:
+        """Raise an error if any parameters are given."""
+        if parameters:
+            raise ValueError("An input layer has no parameters")
+
     def update_bias(self, delta: np.ndarray) -> None:
         """Update bias does nothing for an input layer."""
 
     def get_weights(self) -> np.ndarray:
         """Return a degenerate weight set."""
         return np.ones([self.neuron_count])
+
+    def _convert(
+        self, layer_input: Union[np.ndarray, CSRMatrix]
+    ) -> Union[np.ndarray, CSRMatrix]:
+        """Convert the input to the layer's dtype, keeping sparse input sparse."""
+        if isinstance(layer_input, CSRMatrix):
+            return layer_input.astype(self.dtype)
+
+        return np.asarray(layer_input, self.dtype)
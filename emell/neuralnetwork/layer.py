@@ -1,8 +1,11 @@
 """Contains the abstract definition of a neural network layer."""
 
-from typing import Callable, NamedTuple
+from typing import Callable, List, NamedTuple, Optional, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.sparse import CSRMatrix
 
 
 class Layer:
@@ -17,6 +20,7 @@ class Layer:
         neuron_count: int,
         activation: Callable[[np.ndarray], np.ndarray],
         activation_prime: Callable[[np.ndarray], np.ndarray],
+        dtype: DTypeLike = np.float64,
     ):
         """
         Initialize a Layer.
@@ -31,14 +35,17 @@ class Layer:
         activation_prime : function(np.ndarray) -> np.ndarray
             The derivative of the activation function. Must also operate
             element-wise on the input vector.
+        dtype : np.dtype
+            The floating point type of the layer's parameters and outputs.
 
         """
         super().__init__()
         self.neuron_count = neuron_count
         self.activation = activation
         self.activation_prime = activation_prime
+        self.dtype = np.dtype(dtype)
 
-    def add_weights(self, weights_count: int) -> None:
+    def add_weights(self, weights_count: int, dtype: DTypeLike = np.float64) -> None:
         """
         Add weights.
 
@@ -49,6 +56,9 @@ class Layer:
         ----------
         weights_count : int
             The number of weights to add.
+        dtype : np.dtype
+            The floating point type of the network. The layer's parameters are
+            stored in this type from now on.
 
         """
         raise NotImplementedError("The layer protocol is not usable.")
@@ -64,6 +74,32 @@ class Layer:
         """
         raise NotImplementedError("The layer protocol is not usable.")
 
+    def get_parameters(self) -> List[np.ndarray]:
+        """
+        Get every trainable parameter array of the layer.
+
+        Returns
+        -------
+        The parameter arrays, in a fixed order.
+
+        """
+        raise NotImplementedError("The layer protocol is not usable.")
+
+    def set_parameters(self, parameters: List[np.ndarray]) -> None:
+        """
+        Replace the trainable parameter arrays of the layer.
+
+        The layer uses the given arrays from now on instead of copying them, so
+        they can be views into a larger buffer.
+
+        Parameters
+        ----------
+        parameters : list
+            Arrays matching the shapes and order of `get_parameters`.
+
+        """
+        raise NotImplementedError("The layer protocol is not usable.")
+
     def update_weights(self, delta: np.ndarray) -> None:
         """
         Update weights.
@@ -94,14 +130,40 @@ class Layer:
         """
         raise NotImplementedError("The layer protocol is not usable.")
 
-    def compute(self, layer_input: np.ndarray) -> "Layer.Result":
+    def compute(self, layer_input: Union[np.ndarray, CSRMatrix]) -> "Layer.Result":
         """
         Compute the output for the layer.
 
         Parameters
         ----------
-        layer_input : np.ndarray
-            The input to the layer.
+        layer_input : np.ndarray or CSRMatrix
+            The input to the layer. Only the input layer and the first layer
+            after it accept sparse input.
+
+        """
+        raise NotImplementedError("The layer protocol type is not usable")
+
+    def predict(
+        self,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        out: Optional[np.ndarray] = None,
+    ) -> Union[np.ndarray, CSRMatrix]:
+        """
+        Compute the output for a batch without keeping backpropagation state.
+
+        Parameters
+        ----------
+        layer_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the layer. Only the input layer and
+            the first layer after it accept sparse input.
+        out : np.ndarray, optional
+            A (batch, neuron_count) buffer that the output may be written into.
+            Allocated if not given.
+
+        Returns
+        -------
+        The (batch, neuron_count) output of the layer. Only the input layer
+        returns sparse output, for sparse input.
 
         """
         raise NotImplementedError("The layer protocol type is not usable")
@@ -110,9 +172,10 @@ class Layer:
         """
         Represents all outputs of a neural network computation.
 
-        Useful for backpropagation.
+        Useful for backpropagation. The outputs of the input layer are sparse
+        for sparse input, and the outputs of every other layer are dense.
         """
 
         layer: "Layer"
-        weighted_output: np.ndarray
-        output: np.ndarray
+        weighted_output: Union[np.ndarray, CSRMatrix]
+        output: Union[np.ndarray, CSRMatrix]
@@ -1,14 +1,23 @@
 """Contains the definition of a feedforward neural network."""
 
-from typing import List, NamedTuple
+from copy import copy as shallow_copy
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from emell.neuralnetwork.embedding_layer import EmbeddingLayer
+from emell.neuralnetwork.execution_plan import ExecutionPlan
 from emell.neuralnetwork.input_layer import InputLayer
 from emell.neuralnetwork.layer import Layer
+from emell.neuralnetwork.profiler import Profiler
+from emell.sparse import CSRMatrix
 
+if TYPE_CHECKING:
+    from emell.optimizer.optimizer import Rows
 
-class Network:
+
+class Network:  # pylint: disable=too-many-instance-attributes
     """
     Represents a feedforward neural network.
 
@@ -16,7 +25,12 @@ class Network:
     https://www.bitlog.com/knowledge-base/machine-learning/feedforward-neural-network/
     """
 
-    def __init__(self, input_count: int):
+    def __init__(
+        self,
+        input_count: int,
+        flat_parameters: bool = False,
+        dtype: DTypeLike = np.float64,
+    ):
         """
         Initialize the network.
 
@@ -24,43 +38,374 @@ class Network:
         ----------
         input_count : int
             The size of the input.
+        flat_parameters : bool
+            Whether to store the parameters of every layer as views into one
+            contiguous array, with a matching contiguous gradient array. This
+            lets whole-network operations run as a single vectorized step.
+        dtype : np.dtype
+            The floating point type of every parameter, gradient and output in
+            the network. For instance, np.float32 halves the memory and
+            bandwidth needed compared to the default np.float64.
 
         """
         super().__init__()
-        self.layers: List[Layer] = [InputLayer(input_count)]
+        self.dtype = np.dtype(dtype)
+        self.layers: List[Layer] = [InputLayer(input_count, self.dtype)]
+
+        # The gradient of each parameter of each layer, filled in by
+        # backpropagation. Matches the order of Layer.get_parameters().
+        self.layer_gradients: List[List[np.ndarray]] = [[]]
+
+        # The rows or columns of each gradient that backpropagation last wrote,
+        # for embedding tables and for the weights of a layer with sparse
+        # input. None for gradients that may have been written in full.
+        self.layer_gradient_rows: List[List[Optional["Rows"]]] = [[]]
+
+        self.flat_parameters = flat_parameters
+        self.parameter_buffer: Optional[np.ndarray] = None
+        self.gradient_buffer: Optional[np.ndarray] = None
+
+        # Output buffers for predict(), grown to fit the largest batch seen.
+        # The views are cached so that a steady batch size allocates nothing.
+        self._prediction_buffers: List[np.ndarray] = []
+        self._prediction_views: List[Optional[np.ndarray]] = []
+
+        # Set by compile(), and rebuilt whenever the layers or buffers change.
+        self.plan: Optional[ExecutionPlan] = None
+
+        # Records each layer's forward and backward passes when set. Replicas
+        # share the profiler of the network they were made from.
+        self.profiler: Optional[Profiler] = None
 
     def add_layer(self, layer: Layer) -> None:
         """
         Add a layer to the network by appending it to be the last layer.
 
-        This has the side effect of initializing the input weights to the layer.
+        This has the side effect of initializing the input weights to the layer,
+        in the dtype of the network.
 
         Parameters
         ----------
         layer : Layer
-            The layer being appended to the network.
+            The layer being appended to the network. An EmbeddingLayer can only
+            be the first layer after the input.
 
         """
-        layer.add_weights(self.layers[-1].neuron_count)
+        if isinstance(layer, EmbeddingLayer) and len(self.layers) != 1:
+            raise ValueError("An embedding layer must come right after the input")
+
+        layer.add_weights(self.layers[-1].neuron_count, self.dtype)
         self.layers.append(layer)
+        self.layer_gradients.append(
+            [np.zeros_like(parameter) for parameter in layer.get_parameters()]
+        )
+        self.layer_gradient_rows.append(self._initial_gradient_rows(layer))
+        if self.flat_parameters:
+            self._flatten_parameters()
+        self._prediction_buffers = []
+        self._prediction_views = []
+        self._recompile()
+
+    def compile(self, max_batch_size: int) -> ExecutionPlan:
+        """
+        Freeze the network into an execution plan for faster steps.
+
+        Once compiled, `predict` and backpropagation run through the plan for
+        batches of up to `max_batch_size` examples. The plan is rebuilt when a
+        layer is added or the parameters are moved into other buffers.
+
+        Parameters
+        ----------
+        max_batch_size : int
+            The largest batch that the plan allocates buffers for.
+
+        Returns
+        -------
+        The execution plan, which is also kept as `plan`.
+
+        """
+        self.plan = ExecutionPlan(self, max_batch_size)
+        return self.plan
+
+    def parameters(self) -> List[np.ndarray]:
+        """
+        Get the trainable parameters of the network.
+
+        Returns
+        -------
+        A single contiguous array if the network has flat parameters.
+        Otherwise, the parameter arrays of each layer in order.
 
-    def compute(self, network_input: np.ndarray) -> "Network.Result":
+        """
+        if self.parameter_buffer is not None:
+            return [self.parameter_buffer]
+
+        return [
+            parameter for layer in self.layers for parameter in layer.get_parameters()
+        ]
+
+    def gradients(self) -> List[np.ndarray]:
+        """
+        Get the gradient buffers of the network.
+
+        Returns
+        -------
+        Arrays matching the shapes and order of `parameters`.
+
+        """
+        if self.gradient_buffer is not None:
+            return [self.gradient_buffer]
+
+        return [
+            gradient for gradients in self.layer_gradients for gradient in gradients
+        ]
+
+    def gradient_rows(self) -> Optional[List[Optional["Rows"]]]:
+        """
+        Get the rows or columns of each gradient that can be nonzero.
+
+        The gradients are still correct in full, as the entries that are not
+        listed are zero, so an optimizer can either update just the listed
+        entries or all of them.
+
+        Returns
+        -------
+        For each array of `gradients`, None if any of it can be nonzero.
+        Otherwise, the rows of an embedding table that backpropagation last
+        wrote, or the columns of the weights of a layer with sparse input, as
+        a full slice and the columns. None instead of the list if every
+        gradient can be nonzero, which is always the case with flat
+        parameters.
+
+        """
+        if self.gradient_buffer is not None:
+            return None
+
+        rows = [row for rows in self.layer_gradient_rows for row in rows]
+        if all(row is None for row in rows):
+            return None
+
+        return rows
+
+    def replicate(self) -> "Network":
+        """
+        Make a replica of the network that shares its parameters.
+
+        The replica has its own gradients and output buffers, so it can be
+        trained on a different thread, with every update landing in the
+        parameters of this network.
+
+        Returns
+        -------
+        A network with the same layers, whose parameters are the same arrays.
+
+        """
+        # pylint: disable=protected-access
+        replica = shallow_copy(self)
+        replica.layers = [shallow_copy(layer) for layer in self.layers]
+        replica.layer_gradients = [
+            [np.zeros_like(gradient) for gradient in gradients]
+            for gradients in self.layer_gradients
+        ]
+        replica.layer_gradient_rows = [
+            self._initial_gradient_rows(layer) for layer in self.layers
+        ]
+        replica._prediction_buffers = []
+        replica._prediction_views = []
+        if self.parameter_buffer is not None:
+            replica._bind_flat_buffers(
+                self.parameter_buffer, np.zeros_like(self.parameter_buffer), False
+            )
+        replica._recompile()
+        return replica
+
+    def set_flat_buffers(
+        self,
+        parameter_buffer: np.ndarray,
+        gradient_buffer: np.ndarray,
+        copy: bool = True,
+    ) -> None:
+        """
+        Move the flat parameters and gradients into the given arrays.
+
+        Every layer's parameters and gradients become views into the new
+        arrays, so they can live in memory that is shared between processes,
+        or in a memory-mapped file. A network without flat parameters gets
+        them from then on.
+
+        Parameters
+        ----------
+        parameter_buffer : np.ndarray
+            The 1D array to hold the parameters. Must have one element of the
+            network's dtype for each parameter.
+        gradient_buffer : np.ndarray
+            The array to hold the gradients, of the same shape and dtype.
+        copy : bool
+            Whether to copy the current parameters into the new array. If not,
+            the network takes on whatever values the array already holds.
+
+        """
+        size = sum(parameter.size for parameter in self.parameters())
+        for buffer in (parameter_buffer, gradient_buffer):
+            if buffer.shape != (size,) or buffer.dtype != self.dtype:
+                raise ValueError("The buffers must match the shape and dtype")
+
+        self.flat_parameters = True
+        self._bind_flat_buffers(parameter_buffer, gradient_buffer, copy)
+
+    @staticmethod
+    def _initial_gradient_rows(layer: Layer) -> List[Optional["Rows"]]:
+        """
+        Get the rows of the gradients of a layer before backpropagation.
+
+        An embedding table has no rows written yet. Other gradients start as
+        if they were written in full.
+        """
+        if isinstance(layer, EmbeddingLayer):
+            return [np.empty(0, np.intp) for _ in layer.get_parameters()]
+
+        return [None for _ in layer.get_parameters()]
+
+    def _flatten_parameters(self) -> None:
+        """
+        Move every layer's parameters and gradients into contiguous buffers.
+
+        Called each time a layer is added, as that changes the buffer sizes.
+        """
+        size = sum(
+            parameter.size
+            for layer in self.layers
+            for parameter in layer.get_parameters()
+        )
+        self._bind_flat_buffers(
+            np.empty(size, self.dtype), np.zeros(size, self.dtype), True
+        )
+
+    def _bind_flat_buffers(
+        self, parameter_buffer: np.ndarray, gradient_buffer: np.ndarray, copy: bool
+    ) -> None:
+        """Make every parameter and gradient a view into the flat buffers."""
+        offset = 0
+        for layer, gradients, gradient_rows in zip(
+            self.layers, self.layer_gradients, self.layer_gradient_rows
+        ):
+            gradient_rows[:] = self._initial_gradient_rows(layer)
+            parameter_views = []
+            for index, parameter in enumerate(layer.get_parameters()):
+                end = offset + parameter.size
+                parameter_view = parameter_buffer[offset:end].reshape(parameter.shape)
+                if copy:
+                    parameter_view[...] = parameter
+                parameter_views.append(parameter_view)
+                gradients[index] = gradient_buffer[offset:end].reshape(parameter.shape)
+                offset = end
+            layer.set_parameters(parameter_views)
+
+        self.parameter_buffer = parameter_buffer
+        self.gradient_buffer = gradient_buffer
+        self._recompile()
+
+    def _recompile(self) -> None:
+        """Rebuild the execution plan, if the network has been compiled."""
+        if self.plan is not None:
+            self.plan = ExecutionPlan(self, self.plan.max_batch_size)
+
+    def compute(self, network_input: Union[np.ndarray, CSRMatrix]) -> "Network.Result":
         """
         Compute the output for the network.
 
         Parameters
         ----------
-        network_input : np.ndarray
-            The input to the network.
+        network_input : np.ndarray or CSRMatrix
+            The input to the network. Either a single example vector or a
+            (batch, inputs) matrix of examples, which may be sparse. The first
+            layer only reads the weights of the nonzero inputs of a sparse
+            batch.
 
         """
-        intermediate = network_input
+        intermediate: Union[np.ndarray, CSRMatrix] = network_input
         results = []
-        for layer in self.layers:
-            result = layer.compute(intermediate)
+        profiler = self.profiler
+        for index, layer in enumerate(self.layers):
+            if profiler is None:
+                result = layer.compute(intermediate)
+            else:
+                result = profiler.measure(
+                    index,
+                    Profiler.FORWARD,
+                    layer,
+                    intermediate,
+                    layer.compute,
+                    intermediate,
+                )
             intermediate = result.output
             results.append(result)
-        return Network.Result(results, intermediate)
+        return Network.Result(results, np.asarray(intermediate))
+
+    def predict(self, network_input: Union[np.ndarray, CSRMatrix]) -> np.ndarray:
+        """
+        Compute the output for a batch of inputs, for inference only.
+
+        Unlike `compute`, no intermediate results are kept for
+        backpropagation. Each layer writes into an output buffer owned by the
+        network, so repeated calls do not allocate new arrays. The returned
+        array is one of those buffers, and is overwritten by the next call.
+
+        Parameters
+        ----------
+        network_input : np.ndarray or CSRMatrix
+            The (batch, inputs) input to the network.
+
+        """
+        if self.plan is not None and network_input.shape[0] <= (
+            self.plan.max_batch_size
+        ):
+            return self.plan.predict(network_input)
+
+        intermediate: Union[np.ndarray, CSRMatrix] = network_input
+        profiler = self.profiler
+        for index, (layer, out) in enumerate(
+            zip(self.layers, self._get_prediction_views(network_input.shape[0]))
+        ):
+            if profiler is None:
+                intermediate = layer.predict(intermediate, out)
+            else:
+                intermediate = profiler.measure(
+                    index,
+                    Profiler.FORWARD,
+                    layer,
+                    intermediate,
+                    layer.predict,
+                    intermediate,
+                    out,
+                )
+        return np.asarray(intermediate)
+
+    def _get_prediction_views(self, batch_size: int) -> List[Optional[np.ndarray]]:
+        """
+        Get an output buffer of the given batch size for each layer.
+
+        The input layer does not need a buffer, so its entry is None.
+        """
+        if self._prediction_views and (
+            self._prediction_views[-1] is not None
+            and self._prediction_views[-1].shape[0] == batch_size
+        ):
+            return self._prediction_views
+
+        if not self._prediction_buffers or (
+            self._prediction_buffers[0].shape[0] < batch_size
+        ):
+            self._prediction_buffers = [
+                np.empty((batch_size, layer.neuron_count), self.dtype)
+                for layer in self.layers[1:]
+            ]
+
+        self._prediction_views = [None]
+        self._prediction_views.extend(
+            buffer[:batch_size] for buffer in self._prediction_buffers
+        )
+        return self._prediction_views
 
     class Result(NamedTuple):
         """Represents the result of computation over the entire network."""
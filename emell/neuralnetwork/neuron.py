@@ -1,10 +1,11 @@
 """Contains the Neuron class for building neural network architectures."""
 
-from random import random
-from typing import Callable
+from typing import Callable, Optional
 
 import numpy as np
 
+from emell.initializer.initializer import Seed
+
 
 class Neuron:
     """
@@ -22,7 +23,8 @@ class Neuron:
         self,
         number_of_inputs: int,
         activation_function: Callable[[float], float],
-        random_function: Callable[[], float] = random,
+        random_function: Optional[Callable[[], float]] = None,
+        seed: Seed = None,
     ):
         """
         Construct a neuron.
@@ -33,8 +35,11 @@ class Neuron:
             The number of input values to the network.
         activation_function : function(float) -> float
             Applied to the sum of the weights and bias.
-        random_function : function() -> float
-            Injected function to provide values in the range [0.0 and 1.0]
+        random_function : function() -> float, optional
+            Injected function to provide values in the range [0.0 and 1.0]. If
+            not given, all the values are drawn at once from a numpy generator.
+        seed : int or np.random.Generator, optional
+            Seeds the generator that is used without a random_function.
 
         """
         super().__init__()
@@ -43,8 +48,15 @@ class Neuron:
 
         self.number_of_inputs = number_of_inputs
         self.activation_function = activation_function
-        self.weights = np.array([random_function() for i in range(number_of_inputs)])
-        self.bias = random_function()
+        if random_function is None:
+            values = np.random.default_rng(seed).random(number_of_inputs + 1)
+            self.weights = values[:number_of_inputs]
+            self.bias = float(values[number_of_inputs])
+        else:
+            self.weights = np.array(
+                [random_function() for i in range(number_of_inputs)]
+            )
+            self.bias = random_function()
 
     def compute(self, inputs: np.ndarray) -> float:
         """
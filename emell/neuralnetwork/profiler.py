@@ -0,0 +1,287 @@
+"""Contains a profiler for the forward and backward passes of each layer."""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, Union
+
+import numpy as np
+
+from emell.neuralnetwork.dense_layer import DenseLayer
+from emell.neuralnetwork.layer import Layer
+from emell.sparse import CSRMatrix
+
+T = TypeVar("T")
+
+
+class Profiler:
+    """
+    Records the wall time, FLOPs and bytes touched of each layer.
+
+    Attach a profiler to a network with `network.profiler = Profiler()`.
+    `Network.compute`, `Network.predict`, the execution plan and
+    `Backpropagation` then time each layer's forward and backward pass. While
+    `network.profiler` is None, each layer costs one check of it and nothing
+    else.
+
+    Calls are aggregated per layer and pass, including a histogram of their
+    durations in power-of-two buckets of microseconds. The most recent calls
+    are also kept as events for a Chrome trace, which can be opened in
+    chrome://tracing or Perfetto.
+
+    FLOPs and bytes are estimates for dense layers: the matrix products, bias
+    and activation, and one read or write of each array involved. Other layers
+    only count the bytes of their input and output.
+    """
+
+    FORWARD = "forward"
+    BACKWARD = "backward"
+
+    def __init__(
+        self, max_events: int = 100000, clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize the profiler.
+
+        Parameters
+        ----------
+        max_events : int
+            The number of calls to keep for the Chrome trace. Later calls are
+            still aggregated.
+        clock : function() -> float
+            Returns the current time in seconds.
+
+        """
+        super().__init__()
+        self.max_events = max_events
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._origin = clock()
+        self._stats: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._events: List[Dict[str, Any]] = []
+
+    def measure(
+        self,
+        index: int,
+        phase: str,
+        layer: Layer,
+        layer_input: Union[np.ndarray, CSRMatrix],
+        function: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """
+        Call a function that runs one pass of a layer, and record it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the layer in the network.
+        phase : str
+            Profiler.FORWARD or Profiler.BACKWARD.
+        layer : Layer
+            The layer, which the costs are estimated from.
+        layer_input : np.ndarray or CSRMatrix
+            The input to the pass, which the batch size is taken from.
+        function : function(*args) -> Any
+            Runs the pass.
+        args : Any
+            The arguments of the function.
+
+        Returns
+        -------
+        The result of the function.
+
+        """
+        batch_size = layer_input.shape[0] if layer_input.ndim == 2 else 1
+        start = self.clock()
+        result = function(*args)
+        self.record(index, phase, layer, batch_size, start, self.clock() - start)
+        return result
+
+    def record(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        index: int,
+        phase: str,
+        layer: Layer,
+        batch_size: int,
+        start: float,
+        duration: float,
+    ) -> None:
+        """
+        Record one pass of a layer.
+
+        Parameters
+        ----------
+        index : int
+            The index of the layer in the network.
+        phase : str
+            Profiler.FORWARD or Profiler.BACKWARD.
+        layer : Layer
+            The layer, which the costs are estimated from.
+        batch_size : int
+            The number of examples in the pass.
+        start : float
+            The time that the pass started, from the clock.
+        duration : float
+            The length of the pass in seconds.
+
+        """
+        flops, bytes_touched = self.cost(layer, batch_size, phase, index > 1)
+        bucket = str(2 ** int(duration * 1e6).bit_length())
+        with self._lock:
+            stats = self._stats.get((index, phase))
+            if stats is None:
+                stats = {
+                    "layer": index,
+                    "type": type(layer).__name__,
+                    "phase": phase,
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "min_seconds": duration,
+                    "max_seconds": duration,
+                    "flops": 0,
+                    "bytes": 0,
+                    "histogram_us": {},
+                }
+                self._stats[(index, phase)] = stats
+            stats["calls"] += 1
+            stats["seconds"] += duration
+            stats["min_seconds"] = min(stats["min_seconds"], duration)
+            stats["max_seconds"] = max(stats["max_seconds"], duration)
+            stats["flops"] += flops
+            stats["bytes"] += bytes_touched
+            stats["histogram_us"][bucket] = stats["histogram_us"].get(bucket, 0) + 1
+
+            if len(self._events) < self.max_events:
+                self._events.append(
+                    {
+                        "name": f"{type(layer).__name__} {index} {phase}",
+                        "cat": phase,
+                        "ph": "X",
+                        "ts": (start - self._origin) * 1e6,
+                        "dur": duration * 1e6,
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                        "args": {
+                            "batch_size": batch_size,
+                            "flops": flops,
+                            "bytes": bytes_touched,
+                        },
+                    }
+                )
+
+    @staticmethod
+    def cost(
+        layer: Layer, batch_size: int, phase: str, propagate: bool = True
+    ) -> Tuple[int, int]:
+        """
+        Estimate the FLOPs and bytes touched by one pass of a layer.
+
+        Parameters
+        ----------
+        layer : Layer
+            The layer.
+        batch_size : int
+            The number of examples in the pass.
+        phase : str
+            Profiler.FORWARD or Profiler.BACKWARD.
+        propagate : bool
+            Whether a backward pass also computes the error of the layer
+            before it.
+
+        Returns
+        -------
+        The FLOPs and the bytes.
+
+        """
+        itemsize = layer.dtype.itemsize
+        outputs = batch_size * layer.neuron_count
+        if not isinstance(layer, DenseLayer):
+            return 0, 2 * outputs * itemsize
+
+        weights = layer.get_weights().size
+        inputs = batch_size * layer.get_weights().shape[1]
+        if phase == Profiler.FORWARD:
+            # The product with the weights, the bias and the activation. Reads
+            # the input, weights and bias, and writes two outputs.
+            flops = 2 * batch_size * weights + 2 * outputs
+            elements = inputs + weights + layer.neuron_count + 2 * outputs
+        else:
+            # The weight and bias gradients, and optionally the error of the
+            # previous layer. Reads the error, input and weights, and writes
+            # the gradients.
+            flops = 2 * batch_size * weights + outputs
+            elements = outputs + inputs + 2 * weights + layer.neuron_count
+            if propagate:
+                flops += 2 * batch_size * weights + inputs
+                elements += inputs
+        return flops, elements * itemsize
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Get the aggregated statistics of each layer and pass.
+
+        Returns
+        -------
+        One dictionary per layer and pass, ordered by layer and then phase,
+        that can be serialized as JSON. Besides the totals, each has the FLOPs
+        and bytes per second, and the histogram of call durations. The
+        histogram maps the exclusive upper bound of each bucket, in
+        microseconds, to the number of calls.
+
+        """
+        with self._lock:
+            summary = []
+            for key in sorted(self._stats):
+                stats = dict(self._stats[key])
+                stats["histogram_us"] = dict(stats["histogram_us"])
+                seconds = max(stats["seconds"], 1e-12)
+                stats["flops_per_second"] = stats["flops"] / seconds
+                stats["bytes_per_second"] = stats["bytes"] / seconds
+                summary.append(stats)
+            return summary
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Get the recorded calls in the Chrome trace event format.
+
+        Returns
+        -------
+        A dictionary that can be serialized as JSON.
+
+        """
+        with self._lock:
+            return {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str) -> None:
+        """
+        Write the summary to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """
+        Write the Chrome trace to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def clear(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
@@ -0,0 +1,163 @@
+"""Contains tests for allocation_tracker.py"""
+
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from emell.activation import Identity, ReLU
+from emell.computation import delta_quadratic_loss, quadratic_loss
+from emell.initializer import Normal
+from emell.neuralnetwork import AllocationTracker, Backpropagation, DenseLayer, Network
+from emell.testutil import assert_no_allocations
+
+
+def make_network() -> Network:
+    """Make a network with a wide hidden layer."""
+    network = Network(64)
+    network.add_layer(DenseLayer(256, ReLU(), initializer=Normal(seed=0)))
+    network.add_layer(DenseLayer(2, Identity(), initializer=Normal(seed=1)))
+    return network
+
+
+# Measuring memory needs Python 3.9 or later.
+RESETS_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class AllocationTrackerTest(unittest.TestCase):
+    """Tests for the AllocationTracker class."""
+
+    @unittest.skipUnless(RESETS_PEAK, "Needs tracemalloc.reset_peak")
+    def test_step(self) -> None:
+        """Checks that a training step reports the arrays of each layer."""
+        network = make_network()
+        tracker = AllocationTracker()
+        network.profiler = tracker
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        x = np.ones((32, 64))
+        y = np.ones((32, 2))
+
+        with tracker.step("train") as step:
+            backpropagation.train_batch(x, y)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual([step], tracker.steps())
+        self.assertEqual("train", step["name"])
+
+        # The hidden layer allocates at least its weighted output and output.
+        layers = {(layer["layer"], layer["phase"]): layer for layer in step["layers"]}
+        self.assertGreaterEqual(
+            layers[(1, "forward")]["allocated_bytes"], 2 * 32 * 256 * 8
+        )
+        self.assertGreaterEqual(
+            step["allocated_bytes"], layers[(1, "forward")]["allocated_bytes"]
+        )
+
+        summary = {
+            (stats["layer"], stats["phase"]): stats for stats in tracker.summary()
+        }
+        self.assertEqual(
+            layers[(1, "forward")]["allocated_bytes"],
+            summary[(1, "forward")]["allocated_bytes"],
+        )
+        self.assertEqual(1, summary[(1, "forward")]["calls"])
+
+    @unittest.skipUnless(RESETS_PEAK, "Needs tracemalloc.reset_peak")
+    def test_untraced(self) -> None:
+        """Checks that passes outside of tracing only record time."""
+        network = make_network()
+        tracker = AllocationTracker()
+        network.profiler = tracker
+        network.compute(np.ones((2, 64)))
+
+        with tracker:
+            self.assertTrue(tracemalloc.is_tracing())
+            network.compute(np.ones((2, 64)))
+        self.assertFalse(tracemalloc.is_tracing())
+
+        stats = tracker.summary()[1]
+        self.assertEqual(2, stats["calls"])
+        self.assertGreater(stats["allocated_bytes"], 0)
+        self.assertEqual(stats["allocated_bytes"], stats["peak_bytes"])
+        self.assertEqual([], tracker.steps())
+
+        with self.assertRaises(ValueError):
+            with tracker.step("outer"):
+                with tracker.step("inner"):
+                    pass
+
+    @unittest.skipUnless(RESETS_PEAK, "Needs tracemalloc.reset_peak")
+    def test_export(self) -> None:
+        """Checks that the summary and steps are written as JSON."""
+        network = make_network()
+        tracker = AllocationTracker()
+        network.profiler = tracker
+        with tracker.step("predict"):
+            network.predict(np.ones((2, 64)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "memory.json")
+            tracker.write_json(path)
+            with open(path, encoding="utf-8") as file:
+                report = json.load(file)
+        self.assertEqual(tracker.summary(), report["layers"])
+        self.assertEqual(tracker.steps(), report["steps"])
+
+        tracker.clear()
+        self.assertEqual([], tracker.summary())
+        self.assertEqual([], tracker.steps())
+
+    @unittest.skipUnless(RESETS_PEAK, "Needs tracemalloc.reset_peak")
+    def test_assert_no_allocations(self) -> None:
+        """Checks that allocating steps fail, and compiled steps pass."""
+        network = make_network()
+        x = np.ones((64, 64))
+        # Any new array of the hidden layer would be at least 64 * 256 * 8
+        # bytes. Adding its bias may use NumPy's iteration buffer, which is
+        # capped at 8192 elements.
+        max_bytes = 64 * 256 * 8 - 1
+        with self.assertRaisesRegex(AssertionError, "layer 1 forward"):
+            assert_no_allocations(
+                lambda: network.compute(x), max_bytes=max_bytes, network=network
+            )
+        self.assertIsNone(network.profiler)
+
+        with self.assertRaises(AssertionError):
+            assert_no_allocations(lambda: np.ones(1))
+
+        network.compile(64)
+        assert_no_allocations(
+            lambda: network.predict(x), max_bytes=max_bytes, network=network
+        )
+
+    def test_unsupported(self) -> None:
+        """Checks that Pythons without reset_peak only profile time."""
+        network = make_network()
+        tracker = AllocationTracker()
+        network.profiler = tracker
+        with mock.patch("emell.neuralnetwork.allocation_tracker._RESETS_PEAK", False):
+            with self.assertRaises(RuntimeError):
+                tracker.start()
+            with self.assertRaises(RuntimeError):
+                with tracker.step("predict"):
+                    pass
+
+            tracemalloc.start()
+            try:
+                network.compute(np.ones((2, 64)))
+            finally:
+                tracemalloc.stop()
+
+        stats = tracker.summary()[1]
+        self.assertEqual(1, stats["calls"])
+        self.assertEqual(0, stats["allocated_bytes"])
+        self.assertEqual([], tracker.steps())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,24 @@
 """Contains tests for backpropagation.py"""
 
 import unittest
+from typing import Callable
 
 import numpy as np
 
-from emell.computation import delta_quadratic_loss, quadratic_loss, relu, relu_prime
-from emell.neuralnetwork import Backpropagation, DenseLayer, Network
+from emell.activation import Identity, Softmax, Tanh
+from emell.computation import (
+    constant,
+    delta_quadratic_loss,
+    identity,
+    quadratic_loss,
+    relu,
+    relu_prime,
+)
+from emell.initializer import Normal
+from emell.loss import HuberLoss, QuadraticLoss, SoftmaxCrossEntropyLoss
+from emell.neuralnetwork import Backpropagation, DenseLayer, EmbeddingLayer, Network
+from emell.optimizer import SGD, Adam
+from emell.sparse import CSRMatrix
 from emell.testutil import make_random_function
 
 
@@ -63,6 +76,474 @@ class BackpropagationTest(unittest.TestCase):
             backpropagation.train(network_input, expected), np.array([6023.077231])
         )
 
+    def test_train_batch(self) -> None:
+        """Checks a mini-batch step against gradients averaged by hand."""
+        network = Network(2)
+        layer = DenseLayer(
+            1,
+            identity,
+            constant(np.ones(1)),
+            random_function=make_random_function([0, 0]),
+        )
+        network.add_layer(layer)
+
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        network_input = np.array([[1.0, 2.0], [3.0, 4.0]])
+        expected = np.array([[1.0], [2.0]])
+
+        # The network outputs zeros, so the errors are just -expected.
+        np.testing.assert_allclose(
+            backpropagation.train_batch(network_input, expected),
+            np.array([(0.5 * 1 + 0.5 * 4) / 2]),
+        )
+        np.testing.assert_allclose(
+            layer.get_weights(),
+            0.1 * np.array([[(1 * 1 + 2 * 3) / 2, (1 * 2 + 2 * 4) / 2]]),
+        )
+        np.testing.assert_allclose(layer.bias, 0.1 * np.array([(1 + 2) / 2]))
+
+    def test_train_batch_hidden_layer(self) -> None:
+        """Checks that the gradients of a hidden layer match finite differences."""
+        network = Network(2)
+        random_function = make_random_function([10, 20, 30, 40, 50, 60, 70, 80, 90])
+        layer1 = DenseLayer(3, relu, relu_prime, random_function=random_function)
+        layer2 = DenseLayer(1, relu, relu_prime, random_function=random_function)
+        network.add_layer(layer1)
+        network.add_layer(layer2)
+
+        network_input = np.array([[1.0, -2.0], [3.0, 1.0], [-1.0, 2.0]])
+        expected = np.array([[1.0], [0.0], [2.0]])
+
+        def mean_loss() -> float:
+            output = network.compute(network_input).output
+            return float(np.mean(quadratic_loss(output, expected)))
+
+        # Estimate the gradient of the first layer numerically.
+        weights = layer1.get_weights()
+        numerical = self._numerical_gradient(mean_loss, weights)
+
+        original_weights = weights.copy()
+        alpha = 0.01
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, alpha
+        )
+        backpropagation.train_batch(network_input, expected)
+
+        np.testing.assert_allclose(
+            original_weights - alpha * numerical, layer1.get_weights(), rtol=1e-5
+        )
+
+    def test_train_batch_converges(self) -> None:
+        """Learns to add two numbers from mini-batches."""
+        network = Network(2)
+        layer = DenseLayer(1, identity, constant(np.ones(1)))
+        network.add_layer(layer)
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.01
+        )
+
+        generator = np.random.default_rng(0)
+        for _ in range(1000):
+            network_input = generator.uniform(-5, 5, size=(16, 2))
+            expected = np.sum(network_input, axis=1, keepdims=True)
+            loss = backpropagation.train_batch(network_input, expected)
+
+        self.assertLess(float(loss[0]), 1e-6)
+        np.testing.assert_allclose(layer.get_weights(), [[1, 1]], atol=1e-3)
+
+    def test_train_batch_flat_parameters(self) -> None:
+        """Checks that flat parameters train the same as per-layer ones."""
+        networks = []
+        for flat_parameters in (False, True):
+            network = Network(2, flat_parameters=flat_parameters)
+            random_function = make_random_function([10, 20, 30, 40, 50, 60, 70, 80, 90])
+            network.add_layer(
+                DenseLayer(3, relu, relu_prime, random_function=random_function)
+            )
+            network.add_layer(
+                DenseLayer(1, relu, relu_prime, random_function=random_function)
+            )
+            backpropagation = Backpropagation(
+                network, quadratic_loss, delta_quadratic_loss, 0.01
+            )
+            for _ in range(3):
+                backpropagation.train_batch(
+                    np.array([[1.0, -2.0], [3.0, 1.0]]), np.array([[1.0], [0.0]])
+                )
+            networks.append(network)
+
+        np.testing.assert_allclose(
+            np.concatenate([p.ravel() for p in networks[0].parameters()]),
+            networks[1].parameters()[0],
+        )
+
+    def test_compute_gradients(self) -> None:
+        """Checks that gradients are computed without changing the network."""
+        network = Network(2)
+        layer = DenseLayer(
+            1,
+            identity,
+            constant(np.ones(1)),
+            random_function=make_random_function([0, 0]),
+        )
+        network.add_layer(layer)
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+
+        backpropagation.compute_gradients(
+            np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([[1.0], [2.0]])
+        )
+        np.testing.assert_array_equal(np.zeros((1, 2)), layer.get_weights())
+        np.testing.assert_array_equal(np.zeros(1), layer.bias)
+        weight_gradient, bias_gradient = network.gradients()
+        np.testing.assert_allclose(np.array([[-3.5, -5.0]]), weight_gradient)
+        np.testing.assert_allclose(np.array([-1.5]), bias_gradient)
+
+    def test_train_batch_optimizer(self) -> None:
+        """Checks that the given optimizer updates the network."""
+        network = Network(2, flat_parameters=True)
+        layer = DenseLayer(1, identity, constant(np.ones(1)))
+        network.add_layer(layer)
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0, optimizer=Adam(0.05)
+        )
+
+        generator = np.random.default_rng(0)
+        for _ in range(2000):
+            network_input = generator.uniform(-5, 5, size=(16, 2))
+            expected = 0.5 * network_input[:, :1] + network_input[:, 1:] + 1
+            backpropagation.train_batch(network_input, expected)
+
+        np.testing.assert_allclose(layer.get_weights(), [[0.5, 1]], atol=1e-2)
+        np.testing.assert_allclose(layer.bias, [1], atol=1e-2)
+
+    def test_train_batch_dtype(self) -> None:
+        """Checks that training a float32 network keeps it in float32."""
+        network = Network(2, flat_parameters=True, dtype=np.float32)
+        network.add_layer(DenseLayer(3, relu, relu_prime))
+        network.add_layer(DenseLayer(1, identity, constant(np.ones(1, np.float32))))
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0, optimizer=Adam(0.01)
+        )
+
+        loss = backpropagation.train_batch(
+            np.array([[1, 2], [3, 4]]), np.array([[3.0], [7.0]])
+        )
+        self.assertEqual(np.float32, loss.dtype)
+        self.assertEqual(np.float32, network.parameters()[0].dtype)
+        self.assertEqual(np.float32, network.gradients()[0].dtype)
+
+    def test_train_batch_errors(self) -> None:
+        """Checks that malformed batches are rejected."""
+        network = Network(2)
+        network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.01
+        )
+
+        with self.assertRaises(ValueError):
+            backpropagation.train_batch(np.array([1, 2]), np.array([3]))
+
+        with self.assertRaises(ValueError):
+            backpropagation.train_batch(
+                np.array([[1, 2], [3, 4]]), np.array([[3], [7], [11]])
+            )
+
+    def test_loss(self) -> None:
+        """Checks that a Loss trains the same as the plain loss functions."""
+        gradients = []
+        for loss_function, loss_delta_function in (
+            (quadratic_loss, delta_quadratic_loss),
+            (QuadraticLoss(), None),
+        ):
+            network = Network(2)
+            random_function = make_random_function([10, 20, 30, 40, 50, 60, 70, 80, 90])
+            network.add_layer(
+                DenseLayer(3, relu, relu_prime, random_function=random_function)
+            )
+            network.add_layer(
+                DenseLayer(1, relu, relu_prime, random_function=random_function)
+            )
+            backpropagation = Backpropagation(
+                network, loss_function, loss_delta_function, 0.01
+            )
+            loss = backpropagation.compute_gradients(
+                np.array([[1.0, -2.0], [3.0, 1.0]]), np.array([[1.0], [0.0]])
+            )
+            gradients.append([loss] + [g.copy() for g in network.gradients()])
+
+        for expected, actual in zip(*gradients):
+            np.testing.assert_allclose(expected, actual)
+
+    def test_loss_errors(self) -> None:
+        """Checks that losses that can't be trained on are rejected."""
+        network = Network(2)
+        network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+
+        with self.assertRaises(ValueError):
+            Backpropagation(network, HuberLoss(reduction="sum"), None, 0.01)
+
+        with self.assertRaises(ValueError):
+            Backpropagation(network, quadratic_loss, None, 0.01)
+
+        backpropagation = Backpropagation(network, HuberLoss(), None, 0.01)
+        with self.assertRaises(ValueError):
+            backpropagation.train(np.array([1.0, 2.0]), np.array([3.0]))
+
+    def test_softmax_cross_entropy(self) -> None:
+        """Checks that a softmax classifier learns separable classes."""
+        generator = np.random.default_rng(0)
+        centers = np.array([[4.0, 0.0], [-4.0, 0.0], [0.0, 4.0]])
+        labels = generator.integers(0, 3, size=300)
+        network_input = centers[labels] + generator.normal(size=(300, 2))
+        expected = np.eye(3)[labels]
+
+        for compile_network in (False, True):
+            network = Network(2)
+            network.add_layer(DenseLayer(8, Tanh(), initializer=Normal(seed=1)))
+            network.add_layer(DenseLayer(3, Softmax(), initializer=Normal(seed=2)))
+            if compile_network:
+                network.compile(30)
+            backpropagation = Backpropagation(
+                network, SoftmaxCrossEntropyLoss(), None, 0.5
+            )
+
+            # The gradient matches finite differences of the mean cross-entropy.
+            backpropagation.compute_gradients(network_input[:30], expected[:30])
+            np.testing.assert_allclose(
+                self._cross_entropy_bias_gradient(
+                    network, network_input[:30], expected[:30]
+                ),
+                network.gradients()[3],
+                rtol=1e-5,
+            )
+
+            for _ in range(20):
+                for start in range(0, 300, 30):
+                    backpropagation.train_batch(
+                        network_input[start : start + 30], expected[start : start + 30]
+                    )
+
+            predictions = np.argmax(network.predict(network_input), axis=1)
+            self.assertGreater(np.mean(predictions == labels), 0.95)
+            np.testing.assert_allclose(
+                np.ones(300), np.sum(network.predict(network_input), axis=1)
+            )
+
+    def test_sparse_input(self) -> None:
+        """Checks that sparse batches get the same gradients as dense ones."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(8, 50))
+        x[rng.random(size=x.shape) < 0.9] = 0
+        x[3] = 0
+        y = rng.normal(size=(8, 2))
+        sparse = CSRMatrix.from_dense(x)
+
+        for compile_batch_size in (None, 8):
+            gradients = []
+            for network_input in (x, sparse):
+                network = Network(50)
+                network.add_layer(DenseLayer(6, Tanh(), initializer=Normal(seed=0)))
+                network.add_layer(DenseLayer(2, Tanh(), initializer=Normal(seed=1)))
+                if compile_batch_size is not None:
+                    network.compile(compile_batch_size)
+                backpropagation = Backpropagation(network, QuadraticLoss(), None, 0.1)
+                loss = backpropagation.compute_gradients(network_input, y)
+                gradients.append([loss] + [g.copy() for g in network.gradients()])
+                np.testing.assert_allclose(
+                    network.predict(x), network.predict(network_input)
+                )
+
+            for dense_gradient, sparse_gradient in zip(*gradients):
+                np.testing.assert_allclose(dense_gradient, sparse_gradient, atol=1e-12)
+
+            # Columns without any nonzero input get no gradient.
+            weight_gradient = gradients[1][1]
+            unused = ~np.any(x, axis=0)
+            self.assertTrue(np.any(unused))
+            np.testing.assert_array_equal(0, weight_gradient[:, unused])
+
+    def test_sparse_gradient_columns(self) -> None:
+        """Checks that only the columns of sparse inputs are zeroed and stepped."""
+        rng = np.random.default_rng(0)
+        first = np.zeros((4, 10))
+        first[:, [1, 4]] = rng.normal(size=(4, 2))
+        second = np.zeros((4, 10))
+        second[:, [4, 7]] = rng.normal(size=(4, 2))
+        y = rng.normal(size=(4, 2))
+
+        for compile_batch_size in (None, 4):
+            network = Network(10)
+            network.add_layer(DenseLayer(3, Tanh(), initializer=Normal(seed=0)))
+            network.add_layer(DenseLayer(2, Tanh(), initializer=Normal(seed=1)))
+            if compile_batch_size is not None:
+                network.compile(compile_batch_size)
+            backpropagation = Backpropagation(network, QuadraticLoss(), None, 0.1)
+            self.assertIsNone(network.gradient_rows())
+
+            backpropagation.compute_gradients(CSRMatrix.from_dense(first), y)
+            rows = network.gradient_rows()
+            assert rows is not None and isinstance(rows[0], tuple)
+            self.assertEqual([None, None, None], rows[1:])
+            column_slice, columns = rows[0]
+            self.assertEqual(slice(None), column_slice)
+            np.testing.assert_array_equal([1, 4], columns)
+
+            # The columns of the first batch are zeroed before the second.
+            weights = network.layers[1].get_weights().copy()
+            backpropagation.train_batch(CSRMatrix.from_dense(second), y)
+            weight_gradient = network.gradients()[0]
+            np.testing.assert_array_equal(0, weight_gradient[:, [0, 1, 2, 3, 5, 6]])
+            self.assertTrue(np.all(weight_gradient[:, [4, 7]]))
+            np.testing.assert_array_equal(
+                weights[:, [1, 2]], network.layers[1].get_weights()[:, [1, 2]]
+            )
+            self.assertFalse(np.allclose(weights, network.layers[1].get_weights()))
+
+            # A dense batch writes every column.
+            backpropagation.compute_gradients(first, y)
+            self.assertIsNone(network.gradient_rows())
+            backpropagation.compute_gradients(CSRMatrix.from_dense(second), y)
+            np.testing.assert_array_equal(0, network.gradients()[0][:, [1, 2]])
+
+    def test_embedding(self) -> None:
+        """Checks that embeddings get the gradients of one-hot dense inputs."""
+        rng = np.random.default_rng(0)
+        ids = np.array([[1.0, 4.0], [4.0, 4.0], [0.0, 9.0]])
+        y = rng.normal(size=(3, 2))
+
+        network = Network(2)
+        network.add_layer(EmbeddingLayer(10, 3, initializer=Normal(seed=0)))
+        network.add_layer(DenseLayer(2, Tanh(), initializer=Normal(seed=1)))
+        backpropagation = Backpropagation(network, QuadraticLoss(), None, 0.1)
+        loss = backpropagation.compute_gradients(ids, y)
+
+        # Each id is one-hot encoded, and the table is the weights of a dense
+        # layer for each of the two ids.
+        table = network.layers[1].get_weights()
+        one_hot = np.zeros((3, 20))
+        one_hot[np.arange(3)[:, None], ids.astype(int) + [0, 10]] = 1
+        dense_network = Network(20)
+        dense_network.add_layer(DenseLayer(6, Identity()))
+        dense_network.layers[1].set_parameters(
+            [np.kron(np.eye(2), table.T), np.zeros(6)]
+        )
+        dense_network.add_layer(DenseLayer(2, Tanh(), initializer=Normal(seed=1)))
+        dense_backpropagation = Backpropagation(
+            dense_network, QuadraticLoss(), None, 0.1
+        )
+        np.testing.assert_allclose(
+            dense_backpropagation.compute_gradients(one_hot, y), loss
+        )
+
+        weight_gradient = dense_network.layer_gradients[1][0]
+        np.testing.assert_allclose(
+            weight_gradient[:3, :10].T + weight_gradient[3:, 10:].T,
+            network.layer_gradients[1][0],
+        )
+        np.testing.assert_allclose(
+            dense_network.layer_gradients[2][0], network.layer_gradients[2][0]
+        )
+
+        with self.assertRaises(ValueError):
+            backpropagation.train(ids[0], y[0])
+
+    def test_embedding_rows(self) -> None:
+        """Checks that only the rows of the ids in a batch are updated."""
+        network = Network(2)
+        network.add_layer(EmbeddingLayer(10, 3, initializer=Normal(seed=0)))
+        network.add_layer(DenseLayer(2, Tanh(), initializer=Normal(seed=1)))
+        y = np.ones((2, 2))
+
+        for optimizer in (SGD(0.1), Adam()):
+            backpropagation = Backpropagation(
+                network, QuadraticLoss(), None, 0.1, optimizer
+            )
+            for ids in ([[1.0, 4.0], [4.0, 7.0]], [[2.0, 2.0], [2.0, 3.0]]):
+                table = network.layers[1].get_weights().copy()
+                backpropagation.train_batch(np.array(ids), y)
+
+                rows = np.unique(ids)
+                changed = np.any(network.layers[1].get_weights() != table, axis=1)
+                np.testing.assert_array_equal(rows, np.flatnonzero(changed))
+
+                # The rows of the previous batch no longer have a gradient.
+                gradient = network.layer_gradients[1][0]
+                np.testing.assert_array_equal(
+                    rows, np.flatnonzero(np.any(gradient, axis=1))
+                )
+                gradient_rows = network.gradient_rows()
+                assert gradient_rows is not None
+                np.testing.assert_array_equal(rows, gradient_rows[0])
+
+    def test_loss_pairing(self) -> None:
+        """Checks that a loss must suit the final activation."""
+        x = np.ones((2, 2))
+        y = np.full((2, 3), 1 / 3)
+
+        # Softmax only reports a derivative of 1 for losses that take logits.
+        network = Network(2)
+        network.add_layer(DenseLayer(3, Softmax()))
+        with self.assertRaises(ValueError):
+            Backpropagation(network, QuadraticLoss(), None, 0.1)
+        with self.assertRaises(ValueError):
+            Backpropagation(network, quadratic_loss, delta_quadratic_loss, 0.1)
+
+        # A loss that takes logits skips the derivative of the final layer.
+        network = Network(2)
+        network.add_layer(DenseLayer(3, Tanh()))
+        with self.assertRaises(ValueError):
+            Backpropagation(network, SoftmaxCrossEntropyLoss(), None, 0.1)
+
+        for activation in (Softmax(), Identity()):
+            network = Network(2)
+            network.add_layer(DenseLayer(3, activation))
+            Backpropagation(network, SoftmaxCrossEntropyLoss(), None, 0.1)
+
+        # Layers added later are checked on the next step, compiled or not.
+        for compile_batch_size in (None, 2):
+            network = Network(2)
+            network.add_layer(DenseLayer(3, Tanh()))
+            backpropagation = Backpropagation(network, QuadraticLoss(), None, 0.1)
+            network.add_layer(DenseLayer(3, Softmax()))
+            if compile_batch_size is not None:
+                network.compile(compile_batch_size)
+            with self.assertRaises(ValueError):
+                backpropagation.train_batch(x, y)
+
+    @staticmethod
+    def _cross_entropy_bias_gradient(
+        network: Network, x: np.ndarray, y: np.ndarray
+    ) -> np.ndarray:
+        """Estimate the gradient of the last bias by finite differences."""
+
+        def mean_loss() -> float:
+            output = network.compute(x).output
+            return float(np.mean(-np.log(np.sum(output * y, 1))))
+
+        bias = network.layers[-1].get_parameters()[1]
+        return BackpropagationTest._numerical_gradient(mean_loss, bias)
+
+    @staticmethod
+    def _numerical_gradient(
+        mean_loss: Callable[[], float], parameter: np.ndarray
+    ) -> np.ndarray:
+        """Estimate the gradient of a parameter by central differences."""
+        epsilon = 1e-6
+        numerical = np.zeros(parameter.shape)
+        for index in np.ndindex(*parameter.shape):
+            original = parameter[index]
+            parameter[index] = original + epsilon
+            above = mean_loss()
+            parameter[index] = original - epsilon
+            below = mean_loss()
+            parameter[index] = original
+            numerical[index] = (above - below) / (2 * epsilon)
+        return numerical
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,13 @@
 """Contains tests for dense_layer.py."""
 
+import random
 import unittest
 
 import numpy as np
 
+from emell.activation import Tanh
 from emell.computation import relu, relu_prime
+from emell.initializer import He
 from emell.neuralnetwork import DenseLayer
 from emell.testutil import make_random_function
 
@@ -56,6 +59,57 @@ class DenseLayerTest(unittest.TestCase):
             0.01 * np.array([[0.3, 0.4], [0.5, 0.6],]), dense_layer.get_weights()
         )
 
+    def test_add_weights_initializer(self) -> None:
+        """Tests that the initializer creates the weights."""
+        dense_layer = DenseLayer(
+            neuron_count=3,
+            activation=relu,
+            activation_prime=relu_prime,
+            initializer=He(seed=5),
+        )
+        dense_layer.add_weights(4)
+        np.testing.assert_array_equal(
+            He(seed=5).initialize((3, 4), np.float64), dense_layer.get_weights()
+        )
+
+    def test_add_weights_default(self) -> None:
+        """Tests that the default weights are small and positive."""
+        dense_layer = DenseLayer(
+            neuron_count=30, activation=relu, activation_prime=relu_prime
+        )
+        dense_layer.add_weights(20, np.float32)
+        weights = dense_layer.get_weights()
+        self.assertEqual((30, 20), weights.shape)
+        self.assertGreaterEqual(weights.min(), 0)
+        self.assertLess(weights.max(), 0.01)
+
+    def test_add_weights_random_seed(self) -> None:
+        """Tests that seeding the random module repeats the default weights."""
+        weights = []
+        for _ in range(2):
+            random.seed(0)
+            dense_layer = DenseLayer(3, relu, relu_prime)
+            dense_layer.add_weights(4)
+            weights.append(dense_layer.get_weights())
+        np.testing.assert_array_equal(weights[0], weights[1])
+
+    def test_add_weights_dtype(self) -> None:
+        """Tests that the weights and bias take the dtype of the network."""
+        random_function = make_random_function([0.3, 0.4, 0.5, 0.6])
+        dense_layer = DenseLayer(
+            neuron_count=2,
+            activation=relu,
+            activation_prime=relu_prime,
+            random_function=random_function,
+        )
+        dense_layer.add_weights(2, np.float32)
+        self.assertEqual(np.float32, dense_layer.dtype)
+        self.assertEqual(np.float32, dense_layer.get_weights().dtype)
+        self.assertEqual(np.float32, dense_layer.bias.dtype)
+        self.assertEqual(
+            np.float32, dense_layer.predict(np.ones((3, 2), np.float32)).dtype
+        )
+
     def test_update_weights_and_biases(self) -> None:
         """Tests updating the biases and weights of the dense layer."""
         random_function = make_random_function(
@@ -192,6 +246,67 @@ class DenseLayerTest(unittest.TestCase):
             expected_output, result.output,
         )
 
+    def test_get_and_set_parameters(self) -> None:
+        """Tests replacing the parameter arrays of the layer."""
+        dense_layer = DenseLayer(
+            neuron_count=2,
+            activation=relu,
+            activation_prime=relu_prime,
+            random_function=make_random_function([0.3, 0.4, 0.5, 0.6]),
+        )
+        dense_layer.add_weights(2)
+        weights, bias = dense_layer.get_parameters()
+        self.assertIs(dense_layer.get_weights(), weights)
+        self.assertIs(dense_layer.bias, bias)
+
+        new_weights = np.ones((2, 2))
+        new_bias = np.ones(2)
+        dense_layer.set_parameters([new_weights, new_bias])
+        self.assertIs(new_weights, dense_layer.get_weights())
+        self.assertIs(new_bias, dense_layer.bias)
+
+        with self.assertRaises(ValueError):
+            dense_layer.set_parameters([np.ones((2, 3)), np.ones(2)])
+
+    def test_predict(self) -> None:
+        """Tests predicting a batch into an output buffer."""
+        random_function = make_random_function([0.3, 0.4, 0.5, 0.6])
+        dense_layer = DenseLayer(
+            neuron_count=2,
+            activation=relu,
+            activation_prime=relu_prime,
+            random_function=random_function,
+        )
+        dense_layer.add_weights(2)
+        dense_layer.update_bias(np.array([0.1, -10]))
+
+        out = np.empty((2, 2))
+        result = dense_layer.predict(np.array([[1, 1], [2, 2]]), out)
+        np.testing.assert_allclose(
+            np.array(
+                [
+                    [0.01 * (0.3 + 0.4) + 0.1, 0],
+                    [0.01 * (0.6 + 0.8) + 0.1, 0],
+                ]
+            ),
+            result,
+        )
+        np.testing.assert_allclose(
+            np.array([[0.01 * (0.5 + 0.6) - 10], [0.01 * (1.0 + 1.2) - 10]]),
+            out[:, 1:],
+        )
+
+    def test_activation_prime(self) -> None:
+        """Checks that the derivative comes from an Activation by default."""
+        activation = Tanh()
+        dense_layer = DenseLayer(2, activation)
+        self.assertIs(activation, dense_layer.activation)
+        x = np.array([-1.0, 0.5])
+        np.testing.assert_allclose(activation.prime(x), dense_layer.activation_prime(x))
+
+        with self.assertRaises(ValueError):
+            DenseLayer(2, relu)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,95 @@
+"""Contains tests for embedding_layer.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.initializer import Normal
+from emell.neuralnetwork import EmbeddingLayer
+from emell.sparse import CSRMatrix
+
+
+class EmbeddingLayerTest(unittest.TestCase):
+    """Contains tests for the EmbeddingLayer class."""
+
+    def test_add_weights(self) -> None:
+        """Verifies that the table and output size are set."""
+        layer = EmbeddingLayer(10, 3)
+        self.assertIsNone(layer.table)
+        with self.assertRaises(RuntimeError):
+            layer.get_weights()
+
+        layer.add_weights(2, np.float32)
+        self.assertEqual(6, layer.neuron_count)
+        self.assertEqual((10, 3), layer.get_weights().shape)
+        self.assertEqual(np.float32, layer.get_weights().dtype)
+        self.assertEqual([layer.table], layer.get_parameters())
+
+        # float32 cannot hold every id of a larger vocabulary.
+        with self.assertRaises(ValueError):
+            EmbeddingLayer(2**24 + 1, 1).add_weights(1, np.float32)
+
+        with self.assertRaises(ValueError):
+            EmbeddingLayer(0, 3)
+
+    def test_compute(self) -> None:
+        """Verifies that the rows of each id are concatenated."""
+        layer = EmbeddingLayer(4, 2, initializer=Normal(seed=0))
+        layer.add_weights(3)
+        table = layer.get_weights()
+
+        result = layer.compute(np.array([[3.0, 0.0, 3.0], [1.0, 2.0, 1.0]]))
+        expected = np.array(
+            [
+                np.concatenate([table[3], table[0], table[3]]),
+                np.concatenate([table[1], table[2], table[1]]),
+            ]
+        )
+        np.testing.assert_array_equal(expected, result.output)
+        np.testing.assert_array_equal(expected, result.weighted_output)
+        self.assertIs(layer, result.layer)
+
+        # A single example gives a vector.
+        np.testing.assert_array_equal(
+            expected[0], layer.compute(np.array([3.0, 0.0, 3.0])).output
+        )
+
+    def test_predict(self) -> None:
+        """Verifies that predict writes the rows into the buffer."""
+        layer = EmbeddingLayer(4, 2, initializer=Normal(seed=0))
+        layer.add_weights(2)
+        ids = np.array([[0.0, 1.0], [2.0, 3.0], [3.0, 3.0]])
+
+        out = np.empty((3, 4))
+        self.assertIs(out, layer.predict(ids, out))
+        np.testing.assert_array_equal(layer.compute(ids).output, out)
+        np.testing.assert_array_equal(out, layer.predict(ids))
+
+    def test_invalid_ids(self) -> None:
+        """Verifies that ids outside of the vocabulary are rejected."""
+        layer = EmbeddingLayer(4, 2)
+        layer.add_weights(1)
+        for ids in ([[4.0]], [[-1.0]]):
+            with self.assertRaises(ValueError):
+                layer.compute(np.array(ids))
+
+        with self.assertRaises(ValueError):
+            layer.predict(CSRMatrix.from_dense(np.ones((1, 1))))
+
+    def test_set_parameters(self) -> None:
+        """Verifies that the table can be replaced, but not reshaped."""
+        layer = EmbeddingLayer(4, 2)
+        layer.add_weights(1)
+        table = np.arange(8.0).reshape(4, 2)
+        layer.set_parameters([table])
+        self.assertIs(table, layer.get_weights())
+
+        layer.update_weights(np.ones((4, 2)))
+        np.testing.assert_array_equal(np.arange(1.0, 9.0).reshape(4, 2), table)
+
+        with self.assertRaises(ValueError):
+            layer.set_parameters([np.zeros((2, 4))])
+
+
+if __name__ == "__main__":
+    unittest.main()
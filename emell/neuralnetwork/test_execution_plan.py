@@ -0,0 +1,174 @@
+"""Contains tests for execution_plan.py"""
+
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from emell.activation import Identity, LeakyReLU, ReLU, Sigmoid, Tanh
+from emell.computation import (
+    constant,
+    delta_quadratic_loss,
+    identity,
+    quadratic_loss,
+    relu,
+    relu_prime,
+)
+from emell.initializer import Normal
+from emell.neuralnetwork import Backpropagation, DenseLayer, InputLayer, Network
+from emell.testutil import assert_no_allocations
+
+
+def make_network(flat_parameters: bool = False) -> Network:
+    """Make a network with a hidden layer."""
+    network = Network(3, flat_parameters=flat_parameters)
+    network.add_layer(DenseLayer(5, relu, relu_prime, initializer=Normal(seed=0)))
+    network.add_layer(
+        DenseLayer(2, identity, constant(np.ones(1)), initializer=Normal(seed=1))
+    )
+    return network
+
+
+class ExecutionPlanTest(unittest.TestCase):
+    """Tests for the ExecutionPlan class."""
+
+    def test_matches_network(self) -> None:
+        """Checks that compiled steps match uncompiled ones."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(6, 3))
+        y = rng.normal(size=(6, 2))
+
+        for flat_parameters in (False, True):
+            expected = Backpropagation(
+                make_network(flat_parameters), quadratic_loss, delta_quadratic_loss, 0.1
+            )
+            compiled = Backpropagation(
+                make_network(flat_parameters), quadratic_loss, delta_quadratic_loss, 0.1
+            )
+            compiled.network.compile(8)
+
+            for batch_size in (6, 4, 6):
+                np.testing.assert_allclose(
+                    expected.train_batch(x[:batch_size], y[:batch_size]),
+                    compiled.train_batch(x[:batch_size], y[:batch_size]),
+                )
+                for gradient, compiled_gradient in zip(
+                    expected.network.gradients(), compiled.network.gradients()
+                ):
+                    np.testing.assert_allclose(gradient, compiled_gradient)
+                np.testing.assert_allclose(
+                    expected.network.predict(x), compiled.network.predict(x)
+                )
+
+    def test_activations(self) -> None:
+        """Checks that compiled activations match their uncompiled layers."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(6, 3))
+        y = rng.normal(size=(6, 2))
+
+        def make_layers(network: Network) -> Network:
+            network.add_layer(DenseLayer(4, Tanh(), initializer=Normal(seed=0)))
+            network.add_layer(DenseLayer(4, LeakyReLU(0.1), initializer=Normal(seed=1)))
+            network.add_layer(DenseLayer(2, Sigmoid(), initializer=Normal(seed=2)))
+            return network
+
+        expected = Backpropagation(
+            make_layers(Network(3)), quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        compiled = Backpropagation(
+            make_layers(Network(3)), quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        compiled.network.compile(6)
+
+        np.testing.assert_allclose(
+            expected.compute_gradients(x, y), compiled.compute_gradients(x, y)
+        )
+        for gradient, compiled_gradient in zip(
+            expected.network.gradients(), compiled.network.gradients()
+        ):
+            np.testing.assert_allclose(gradient, compiled_gradient)
+        np.testing.assert_allclose(
+            expected.network.predict(x), compiled.network.predict(x)
+        )
+
+    def test_buffers(self) -> None:
+        """Checks that steady batch sizes reuse the same buffers."""
+        network = make_network()
+        plan = network.compile(4)
+        self.assertIs(plan, network.plan)
+
+        first = network.predict(np.ones((4, 3)))
+        second = network.predict(np.zeros((4, 3)))
+        self.assertIs(first, second)
+
+        # Batches over the maximum aren't run through the plan.
+        larger = network.predict(np.ones((5, 3)))
+        self.assertFalse(np.shares_memory(first, larger))
+        np.testing.assert_allclose(network.compute(np.ones((5, 3))).output, larger)
+
+    @unittest.skipUnless(
+        hasattr(tracemalloc, "reset_peak"), "Needs tracemalloc.reset_peak"
+    )
+    def test_no_allocations(self) -> None:
+        """Checks that steady-state steps with activations allocate no arrays."""
+        network = Network(64)
+        network.add_layer(DenseLayer(64, ReLU()))
+        network.add_layer(DenseLayer(64, Sigmoid()))
+        network.add_layer(DenseLayer(64, Identity()))
+        plan = network.compile(256)
+        x = np.ones((256, 64))
+        delta = np.ones((256, 64))
+
+        def step() -> None:
+            plan.forward(x)
+            plan.backward(delta)
+            plan.predict(x)
+
+        # Any new array would be at least 256 * 64 * 8 bytes. Adding the bias
+        # may use NumPy's iteration buffer, which is capped at 8192 elements.
+        assert_no_allocations(step, max_bytes=256 * 64 * 8 - 1, network=network)
+
+    def test_recompile(self) -> None:
+        """Checks that the plan follows changes to the network."""
+        network = make_network()
+        network.compile(4)
+        network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+        self.assertIsNotNone(network.plan)
+        x = np.ones((2, 3))
+        self.assertEqual((2, 1), network.predict(x).shape)
+
+        parameters = network.parameters()
+        network.set_flat_buffers(
+            np.concatenate([p.ravel() for p in parameters]),
+            np.zeros(sum(p.size for p in parameters)),
+        )
+        network.parameters()[0][...] = 0
+        np.testing.assert_array_equal(np.zeros((2, 1)), network.predict(x))
+
+        replica = network.replicate()
+        self.assertIsNotNone(replica.plan)
+        self.assertIsNot(network.plan, replica.plan)
+
+    def test_invalid(self) -> None:
+        """Checks that invalid networks and batches are rejected."""
+        with self.assertRaises(ValueError):
+            make_network().compile(0)
+
+        network = make_network()
+        network.layers.append(InputLayer(2))
+        with self.assertRaises(ValueError):
+            network.compile(4)
+
+        plan = make_network().compile(4)
+        with self.assertRaises(ValueError):
+            plan.forward(np.ones((5, 3)))
+
+        with self.assertRaises(ValueError):
+            plan.forward(np.ones((2, 4)))
+
+        with self.assertRaises(ValueError):
+            plan.forward(np.ones(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,7 +41,7 @@ class InputLayerTest(unittest.TestCase):
         """
         layer = InputLayer(input_count=3)
         layer.update_bias(np.array([1, 1, 1]))
-        layer_input = np.array([1, 2, 3])
+        layer_input = np.array([1.0, 2.0, 3.0])
         self.assertEqual(
             Layer.Result(layer, layer_input, layer_input), layer.compute(layer_input)
         )
@@ -51,14 +51,34 @@ class InputLayerTest(unittest.TestCase):
         layer = InputLayer(input_count=3)
         np.testing.assert_array_equal(layer.get_weights(), np.ones([3]))
 
+    def test_parameters(self) -> None:
+        """Verify that the input layer has no parameters."""
+        layer = InputLayer(input_count=3)
+        self.assertEqual([], layer.get_parameters())
+        layer.set_parameters([])
+        with self.assertRaises(ValueError):
+            layer.set_parameters([np.ones(3)])
+
     def test_compute(self) -> None:
         """Verify that the input layer returns its inputs."""
         layer = InputLayer(input_count=3)
-        layer_input = np.array([1, 2, 3])
+        layer_input = np.array([1.0, 2.0, 3.0])
         self.assertEqual(
             Layer.Result(layer, layer_input, layer_input), layer.compute(layer_input)
         )
 
+    def test_compute_dtype(self) -> None:
+        """Verify that inputs are converted to the dtype of the layer."""
+        layer = InputLayer(input_count=2, dtype=np.float32)
+        self.assertEqual(np.float32, layer.dtype)
+        self.assertEqual(np.float32, layer.activation_prime(np.zeros(2)).dtype)
+
+        result = layer.compute(np.array([1, 2]))
+        self.assertEqual(np.float32, result.output.dtype)
+        np.testing.assert_array_equal(np.array([1, 2]), result.output)
+
+        self.assertEqual(np.float32, layer.predict(np.array([[1.0, 2.0]])).dtype)
+
     def test_compute_wrong_shape(self) -> None:
         """Verify that a mismatched shape raises a ValueError."""
         layer = InputLayer(input_count=4)
@@ -73,6 +93,24 @@ class InputLayerTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             layer.compute(layer_input)
 
+    def test_compute_batch(self) -> None:
+        """Verify that the input layer returns batches of inputs."""
+        layer = InputLayer(input_count=2)
+        layer_input = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        self.assertIs(layer_input, layer.compute(layer_input).output)
+
+    def test_predict(self) -> None:
+        """Verify that predict returns its input batch."""
+        layer = InputLayer(input_count=2)
+        layer_input = np.array([[1.0, 2.0], [3.0, 4.0]])
+        self.assertIs(layer_input, layer.predict(layer_input))
+
+        with self.assertRaises(ValueError):
+            layer.predict(np.array([1, 2]))
+
+        with self.assertRaises(ValueError):
+            layer.predict(np.array([[1, 2, 3]]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,9 @@ import unittest
 
 import numpy as np
 
-from emell.computation import constant, identity
-from emell.neuralnetwork import DenseLayer, Network
+from emell.computation import constant, identity, relu, relu_prime
+from emell.neuralnetwork import DenseLayer, EmbeddingLayer, Network
+from emell.sparse import CSRMatrix
 from emell.testutil import make_random_function
 
 
@@ -139,6 +140,240 @@ class TestNetwork(unittest.TestCase):
 
         np.testing.assert_allclose(result.output, third_layer_expected)
 
+    def test_predict(self) -> None:
+        """Checks that predict matches compute for a batch of inputs."""
+        network = Network(3)
+        network.add_layer(DenseLayer(4, relu, relu_prime))
+        network.add_layer(DenseLayer(2, identity, constant(np.array([1]))))
+
+        network_input = np.array([[10, 20, 30], [-1, 2, -3], [0, 0, 1]])
+        np.testing.assert_allclose(
+            network.compute(network_input).output, network.predict(network_input)
+        )
+
+        # A single example is computed as a batch of one.
+        np.testing.assert_allclose(
+            network.compute(network_input[1]).output,
+            network.predict(network_input[1:2])[0],
+        )
+
+    def test_predict_reuses_buffers(self) -> None:
+        """Checks that repeated predictions write into the same output buffer."""
+        network = Network(2)
+        network.add_layer(DenseLayer(3, identity, constant(np.array([1]))))
+
+        first = network.predict(np.ones((4, 2)))
+        second = network.predict(np.zeros((4, 2)))
+        self.assertIs(first, second)
+
+        # Smaller batches are served from the same memory.
+        smaller = network.predict(np.ones((2, 2)))
+        self.assertTrue(np.shares_memory(first, smaller))
+
+        # Larger batches get larger buffers, with correct results.
+        larger = network.predict(np.ones((8, 2)))
+        self.assertEqual((8, 3), larger.shape)
+        np.testing.assert_allclose(network.compute(np.ones((8, 2))).output, larger)
+
+    def test_predict_errors(self) -> None:
+        """Checks that predict only accepts batches of the right width."""
+        network = Network(2)
+        network.add_layer(DenseLayer(1, identity, constant(np.array([1]))))
+
+        with self.assertRaises(ValueError):
+            network.predict(np.array([1, 2]))
+
+        with self.assertRaises(ValueError):
+            network.predict(np.ones((2, 3)))
+
+    def test_flat_parameters(self) -> None:
+        """Checks that flat parameters are views into one contiguous buffer."""
+        network = Network(3, flat_parameters=True)
+        layer1 = DenseLayer(
+            2,
+            identity,
+            constant(np.array([1])),
+            random_function=make_random_function([0.3, 0.4, 0.5, 0.6, 0.7, 0.8]),
+        )
+        layer1.update_bias(np.array([0.1, 0.2]))
+        network.add_layer(layer1)
+        layer2 = DenseLayer(
+            1,
+            identity,
+            constant(np.array([1])),
+            random_function=make_random_function([1.0, 1.1]),
+        )
+        network.add_layer(layer2)
+
+        # Values are kept as each layer is moved into the buffer.
+        np.testing.assert_allclose(
+            np.array(
+                [0.003, 0.004, 0.005, 0.006, 0.007, 0.008, 0.1, 0.2, 0.01, 0.011, 0]
+            ),
+            network.parameters()[0],
+        )
+        self.assertEqual(1, len(network.parameters()))
+        self.assertEqual(1, len(network.gradients()))
+        self.assertEqual(network.parameters()[0].shape, network.gradients()[0].shape)
+
+        # Updating the buffer updates the layers.
+        network.parameters()[0] += 1
+        np.testing.assert_allclose(np.array([1.1, 1.2]), layer1.bias)
+        np.testing.assert_allclose(np.array([[1.01, 1.011]]), layer2.get_weights())
+
+        for layer, gradients in zip(network.layers, network.layer_gradients):
+            for parameter, gradient in zip(layer.get_parameters(), gradients):
+                self.assertTrue(np.shares_memory(parameter, network.parameters()[0]))
+                self.assertTrue(np.shares_memory(gradient, network.gradients()[0]))
+                self.assertEqual(parameter.shape, gradient.shape)
+
+    def test_set_flat_buffers(self) -> None:
+        """Checks that flat parameters can be moved into other arrays."""
+        network = Network(2, flat_parameters=True)
+        layer = DenseLayer(1, identity, constant(np.array([1])))
+        network.add_layer(layer)
+        values = network.parameters()[0].copy()
+
+        parameters = np.empty(3)
+        gradients = np.empty(3)
+        network.set_flat_buffers(parameters, gradients)
+        self.assertIs(parameters, network.parameters()[0])
+        self.assertIs(gradients, network.gradients()[0])
+        np.testing.assert_allclose(values, parameters)
+
+        # Without copying, the network takes on the values already there.
+        other_parameters = np.array([1.0, 2.0, 3.0])
+        network.set_flat_buffers(other_parameters, np.empty(3), copy=False)
+        np.testing.assert_allclose(np.array([[1.0, 2.0]]), layer.get_weights())
+        np.testing.assert_allclose(np.array([3.0]), layer.bias)
+        self.assertTrue(np.shares_memory(other_parameters, layer.bias))
+
+        with self.assertRaises(ValueError):
+            network.set_flat_buffers(np.empty(4), np.empty(4))
+
+        with self.assertRaises(ValueError):
+            network.set_flat_buffers(np.empty(3, np.float32), np.empty(3))
+
+        with self.assertRaises(ValueError):
+            Network(2).set_flat_buffers(np.empty(3), np.empty(3))
+
+        # Networks without flat parameters get them.
+        network = Network(2)
+        network.add_layer(DenseLayer(1, identity, constant(np.array([1]))))
+        network.set_flat_buffers(other_parameters, np.empty(3), copy=False)
+        self.assertIs(other_parameters, network.parameters()[0])
+        self.assertTrue(network.flat_parameters)
+
+    def test_replicate(self) -> None:
+        """Checks that replicas share parameters but not gradients."""
+        for flat_parameters in (False, True):
+            network = Network(2, flat_parameters=flat_parameters)
+            network.add_layer(DenseLayer(3, relu, relu_prime))
+            network.add_layer(DenseLayer(1, identity, constant(np.array([1]))))
+            replica = network.replicate()
+
+            for parameter, replica_parameter in zip(
+                network.parameters(), replica.parameters()
+            ):
+                self.assertIs(parameter, replica_parameter)
+            for gradient, replica_gradient in zip(
+                network.gradients(), replica.gradients()
+            ):
+                self.assertFalse(np.shares_memory(gradient, replica_gradient))
+
+            # Updates through the replica's layers reach the network.
+            replica.layers[1].update_bias(np.ones(3))
+            np.testing.assert_allclose(
+                np.ones(3), network.layers[1].get_parameters()[1]
+            )
+
+            network_input = np.array([[1.0, 2.0]])
+            np.testing.assert_allclose(
+                network.compute(network_input).output, replica.predict(network_input)
+            )
+
+    def test_dtype(self) -> None:
+        """Checks that a float32 network stays in float32 end to end."""
+        for flat_parameters in (False, True):
+            network = Network(3, flat_parameters=flat_parameters, dtype=np.float32)
+            network.add_layer(DenseLayer(4, relu, relu_prime))
+            network.add_layer(DenseLayer(2, identity, constant(np.ones(1, np.float32))))
+
+            for array in network.parameters() + network.gradients():
+                self.assertEqual(np.float32, array.dtype)
+
+            network_input = np.array([[10, 20, 30], [-1, 2, -3]])
+            for result in network.compute(network_input).results:
+                self.assertEqual(np.float32, result.output.dtype)
+            self.assertEqual(np.float32, network.predict(network_input).dtype)
+
+    def test_parameters(self) -> None:
+        """Checks that parameters are listed per layer without flat parameters."""
+        network = Network(2)
+        layer = DenseLayer(3, identity, constant(np.array([1])))
+        network.add_layer(layer)
+
+        self.assertIsNone(network.parameter_buffer)
+        self.assertEqual(2, len(network.parameters()))
+        self.assertIs(layer.get_weights(), network.parameters()[0])
+        self.assertIs(layer.bias, network.parameters()[1])
+        self.assertEqual([(3, 2), (3,)], [g.shape for g in network.gradients()])
+
+    def test_sparse_input(self) -> None:
+        """Checks that sparse batches compute the same outputs as dense ones."""
+        for dtype in (np.float64, np.float32):
+            network = Network(6, dtype=dtype)
+            network.add_layer(DenseLayer(4, relu, relu_prime))
+            network.add_layer(DenseLayer(2, identity, constant(np.array([1]))))
+
+            network_input = np.array(
+                [[0, 2, 0, 0, 0, -1], [0, 0, 0, 0, 0, 0], [3, 0, 0, 0, 0, 0]]
+            )
+            sparse = CSRMatrix.from_dense(network_input)
+            result = network.compute(sparse)
+            self.assertIsInstance(result.results[0].output, CSRMatrix)
+            self.assertEqual(dtype, result.results[0].output.dtype)
+            self.assertEqual(dtype, result.output.dtype)
+            np.testing.assert_allclose(
+                network.compute(network_input).output, result.output, rtol=1e-6
+            )
+            np.testing.assert_allclose(
+                network.predict(network_input), network.predict(sparse), rtol=1e-6
+            )
+
+            with self.assertRaises(ValueError):
+                network.compute(CSRMatrix.from_dense(np.ones((2, 5))))
+
+    def test_embedding(self) -> None:
+        """Checks the placement and gradient rows of embedding layers."""
+        network = Network(2)
+        network.add_layer(EmbeddingLayer(10, 3))
+        network.add_layer(DenseLayer(1, identity, constant(np.array([1]))))
+        self.assertEqual(6, network.layers[1].neuron_count)
+        with self.assertRaises(ValueError):
+            network.add_layer(EmbeddingLayer(10, 3))
+
+        # Only the table can have rows, and no rows are written yet.
+        gradient_rows = network.gradient_rows()
+        assert gradient_rows is not None
+        self.assertEqual(3, len(gradient_rows))
+        np.testing.assert_array_equal(np.empty(0), gradient_rows[0])
+        self.assertEqual([None, None], gradient_rows[1:])
+
+        network.layer_gradient_rows[1][0] = np.array([4])
+        replica_rows = network.replicate().gradient_rows()
+        assert replica_rows is not None
+        np.testing.assert_array_equal(np.empty(0), replica_rows[0])
+
+        ids = np.array([[1.0, 9.0], [3.0, 3.0]])
+        np.testing.assert_allclose(network.compute(ids).output, network.predict(ids))
+
+        # Flat parameters are always updated in full.
+        network.set_flat_buffers(
+            np.zeros(37, network.dtype), np.zeros(37, network.dtype)
+        )
+        self.assertIsNone(network.gradient_rows())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -45,6 +45,17 @@ class TestNeuron(unittest.TestCase):
         with self.assertRaises(ValueError):
             neuron.Neuron(0, relu, make_random_function([]))
 
+    def test_seed(self) -> None:
+        """Verify that a seeded neuron draws its weights from a generator."""
+        n = neuron.Neuron(3, relu, seed=2)
+        self.assertEqual((3,), n.weights.shape)
+        self.assertTrue(np.all((n.weights >= 0) & (n.weights < 1)))
+        self.assertTrue(0 <= n.bias < 1)
+
+        same = neuron.Neuron(3, relu, seed=2)
+        np.testing.assert_array_equal(n.weights, same.weights)
+        self.assertEqual(n.bias, same.bias)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,167 @@
+"""Contains tests for profiler.py"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from emell.activation import Identity, ReLU
+from emell.computation import delta_quadratic_loss, quadratic_loss
+from emell.initializer import Normal
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network, Profiler
+
+
+def make_network() -> Network:
+    """Make a profiled network with a hidden layer."""
+    network = Network(3)
+    network.add_layer(DenseLayer(4, ReLU(), initializer=Normal(seed=0)))
+    network.add_layer(DenseLayer(2, Identity(), initializer=Normal(seed=1)))
+    network.profiler = Profiler()
+    return network
+
+
+class ProfilerTest(unittest.TestCase):
+    """Tests for the Profiler class."""
+
+    def test_records_layers(self) -> None:
+        """Checks that each layer's passes are recorded during training."""
+        network = make_network()
+        profiler = network.profiler
+        assert profiler is not None
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        backpropagation.train_batch(np.ones((5, 3)), np.ones((5, 2)))
+
+        summary = profiler.summary()
+        self.assertEqual(
+            [
+                (0, "forward"),
+                (1, "backward"),
+                (1, "forward"),
+                (2, "backward"),
+                (2, "forward"),
+            ],
+            [(stats["layer"], stats["phase"]) for stats in summary],
+        )
+        for stats in summary:
+            self.assertEqual(1, stats["calls"])
+            self.assertEqual(1, sum(stats["histogram_us"].values()))
+            self.assertLessEqual(stats["min_seconds"], stats["max_seconds"])
+
+        # The hidden layer multiplies 5x3 inputs by 4x3 weights.
+        self.assertEqual("DenseLayer", summary[2]["type"])
+        self.assertEqual(2 * 5 * 4 * 3 + 2 * 5 * 4, summary[2]["flops"])
+        self.assertEqual(0, summary[0]["flops"])
+
+        # The first layer doesn't propagate its error any further.
+        self.assertEqual(
+            Profiler.cost(network.layers[1], 5, "backward", False)[0],
+            summary[1]["flops"],
+        )
+
+    def test_compiled(self) -> None:
+        """Checks that the execution plan records the same layers."""
+        network = make_network()
+        profiler = network.profiler
+        assert profiler is not None
+        network.compile(8)
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        backpropagation.train_batch(np.ones((5, 3)), np.ones((5, 2)))
+        network.predict(np.ones((5, 3)))
+
+        calls = {
+            (stats["layer"], stats["phase"]): stats["calls"]
+            for stats in profiler.summary()
+        }
+        self.assertEqual(
+            {
+                (1, "forward"): 2,
+                (2, "forward"): 2,
+                (1, "backward"): 1,
+                (2, "backward"): 1,
+            },
+            calls,
+        )
+
+    def test_train(self) -> None:
+        """Checks that single examples are recorded with a batch of one."""
+        network = make_network()
+        profiler = network.profiler
+        assert profiler is not None
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        backpropagation.train(np.ones(3), np.ones(2))
+
+        backward = [
+            stats for stats in profiler.summary() if stats["phase"] == "backward"
+        ]
+        self.assertEqual([0, 1, 2], [stats["layer"] for stats in backward])
+        for event in profiler.chrome_trace()["traceEvents"]:
+            self.assertEqual(1, event["args"]["batch_size"])
+
+    def test_disabled(self) -> None:
+        """Checks that nothing is recorded once the profiler is removed."""
+        network = make_network()
+        profiler = network.profiler
+        assert profiler is not None
+        network.profiler = None
+        network.compute(np.ones((2, 3)))
+        network.compile(2).predict(np.ones((2, 3)))
+        self.assertEqual([], profiler.summary())
+
+    def test_export(self) -> None:
+        """Checks the JSON summary and the Chrome trace."""
+        times = iter([0.0, 1.0, 1.000003, 2.0, 2.5])
+        profiler = Profiler(max_events=1, clock=lambda: next(times))
+        layer = DenseLayer(2, Identity())
+        layer.add_weights(3)
+
+        self.assertEqual(
+            1, profiler.measure(1, Profiler.FORWARD, layer, np.ones((4, 3)), abs, -1)
+        )
+        profiler.measure(1, Profiler.FORWARD, layer, np.ones(3), abs, 1)
+
+        summary = profiler.summary()
+        self.assertEqual(1, len(summary))
+        stats = summary[0]
+        self.assertEqual(2, stats["calls"])
+        self.assertAlmostEqual(0.500003, stats["seconds"])
+        self.assertAlmostEqual(0.000003, stats["min_seconds"])
+        self.assertEqual({"4": 1, "524288": 1}, stats["histogram_us"])
+        flops = Profiler.cost(layer, 4, Profiler.FORWARD)[0]
+        flops += Profiler.cost(layer, 1, Profiler.FORWARD)[0]
+        self.assertEqual(flops, stats["flops"])
+
+        # Only the first call fits in the trace.
+        events = profiler.chrome_trace()["traceEvents"]
+        self.assertEqual(1, len(events))
+        event = events[0]
+        self.assertEqual("X", event["ph"])
+        self.assertAlmostEqual(1e6, event["ts"])
+        self.assertAlmostEqual(3.0, event["dur"])
+        self.assertEqual(4, event["args"]["batch_size"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "summary.json")
+            profiler.write_json(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(profiler.summary(), json.load(file))
+
+            path = os.path.join(directory, "trace.json")
+            profiler.write_chrome_trace(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(1, len(json.load(file)["traceEvents"]))
+
+        profiler.clear()
+        self.assertEqual([], profiler.summary())
+        self.assertEqual([], profiler.chrome_trace()["traceEvents"])
+
+
+if __name__ == "__main__":
+    unittest.main()
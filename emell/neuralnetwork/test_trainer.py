@@ -0,0 +1,125 @@
+"""Contains tests for trainer.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import Softmax
+from emell.computation import constant, delta_quadratic_loss, identity, quadratic_loss
+from emell.data import ArrayDataset
+from emell.initializer import Normal
+from emell.loss import SoftmaxCrossEntropyLoss
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network, Trainer
+
+
+def make_backpropagation(alpha: float) -> Backpropagation:
+    """Create a network with one linear neuron and two inputs."""
+    network = Network(2, flat_parameters=True)
+    network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+    return Backpropagation(network, quadratic_loss, delta_quadratic_loss, alpha)
+
+
+def make_dataset(examples: int, seed: int) -> ArrayDataset:
+    """Create a dataset of adding two numbers."""
+    x = np.random.default_rng(seed).uniform(-1, 1, size=(examples, 2))
+    return ArrayDataset(x, np.sum(x, axis=1, keepdims=True), 8, seed=seed)
+
+
+class TrainerTest(unittest.TestCase):
+    """Contains tests for the Trainer class."""
+
+    def test_fit(self) -> None:
+        """Verifies that the loss is recorded once per epoch as it drops."""
+        trainer = Trainer(make_backpropagation(0.1))
+        history = trainer.fit(make_dataset(64, 0), epochs=5)
+
+        self.assertEqual(5, len(history.training_losses))
+        self.assertEqual([], history.validation_losses)
+        self.assertFalse(history.stopped_early)
+        self.assertLess(history.training_losses[-1], history.training_losses[0])
+
+    def test_fit_validation(self) -> None:
+        """Verifies that the validation loss is recorded for each epoch."""
+        trainer = Trainer(make_backpropagation(0.5), patience=3)
+        history = trainer.fit(make_dataset(64, 0), 10, make_dataset(32, 1))
+
+        self.assertEqual(10, len(history.validation_losses))
+        self.assertEqual(9, history.best_epoch)
+        self.assertFalse(history.stopped_early)
+        self.assertLess(history.validation_losses[-1], 1e-3)
+
+    def test_early_stopping(self) -> None:
+        """Verifies that training stops when the validation loss plateaus."""
+        # Nothing is learned without a learning rate.
+        trainer = Trainer(make_backpropagation(0), patience=2)
+        history = trainer.fit(make_dataset(64, 0), 10, make_dataset(32, 1))
+
+        self.assertTrue(history.stopped_early)
+        self.assertEqual(0, history.best_epoch)
+        self.assertEqual(3, len(history.training_losses))
+        self.assertEqual(3, len(history.validation_losses))
+
+    def test_restore_best(self) -> None:
+        """Verifies that the best parameters are restored after stopping."""
+        backpropagation = make_backpropagation(0.1)
+        trainer = Trainer(backpropagation, patience=1, min_delta=1e6)
+        history = trainer.fit(make_dataset(64, 0), 10, make_dataset(32, 1))
+        self.assertTrue(history.stopped_early)
+
+        # Only the first epoch counted as an improvement.
+        network = backpropagation.network
+        self.assertAlmostEqual(
+            history.validation_losses[0], trainer.evaluate(make_dataset(32, 1))
+        )
+        self.assertNotAlmostEqual(
+            history.validation_losses[1], trainer.evaluate(make_dataset(32, 1))
+        )
+        self.assertEqual(1, len(network.parameters()))
+
+    def test_patience_on_last_epoch(self) -> None:
+        """Verifies that running out of patience on the last epoch isn't early."""
+        backpropagation = make_backpropagation(0.1)
+        trainer = Trainer(backpropagation, patience=1, min_delta=1e6)
+        history = trainer.fit(make_dataset(64, 0), 2, make_dataset(32, 1))
+        self.assertFalse(history.stopped_early)
+        self.assertEqual(2, len(history.training_losses))
+
+        # The best parameters are still restored.
+        self.assertAlmostEqual(
+            history.validation_losses[0], trainer.evaluate(make_dataset(32, 1))
+        )
+
+    def test_evaluate(self) -> None:
+        """Verifies the mean loss over a dataset."""
+        backpropagation = make_backpropagation(0)
+        network = backpropagation.network
+        network.parameters()[0][...] = 0
+        x = np.array([[1.0, 1.0], [2.0, 2.0], [0.0, 0.0]])
+        dataset = ArrayDataset(x, np.sum(x, axis=1, keepdims=True), 2)
+        self.assertAlmostEqual(
+            (0.5 * 4 + 0.5 * 16) / 3, Trainer(backpropagation).evaluate(dataset)
+        )
+
+    def test_evaluate_logits(self) -> None:
+        """Verifies that a loss that takes logits is not given probabilities."""
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(5, 4))
+        y = np.eye(3)[[0, 2, 1, 1, 0]]
+        dataset = ArrayDataset(x, y, 2)
+
+        for compile_batch_size in (None, 2):
+            network = Network(4)
+            network.add_layer(DenseLayer(3, Softmax(), initializer=Normal(seed=0)))
+            if compile_batch_size is not None:
+                network.compile(compile_batch_size)
+            backpropagation = Backpropagation(
+                network, SoftmaxCrossEntropyLoss(), None, 0.1
+            )
+
+            probabilities = network.predict(x)
+            expected = np.mean(-np.sum(y * np.log(probabilities), axis=1))
+            self.assertAlmostEqual(expected, Trainer(backpropagation).evaluate(dataset))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+"""Contains a training loop over datasets."""
+
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+import numpy as np
+
+from emell.data import Dataset
+from emell.neuralnetwork.backpropagation import Backpropagation
+
+if TYPE_CHECKING:
+    # Only imported for type checking, as serialization imports this package.
+    from emell.serialization import Checkpointer
+
+
+class Trainer:
+    """
+    Trains a network for a number of epochs over a dataset.
+
+    Losses are summed into arrays as training runs, and only turned into
+    Python floats once per epoch. If a validation dataset is given, training
+    stops early once the validation loss stops improving.
+    """
+
+    def __init__(
+        self,
+        backpropagation: Backpropagation,
+        patience: Optional[int] = None,
+        min_delta: float = 0.0,
+        restore_best: bool = True,
+        checkpointer: Optional["Checkpointer"] = None,
+    ):
+        """
+        Initialize the trainer.
+
+        Parameters
+        ----------
+        backpropagation : Backpropagation
+            Trains the network on each mini-batch.
+        patience : int, optional
+            The number of epochs without a validation improvement to allow
+            before stopping. Training never stops early if not given.
+        min_delta : float
+            The amount that the validation loss must drop by to count as an
+            improvement.
+        restore_best : bool
+            Whether to restore the parameters from the epoch with the best
+            validation loss when the patience runs out, even on the last
+            epoch.
+        checkpointer : Checkpointer, optional
+            Told about each training step, so it can periodically save the
+            network in the background.
+
+        """
+        super().__init__()
+        self.backpropagation = backpropagation
+        self.patience = patience
+        self.min_delta = min_delta
+        self.restore_best = restore_best
+        self.checkpointer = checkpointer
+
+    def fit(
+        self, dataset: Dataset, epochs: int, validation: Optional[Dataset] = None
+    ) -> "Trainer.History":
+        """
+        Train the network.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The training examples. Iterated once per epoch.
+        epochs : int
+            The largest number of epochs to train for.
+        validation : Dataset, optional
+            Examples used to measure the loss after each epoch.
+
+        Returns
+        -------
+        The mean loss of each epoch.
+
+        """
+        network = self.backpropagation.network
+        training_losses: List[float] = []
+        validation_losses: List[float] = []
+        best_loss = np.inf
+        best_epoch = 0
+        best_parameters: List[np.ndarray] = []
+        patience_ran_out = False
+
+        for epoch in range(epochs):
+            training_losses.append(self._train_epoch(dataset))
+
+            if validation is None:
+                continue
+
+            validation_losses.append(self.evaluate(validation))
+            if validation_losses[-1] < best_loss - self.min_delta:
+                best_loss = validation_losses[-1]
+                best_epoch = epoch
+                if self.restore_best:
+                    best_parameters = self._copy_parameters(best_parameters)
+            elif self.patience is not None and epoch - best_epoch >= self.patience:
+                patience_ran_out = True
+                break
+
+        if patience_ran_out and self.restore_best:
+            for parameter, best in zip(network.parameters(), best_parameters):
+                np.copyto(parameter, best)
+
+        # Running out of patience on the last epoch doesn't skip any epochs.
+        stopped_early = len(training_losses) < epochs
+        return Trainer.History(
+            training_losses, validation_losses, best_epoch, stopped_early
+        )
+
+    def evaluate(self, dataset: Dataset) -> float:
+        """
+        Compute the mean loss of the network over a dataset.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The examples to evaluate.
+
+        Returns
+        -------
+        The loss summed over the outputs, averaged over the examples.
+
+        """
+        network = self.backpropagation.network
+        loss_sum = np.zeros(1)
+        examples = 0
+        for batch in dataset:
+            output = self._output(batch.x)
+            expected = np.asarray(batch.y, network.dtype)
+            batch_size = batch.x.shape[0]
+            # The loss of each output is averaged over the batch.
+            loss_sum += np.sum(self.backpropagation.loss(output, expected)) * batch_size
+            examples += batch_size
+        return float(loss_sum[0]) / max(examples, 1)
+
+    def _train_epoch(self, dataset: Dataset) -> float:
+        """Train on every batch of the dataset once, and return the mean loss."""
+        network = self.backpropagation.network
+        loss_sum = np.zeros(1)
+        examples = 0
+        for batch in dataset:
+            loss = self.backpropagation.train_batch(batch.x, batch.y)
+            if self.checkpointer is not None:
+                self.checkpointer.update(network)
+            loss_sum += np.sum(loss) * batch.x.shape[0]
+            examples += batch.x.shape[0]
+        return float(loss_sum[0]) / max(examples, 1)
+
+    def _output(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute what the loss expects for a batch.
+
+        A loss that takes logits gets the weighted output of the final layer,
+        as it applies its own softmax.
+        """
+        network = self.backpropagation.network
+        if not self.backpropagation.loss.takes_logits:
+            return network.predict(x)
+
+        plan = network.plan
+        if plan is not None and x.shape[0] <= plan.max_batch_size:
+            plan.forward(x)
+            return plan.weighted_output
+
+        return np.asarray(network.compute(x).results[-1].weighted_output)
+
+    def _copy_parameters(self, copies: List[np.ndarray]) -> List[np.ndarray]:
+        """Copy the parameters of the network, reusing previous copies."""
+        parameters = self.backpropagation.network.parameters()
+        if not copies:
+            return [parameter.copy() for parameter in parameters]
+
+        for parameter, copy in zip(parameters, copies):
+            np.copyto(copy, parameter)
+        return copies
+
+    class History(NamedTuple):
+        """Represents the losses recorded during training."""
+
+        # The mean training loss of each epoch.
+        training_losses: List[float]
+        # The mean validation loss of each epoch. Empty without validation.
+        validation_losses: List[float]
+        # The epoch with the lowest validation loss.
+        best_epoch: int
+        # Whether training stopped before running every epoch.
+        stopped_early: bool
@@ -0,0 +1,31 @@
+"""Optimizers that update network parameters from their gradients."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.optimizer.adam import Adam
+    from emell.optimizer.momentum import Momentum
+    from emell.optimizer.optimizer import Optimizer
+    from emell.optimizer.rms_prop import RMSProp
+    from emell.optimizer.sgd import SGD
+
+__all__ = [
+    "Adam",
+    "Momentum",
+    "Optimizer",
+    "RMSProp",
+    "SGD",
+]
+
+lazy_import(
+    __name__,
+    {
+        "Adam": "adam",
+        "Momentum": "momentum",
+        "Optimizer": "optimizer",
+        "RMSProp": "rms_prop",
+        "SGD": "sgd",
+    },
+)
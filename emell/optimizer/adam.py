@@ -0,0 +1,144 @@
+"""Contains the Adam optimizer."""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+from emell.optimizer.optimizer import Optimizer, Rows
+
+
+class Adam(Optimizer):  # pylint: disable=too-many-instance-attributes
+    """
+    Adaptive moment estimation.
+
+    Keeps running averages of each parameter's gradient and squared gradient,
+    and scales every step by the ratio of the two. This gives each parameter
+    its own effective learning rate.
+
+    https://arxiv.org/abs/1412.6980
+    """
+
+    def __init__(
+        self,
+        learning_rate: float = 0.001,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        epsilon: float = 1e-8,
+    ):
+        """
+        Initialize the optimizer.
+
+        Parameters
+        ----------
+        learning_rate : float
+            The largest step that is taken for any parameter, roughly.
+        beta1 : float
+            The decay rate of the average of the gradients.
+        beta2 : float
+            The decay rate of the average of the squared gradients.
+        epsilon : float
+            Added to the denominator to avoid dividing by zero.
+
+        """
+        super().__init__()
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.steps = 0
+        self._first_moments: List[np.ndarray] = []
+        self._second_moments: List[np.ndarray] = []
+        self._scratch: List[np.ndarray] = []
+
+    def step(
+        self,
+        parameters: List[np.ndarray],
+        gradients: List[np.ndarray],
+        rows: Optional[List[Optional[Rows]]] = None,
+    ) -> None:
+        """
+        Update the parameters in place.
+
+        Parameters
+        ----------
+        parameters : list
+            The parameter arrays to update.
+        gradients : list
+            The gradient of the loss with respect to each parameter.
+        rows : list, optional
+            For each parameter, None to update all of it, or the only rows or
+            columns to update.
+
+        """
+        self._first_moments = self.make_state(self._first_moments, parameters)
+        self._second_moments = self.make_state(self._second_moments, parameters)
+        self._scratch = self.make_state(self._scratch, parameters)
+
+        self.steps += 1
+        # Folds the bias correction of both moments into the step size. This is
+        # a Python float so that it doesn't promote float32 parameters.
+        step_size = (
+            self.learning_rate
+            * math.sqrt(1 - self.beta2 ** self.steps)
+            / (1 - self.beta1 ** self.steps)
+        )
+
+        for parameter, gradient, first, second, scratch, parameter_rows in zip(
+            parameters,
+            gradients,
+            self._first_moments,
+            self._second_moments,
+            self._scratch,
+            self.match_rows(rows, parameters),
+        ):
+            if parameter_rows is not None:
+                self._step_rows(
+                    parameter, gradient, first, second, parameter_rows, step_size
+                )
+                continue
+
+            first *= self.beta1
+            np.multiply(gradient, 1 - self.beta1, out=scratch)
+            first += scratch
+
+            second *= self.beta2
+            np.multiply(gradient, gradient, out=scratch)
+            scratch *= 1 - self.beta2
+            second += scratch
+
+            np.sqrt(second, out=scratch)
+            scratch += self.epsilon
+            np.divide(first, scratch, out=scratch)
+            scratch *= step_size
+            parameter -= scratch
+
+    def _step_rows(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        parameter: np.ndarray,
+        gradient: np.ndarray,
+        first: np.ndarray,
+        second: np.ndarray,
+        rows: Rows,
+        step_size: float,
+    ) -> None:
+        """Update some rows of a parameter and their moments."""
+        row_gradient = gradient[rows]
+        row_first = first[rows]
+        row_first *= self.beta1
+        update = row_gradient * (1 - self.beta1)
+        row_first += update
+        first[rows] = row_first
+
+        row_second = second[rows]
+        row_second *= self.beta2
+        np.multiply(row_gradient, row_gradient, out=update)
+        update *= 1 - self.beta2
+        row_second += update
+        second[rows] = row_second
+
+        np.sqrt(row_second, out=update)
+        update += self.epsilon
+        np.divide(row_first, update, out=update)
+        update *= step_size
+        parameter[rows] -= update
@@ -0,0 +1,105 @@
+"""Contains the momentum optimizer."""
+
+from typing import List, Optional
+
+import numpy as np
+
+from emell.optimizer.optimizer import Optimizer, Rows
+
+
+class Momentum(Optimizer):
+    """
+    Gradient descent with momentum, optionally with Nesterov's correction.
+
+    Keeps a velocity for each parameter that accumulates past gradients, so
+    that steps grow along directions where the gradient is consistent.
+    """
+
+    def __init__(
+        self, learning_rate: float, momentum: float = 0.9, nesterov: bool = False
+    ):
+        """
+        Initialize the optimizer.
+
+        Parameters
+        ----------
+        learning_rate : float
+            The amount that each gradient is scaled by.
+        momentum : float
+            The fraction of the velocity that is kept between steps.
+        nesterov : bool
+            Whether to use Nesterov accelerated gradient, which applies the
+            update as if it was looking one step ahead.
+
+        """
+        super().__init__()
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self.nesterov = nesterov
+        self._velocities: List[np.ndarray] = []
+        self._scratch: List[np.ndarray] = []
+
+    def step(
+        self,
+        parameters: List[np.ndarray],
+        gradients: List[np.ndarray],
+        rows: Optional[List[Optional[Rows]]] = None,
+    ) -> None:
+        """
+        Update the parameters in place.
+
+        Parameters
+        ----------
+        parameters : list
+            The parameter arrays to update.
+        gradients : list
+            The gradient of the loss with respect to each parameter.
+        rows : list, optional
+            For each parameter, None to update all of it, or the only rows or
+            columns to update.
+
+        """
+        self._velocities = self.make_state(self._velocities, parameters)
+        self._scratch = self.make_state(self._scratch, parameters)
+        for parameter, gradient, velocity, scratch, parameter_rows in zip(
+            parameters,
+            gradients,
+            self._velocities,
+            self._scratch,
+            self.match_rows(rows, parameters),
+        ):
+            if parameter_rows is not None:
+                self._step_rows(parameter, gradient, velocity, parameter_rows)
+                continue
+
+            # velocity = momentum * velocity - learning_rate * gradient
+            np.multiply(gradient, self.learning_rate, out=scratch)
+            velocity *= self.momentum
+            velocity -= scratch
+
+            if self.nesterov:
+                # parameter += momentum * velocity - learning_rate * gradient
+                parameter -= scratch
+                np.multiply(velocity, self.momentum, out=scratch)
+                parameter += scratch
+            else:
+                parameter += velocity
+
+    def _step_rows(
+        self,
+        parameter: np.ndarray,
+        gradient: np.ndarray,
+        velocity: np.ndarray,
+        rows: Rows,
+    ) -> None:
+        """Update some rows of a parameter and their velocity."""
+        update = gradient[rows] * self.learning_rate
+        row_velocity = velocity[rows]
+        row_velocity *= self.momentum
+        row_velocity -= update
+        velocity[rows] = row_velocity
+
+        if self.nesterov:
+            row_velocity *= self.momentum
+            row_velocity -= update
+        parameter[rows] += row_velocity
@@ -0,0 +1,106 @@
+"""Contains the abstract definition of an optimizer."""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+# The part of a parameter that an optimizer step updates: an array of unique
+# rows, or a full slice and an array of unique columns.
+Rows = Union[np.ndarray, Tuple[slice, np.ndarray]]
+
+
+class Optimizer:
+    """
+    A base representation of an optimizer.
+
+    An optimizer is handed the gradient of the loss with respect to each
+    parameter, and updates the parameters in place. Any state, like moment
+    estimates, is allocated once on the first step and updated in place after
+    that.
+
+    Parameters that only get a gradient in a few rows or columns, like the
+    table of an EmbeddingLayer or the weights of a layer with sparse input,
+    can be updated in just those. Optimizers with state then update it
+    lazily, so the state of the other rows or columns does not decay until
+    they get a gradient again.
+
+    This is intended to be a protocol in Python 3.8.
+    """
+
+    def step(
+        self,
+        parameters: List[np.ndarray],
+        gradients: List[np.ndarray],
+        rows: Optional[List[Optional[Rows]]] = None,
+    ) -> None:
+        """
+        Update the parameters in place.
+
+        Parameters
+        ----------
+        parameters : list
+            The parameter arrays to update.
+        gradients : list
+            The gradient of the loss with respect to each parameter. Must match
+            the shapes of the parameters.
+        rows : list, optional
+            For each parameter, None to update all of it, or the only rows or
+            columns whose gradient can be nonzero. Defaults to updating every
+            parameter in full.
+
+        """
+        raise NotImplementedError("The optimizer protocol is not usable.")
+
+    @staticmethod
+    def match_rows(
+        rows: Optional[List[Optional[Rows]]], parameters: List[np.ndarray]
+    ) -> List[Optional[Rows]]:
+        """
+        Get the rows to update of each parameter.
+
+        Parameters
+        ----------
+        rows : list, optional
+            The rows given to `step`.
+        parameters : list
+            The parameters given to `step`.
+
+        Returns
+        -------
+        One entry for each parameter, which is None to update all of it.
+
+        """
+        if rows is None:
+            return [None] * len(parameters)
+
+        if len(rows) != len(parameters):
+            raise ValueError("There must be rows for each parameter")
+
+        return rows
+
+    @staticmethod
+    def make_state(
+        state: List[np.ndarray], parameters: List[np.ndarray]
+    ) -> List[np.ndarray]:
+        """
+        Allocate zeroed state for each parameter, unless it already exists.
+
+        Parameters
+        ----------
+        state : list
+            The state allocated by a previous step. Empty on the first step.
+        parameters : list
+            The parameters that the state is kept for.
+
+        Returns
+        -------
+        One array of the same shape as each parameter.
+
+        """
+        if not state:
+            return [np.zeros_like(parameter) for parameter in parameters]
+
+        if [array.shape for array in state] != [p.shape for p in parameters]:
+            raise ValueError("The parameters changed shape between optimizer steps")
+
+        return state
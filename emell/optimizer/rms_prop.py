@@ -0,0 +1,107 @@
+"""Contains the RMSProp optimizer."""
+
+from typing import List, Optional
+
+import numpy as np
+
+from emell.optimizer.optimizer import Optimizer, Rows
+
+
+class RMSProp(Optimizer):
+    """
+    Root mean square propagation.
+
+    Divides each gradient by a running root mean square of that parameter's
+    recent gradients, so that steps are similar in size for every parameter.
+
+    http://www.cs.toronto.edu/~tijmen/csc321/slides/lecture_slides_lec6.pdf
+    """
+
+    def __init__(
+        self, learning_rate: float = 0.001, decay: float = 0.9, epsilon: float = 1e-8
+    ):
+        """
+        Initialize the optimizer.
+
+        Parameters
+        ----------
+        learning_rate : float
+            The amount that each normalized gradient is scaled by.
+        decay : float
+            The decay rate of the average of the squared gradients.
+        epsilon : float
+            Added to the denominator to avoid dividing by zero.
+
+        """
+        super().__init__()
+        self.learning_rate = learning_rate
+        self.decay = decay
+        self.epsilon = epsilon
+        self._mean_squares: List[np.ndarray] = []
+        self._scratch: List[np.ndarray] = []
+
+    def step(
+        self,
+        parameters: List[np.ndarray],
+        gradients: List[np.ndarray],
+        rows: Optional[List[Optional[Rows]]] = None,
+    ) -> None:
+        """
+        Update the parameters in place.
+
+        Parameters
+        ----------
+        parameters : list
+            The parameter arrays to update.
+        gradients : list
+            The gradient of the loss with respect to each parameter.
+        rows : list, optional
+            For each parameter, None to update all of it, or the only rows or
+            columns to update.
+
+        """
+        self._mean_squares = self.make_state(self._mean_squares, parameters)
+        self._scratch = self.make_state(self._scratch, parameters)
+        for parameter, gradient, mean_square, scratch, parameter_rows in zip(
+            parameters,
+            gradients,
+            self._mean_squares,
+            self._scratch,
+            self.match_rows(rows, parameters),
+        ):
+            if parameter_rows is not None:
+                self._step_rows(parameter, gradient, mean_square, parameter_rows)
+                continue
+
+            mean_square *= self.decay
+            np.multiply(gradient, gradient, out=scratch)
+            scratch *= 1 - self.decay
+            mean_square += scratch
+
+            np.sqrt(mean_square, out=scratch)
+            scratch += self.epsilon
+            np.divide(gradient, scratch, out=scratch)
+            scratch *= self.learning_rate
+            parameter -= scratch
+
+    def _step_rows(
+        self,
+        parameter: np.ndarray,
+        gradient: np.ndarray,
+        mean_square: np.ndarray,
+        rows: Rows,
+    ) -> None:
+        """Update some rows of a parameter and their mean square."""
+        row_gradient = gradient[rows]
+        row_mean_square = mean_square[rows]
+        row_mean_square *= self.decay
+        update = row_gradient * row_gradient
+        update *= 1 - self.decay
+        row_mean_square += update
+        mean_square[rows] = row_mean_square
+
+        np.sqrt(row_mean_square, out=update)
+        update += self.epsilon
+        np.divide(row_gradient, update, out=update)
+        update *= self.learning_rate
+        parameter[rows] -= update
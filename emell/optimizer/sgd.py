@@ -0,0 +1,62 @@
+"""Contains the stochastic gradient descent optimizer."""
+
+from typing import List, Optional
+
+import numpy as np
+
+from emell.optimizer.optimizer import Optimizer, Rows
+
+
+class SGD(Optimizer):
+    """
+    Plain stochastic gradient descent.
+
+    Moves each parameter against its gradient, scaled by the learning rate.
+    """
+
+    def __init__(self, learning_rate: float):
+        """
+        Initialize the optimizer.
+
+        Parameters
+        ----------
+        learning_rate : float
+            The amount that each gradient is scaled by.
+
+        """
+        super().__init__()
+        self.learning_rate = learning_rate
+        self._scratch: List[np.ndarray] = []
+
+    def step(
+        self,
+        parameters: List[np.ndarray],
+        gradients: List[np.ndarray],
+        rows: Optional[List[Optional[Rows]]] = None,
+    ) -> None:
+        """
+        Update the parameters in place.
+
+        Parameters
+        ----------
+        parameters : list
+            The parameter arrays to update.
+        gradients : list
+            The gradient of the loss with respect to each parameter.
+        rows : list, optional
+            For each parameter, None to update all of it, or the only rows or
+            columns to update.
+
+        """
+        self._scratch = self.make_state(self._scratch, parameters)
+        for parameter, gradient, scratch, parameter_rows in zip(
+            parameters, gradients, self._scratch, self.match_rows(rows, parameters)
+        ):
+            if parameter_rows is not None:
+                parameter[parameter_rows] -= (
+                    gradient[parameter_rows] * self.learning_rate
+                )
+                continue
+
+            np.multiply(gradient, self.learning_rate, out=scratch)
+            parameter -= scratch
@@ -0,0 +1,63 @@
+"""Contains tests for adam.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.optimizer import Adam
+
+
+class AdamTest(unittest.TestCase):
+    """Contains tests for the Adam optimizer."""
+
+    def test_first_step(self) -> None:
+        """Verifies that the first step has the size of the learning rate."""
+        parameter = np.array([1.0, 1.0, 1.0])
+        optimizer = Adam(0.01)
+        optimizer.step([parameter], [np.array([0.1, -5.0, 1000.0])])
+        np.testing.assert_allclose(np.array([0.99, 1.01, 0.99]), parameter, rtol=1e-6)
+
+    def test_second_step(self) -> None:
+        """Verifies the second step against the formula in the paper."""
+        parameter = np.array([1.0])
+        optimizer = Adam(0.01, beta1=0.5, beta2=0.75, epsilon=0)
+        optimizer.step([parameter], [np.array([1.0])])
+        optimizer.step([parameter], [np.array([3.0])])
+
+        first = 0.5 * (0.5 * 1.0) + 0.5 * 3.0
+        second = 0.75 * (0.25 * 1.0) + 0.25 * 9.0
+        corrected_first = first / (1 - 0.5 ** 2)
+        corrected_second = second / (1 - 0.75 ** 2)
+        expected = 0.99 - 0.01 * corrected_first / np.sqrt(corrected_second)
+        np.testing.assert_allclose(np.array([expected]), parameter)
+
+    def test_minimizes(self) -> None:
+        """Verifies that a simple quadratic is minimized."""
+        parameter = np.array([5.0, -3.0])
+        optimizer = Adam(0.1)
+        for _ in range(1000):
+            optimizer.step([parameter], [2 * parameter])
+        np.testing.assert_allclose(np.zeros(2), parameter, atol=1e-3)
+
+    def test_step_rows(self) -> None:
+        """Verifies that rows without a gradient are not moved."""
+        gradient = np.array([[2.0, -1.0], [0.0, 0.0], [0.5, 3.0]])
+        dense = np.ones((3, 2))
+        rows = np.ones((3, 2))
+        dense_optimizer = Adam(0.01)
+        rows_optimizer = Adam(0.01)
+
+        dense_optimizer.step([dense], [gradient])
+        rows_optimizer.step([rows], [gradient], [np.array([0, 2])])
+        np.testing.assert_allclose(dense, rows)
+
+        # The dense update keeps moving rows by their first moment.
+        dense_optimizer.step([dense], [np.zeros((3, 2))])
+        rows_optimizer.step([rows], [np.zeros((3, 2))], [np.array([1])])
+        self.assertFalse(np.allclose(dense, rows))
+        np.testing.assert_array_equal(np.ones(2), rows[1])
+        self.assertEqual(2, rows_optimizer.steps)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Contains tests for momentum.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.optimizer import Momentum
+
+
+class MomentumTest(unittest.TestCase):
+    """Contains tests for the Momentum optimizer."""
+
+    def test_step(self) -> None:
+        """Verifies that the velocity accumulates past gradients."""
+        parameter = np.array([1.0])
+        gradient = np.array([2.0])
+        optimizer = Momentum(0.1, momentum=0.5)
+
+        # velocity = -0.2
+        optimizer.step([parameter], [gradient])
+        np.testing.assert_allclose(np.array([0.8]), parameter)
+
+        # velocity = 0.5 * -0.2 - 0.2 = -0.3
+        optimizer.step([parameter], [gradient])
+        np.testing.assert_allclose(np.array([0.5]), parameter)
+
+    def test_nesterov(self) -> None:
+        """Verifies that Nesterov momentum looks one step ahead."""
+        parameter = np.array([1.0])
+        gradient = np.array([2.0])
+        optimizer = Momentum(0.1, momentum=0.5, nesterov=True)
+
+        # velocity = -0.2, step = 0.5 * -0.2 - 0.2
+        optimizer.step([parameter], [gradient])
+        np.testing.assert_allclose(np.array([0.7]), parameter)
+
+        # velocity = -0.3, step = 0.5 * -0.3 - 0.2
+        optimizer.step([parameter], [gradient])
+        np.testing.assert_allclose(np.array([0.35]), parameter)
+
+    def test_minimizes(self) -> None:
+        """Verifies that a simple quadratic is minimized."""
+        for nesterov in (False, True):
+            parameter = np.array([5.0, -3.0])
+            optimizer = Momentum(0.1, nesterov=nesterov)
+            for _ in range(500):
+                optimizer.step([parameter], [2 * parameter])
+            np.testing.assert_allclose(np.zeros(2), parameter, atol=1e-6)
+
+    def test_step_rows(self) -> None:
+        """Verifies that rows without a gradient keep their velocity."""
+        parameter = np.ones((2, 1))
+        optimizer = Momentum(0.1, momentum=0.5)
+
+        # The velocity of the first row is -0.2.
+        optimizer.step([parameter], [np.array([[2.0], [0.0]])], [np.array([0])])
+        np.testing.assert_allclose(np.array([[0.8], [1.0]]), parameter)
+
+        # The first row is not moved by its velocity.
+        optimizer.step([parameter], [np.array([[0.0], [2.0]])], [np.array([1])])
+        np.testing.assert_allclose(np.array([[0.8], [0.8]]), parameter)
+
+        # velocity = 0.5 * -0.2 - 0.2 = -0.3
+        optimizer.step([parameter], [np.array([[2.0], [0.0]])], [np.array([0])])
+        np.testing.assert_allclose(np.array([[0.5], [0.8]]), parameter)
+
+    def test_nesterov_rows(self) -> None:
+        """Verifies that updating every row matches the dense update."""
+        gradient = np.array([[2.0], [-1.0]])
+        dense = np.ones((2, 1))
+        rows = np.ones((2, 1))
+        dense_optimizer = Momentum(0.1, momentum=0.5, nesterov=True)
+        rows_optimizer = Momentum(0.1, momentum=0.5, nesterov=True)
+
+        for _ in range(3):
+            dense_optimizer.step([dense], [gradient])
+            rows_optimizer.step([rows], [gradient], [np.array([0, 1])])
+        np.testing.assert_allclose(dense, rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
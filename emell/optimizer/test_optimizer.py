@@ -0,0 +1,45 @@
+"""Contains tests for optimizer.py."""
+
+import unittest
+from typing import List, Optional
+
+import numpy as np
+
+from emell.optimizer import Optimizer
+from emell.optimizer.optimizer import Rows
+
+
+class OptimizerTest(unittest.TestCase):
+    """Contains tests for the Optimizer base class."""
+
+    def test_step(self) -> None:
+        """Verifies that the protocol cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            Optimizer().step([np.zeros(1)], [np.zeros(1)])
+
+    def test_make_state(self) -> None:
+        """Verifies that state is allocated once and then reused."""
+        parameters = [np.ones((2, 3)), np.ones(2)]
+        state = Optimizer.make_state([], parameters)
+        self.assertEqual([(2, 3), (2,)], [array.shape for array in state])
+        np.testing.assert_array_equal(np.zeros((2, 3)), state[0])
+
+        self.assertIs(state, Optimizer.make_state(state, parameters))
+
+        with self.assertRaises(ValueError):
+            Optimizer.make_state(state, [np.ones((2, 3))])
+
+    def test_match_rows(self) -> None:
+        """Verifies that parameters are updated in full unless given rows."""
+        parameters = [np.ones((2, 3)), np.ones(2)]
+        self.assertEqual([None, None], Optimizer.match_rows(None, parameters))
+
+        rows: List[Optional[Rows]] = [np.array([1]), (slice(None), np.array([0]))]
+        self.assertIs(rows, Optimizer.match_rows(rows, parameters))
+
+        with self.assertRaises(ValueError):
+            Optimizer.match_rows([None], parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
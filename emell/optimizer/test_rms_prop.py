@@ -0,0 +1,51 @@
+"""Contains tests for rms_prop.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.optimizer import RMSProp
+
+
+class RMSPropTest(unittest.TestCase):
+    """Contains tests for the RMSProp optimizer."""
+
+    def test_step(self) -> None:
+        """Verifies that gradients are normalized by their running magnitude."""
+        parameter = np.array([1.0, 1.0])
+        optimizer = RMSProp(0.01, decay=0.75, epsilon=0)
+
+        # mean square = 0.25 * g^2, so every step is learning_rate / 0.5.
+        optimizer.step([parameter], [np.array([2.0, -0.5])])
+        np.testing.assert_allclose(np.array([0.98, 1.02]), parameter)
+
+        # mean square = 0.75 * 0.25 * 4 + 0.25 * 16 = 4.75
+        optimizer.step([parameter], [np.array([4.0, 0.0])])
+        np.testing.assert_allclose(
+            np.array([0.98 - 0.01 * 4.0 / np.sqrt(4.75), 1.02]), parameter
+        )
+
+    def test_minimizes(self) -> None:
+        """Verifies that a simple quadratic is minimized."""
+        parameter = np.array([5.0, -3.0])
+        optimizer = RMSProp(0.01)
+        for _ in range(2000):
+            optimizer.step([parameter], [2 * parameter])
+        np.testing.assert_allclose(np.zeros(2), parameter, atol=0.05)
+
+    def test_step_rows(self) -> None:
+        """Verifies that the given rows match the dense update."""
+        gradient = np.array([[2.0, -1.0], [0.0, 0.0], [0.5, 3.0]])
+        dense = np.ones((3, 2))
+        rows = np.ones((3, 2))
+        dense_optimizer = RMSProp(0.01)
+        rows_optimizer = RMSProp(0.01)
+
+        for _ in range(3):
+            dense_optimizer.step([dense], [gradient])
+            rows_optimizer.step([rows], [gradient], [np.array([0, 2])])
+        np.testing.assert_allclose(dense, rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
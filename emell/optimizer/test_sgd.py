@@ -0,0 +1,48 @@
+"""Contains tests for sgd.py."""
+
+import unittest
+
+import numpy as np
+
+from emell.optimizer import SGD
+
+
+class SGDTest(unittest.TestCase):
+    """Contains tests for the SGD optimizer."""
+
+    def test_step(self) -> None:
+        """Verifies that parameters move against the gradient."""
+        parameters = [np.array([1.0, 2.0]), np.array([[3.0]])]
+        gradients = [np.array([10.0, -20.0]), np.array([[30.0]])]
+        optimizer = SGD(0.1)
+
+        optimizer.step(parameters, gradients)
+        np.testing.assert_allclose(np.array([0.0, 4.0]), parameters[0])
+        np.testing.assert_allclose(np.array([[0.0]]), parameters[1])
+
+        optimizer.step(parameters, gradients)
+        np.testing.assert_allclose(np.array([-1.0, 6.0]), parameters[0])
+
+        # The gradients are not modified.
+        np.testing.assert_array_equal(np.array([10.0, -20.0]), gradients[0])
+
+    def test_step_rows(self) -> None:
+        """Verifies that only the given rows are updated."""
+        parameter = np.ones((3, 2))
+        gradient = np.array([[10.0, 20.0], [30.0, 40.0], [50.0, 60.0]])
+        optimizer = SGD(0.1)
+
+        optimizer.step([parameter], [gradient], [np.array([0, 2])])
+        np.testing.assert_allclose(
+            np.array([[0.0, -1.0], [1.0, 1.0], [-4.0, -5.0]]), parameter
+        )
+
+        # A full slice and columns update only those columns.
+        optimizer.step([parameter], [gradient], [(slice(None), np.array([1]))])
+        np.testing.assert_allclose(
+            np.array([[0.0, -3.0], [1.0, -3.0], [-4.0, -11.0]]), parameter
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""Trains networks across several processes or threads."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.parallel.data_parallel import DataParallel
+    from emell.parallel.hogwild import Hogwild
+    from emell.parallel.shared_array import SharedArray
+    from emell.parallel.successive_halving import SuccessiveHalving
+
+__all__ = [
+    "DataParallel",
+    "Hogwild",
+    "SharedArray",
+    "SuccessiveHalving",
+]
+
+lazy_import(
+    __name__,
+    {
+        "DataParallel": "data_parallel",
+        "Hogwild": "hogwild",
+        "SharedArray": "shared_array",
+        "SuccessiveHalving": "successive_halving",
+    },
+)
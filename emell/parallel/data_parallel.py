@@ -0,0 +1,236 @@
+"""Contains data-parallel backpropagation over several processes."""
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Callable, List, Optional, Type, Union
+
+import numpy as np
+
+from emell.loss import Loss
+from emell.neuralnetwork import Backpropagation, Network
+from emell.optimizer import Optimizer
+from emell.parallel.shared_array import SharedArray
+from emell.sparse import CSRMatrix
+
+
+class DataParallel(Backpropagation):  # pylint: disable=too-many-instance-attributes
+    """
+    Backpropagation that splits each mini-batch across worker processes.
+
+    Each worker is forked with its own replica of the network. The replicas
+    share one copy of the parameters, and each worker writes its gradients
+    into its own slot of a shared array, so nothing is pickled but the loss.
+    The slots are averaged into the network's gradients with one product,
+    weighted by the size of each shard, and the optimizer steps once in this
+    process.
+
+    The network must have flat parameters, and must have all of its layers
+    before this is created. Only `compute_gradients` and `train_batch` run in
+    parallel. Workers should be limited to one BLAS thread each, or they will
+    compete for the same cores.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        network: Network,
+        loss_function: Union[Loss, Callable[[np.ndarray, np.ndarray], np.ndarray]],
+        loss_delta_function: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]],
+        alpha: float,
+        optimizer: Optional[Optimizer] = None,
+        processes: int = 2,
+        max_batch_size: int = 1024,
+    ):
+        """
+        Start the worker processes.
+
+        Parameters
+        ----------
+        network -> Network
+            The network to train. Must have flat parameters.
+
+        loss_function -> Loss or callable
+            The loss function. A Loss must use the mean reduction.
+
+        loss_delta -> callable
+            The vectorized derivative of the loss function with respect to each
+            output. Only used, and required, with a plain loss function.
+
+        alpha -> float
+            The training rate. Only used by the default optimizer.
+
+        optimizer -> Optimizer
+            Updates the parameters from their gradients. Defaults to plain
+            stochastic gradient descent with a learning rate of alpha.
+
+        processes -> int
+            The number of worker processes to shard each batch across.
+
+        max_batch_size -> int
+            The largest batch that can be trained on. The shared input buffers
+            are allocated to fit it.
+        """
+        super().__init__(network, loss_function, loss_delta_function, alpha, optimizer)
+        if network.parameter_buffer is None:
+            raise ValueError("Data-parallel training needs flat parameters")
+
+        if processes < 1:
+            raise ValueError("There must be at least one worker process")
+
+        parameter_count = network.parameter_buffer.size
+        self.processes = processes
+        self.max_batch_size = max_batch_size
+
+        self._parameters = SharedArray((parameter_count,), network.dtype)
+        self._gradients = SharedArray((processes, parameter_count), network.dtype)
+        self._x = SharedArray(
+            (max_batch_size, network.layers[0].neuron_count), network.dtype
+        )
+        self._y = SharedArray(
+            (max_batch_size, network.layers[-1].neuron_count), network.dtype
+        )
+        self._shared = [self._parameters, self._gradients, self._x, self._y]
+
+        # The network keeps its own gradient buffer to reduce into.
+        network.set_flat_buffers(
+            self._parameters.array, np.zeros(parameter_count, network.dtype)
+        )
+        self._shard_weights = np.empty(processes, network.dtype)
+
+        context = multiprocessing.get_context("fork")
+        self._connections: List[Connection] = []
+        self._workers: List[Any] = []
+        for index in range(processes):
+            connection, worker_connection = context.Pipe()
+            worker = context.Process(
+                target=self._work, args=(index, worker_connection), daemon=True
+            )
+            worker.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._workers.append(worker)
+
+    def compute_gradients(
+        self, x: Union[np.ndarray, CSRMatrix], y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute the gradients of a mini-batch across the worker processes.
+
+        Parameters
+        ----------
+        x -> np.ndarray or CSRMatrix
+            The input training examples, as a (batch, inputs) matrix. Sparse
+            examples are made dense in the shared input buffer.
+        y -> np.ndarray
+            The expected outputs, as a (batch, outputs) matrix.
+
+        Returns
+        -------
+        The loss for each output, averaged over the batch.
+
+        """
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("Can only train on (batch, values) matrices")
+
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("The inputs and outputs must have the same batch size")
+
+        if not self._connections:
+            raise ValueError("The worker processes have been closed")
+
+        batch_size = x.shape[0]
+        if not 0 < batch_size <= self.max_batch_size:
+            raise ValueError("The batch size must be between 1 and max_batch_size")
+
+        self._x.array[:batch_size] = x
+        self._y.array[:batch_size] = y
+
+        # Shards differ in size by at most one example. Workers without an
+        # example are left idle.
+        shards = min(self.processes, batch_size)
+        bounds = [batch_size * shard // shards for shard in range(shards + 1)]
+        for shard in range(shards):
+            self._connections[shard].send((bounds[shard], bounds[shard + 1]))
+
+        loss: Optional[np.ndarray] = None
+        error: Optional[Exception] = None
+        for shard in range(shards):
+            result = self._connections[shard].recv()
+            if isinstance(result, Exception):
+                error = result
+                continue
+
+            weight = (bounds[shard + 1] - bounds[shard]) / batch_size
+            self._shard_weights[shard] = weight
+            loss = result * weight if loss is None else loss + result * weight
+
+        if error is not None:
+            raise error
+
+        assert self.network.gradient_buffer is not None
+        np.dot(
+            self._shard_weights[:shards],
+            self._gradients.array[:shards],
+            out=self.network.gradient_buffer,
+        )
+        assert loss is not None
+        return loss
+
+    def close(self) -> None:
+        """
+        Stop the worker processes and release the shared memory.
+
+        The network is moved back into memory of its own, so it can still be
+        used afterwards. Closing twice is a no-op.
+        """
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for worker in self._workers:
+            worker.join()
+        self._connections = []
+        self._workers = []
+
+        if self._parameters.memory is None:
+            return
+
+        parameters = self._parameters.array.copy()
+        self.network.set_flat_buffers(parameters, np.zeros_like(parameters))
+        for shared in self._shared:
+            shared.close()
+
+    def _work(self, index: int, connection: Connection) -> None:
+        """
+        Compute the gradients of each shard sent to a worker process.
+
+        The forked replica of the network is pointed at the shared parameters
+        and at this worker's gradient slot. The values are already in place,
+        so nothing is copied.
+        """
+        for other in self._connections:
+            other.close()
+
+        self.network.set_flat_buffers(
+            self._parameters.array, self._gradients.array[index], copy=False
+        )
+
+        while True:
+            bounds = connection.recv()
+            if bounds is None:
+                return
+
+            start, end = bounds
+            try:
+                loss = super().compute_gradients(
+                    self._x.array[start:end], self._y.array[start:end]
+                )
+                connection.send(loss)
+            except Exception as error:  # pylint: disable=broad-except
+                connection.send(error)
+
+    def __enter__(self) -> "DataParallel":
+        """Use the workers in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Stop the workers at the end of a with statement."""
+        self.close()
@@ -0,0 +1,262 @@
+"""Contains lock-free asynchronous training across several workers."""
+
+import copy
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, List, Optional, Type, Union
+
+import numpy as np
+
+from emell.neuralnetwork import Backpropagation
+from emell.parallel.shared_array import SharedArray
+
+
+class Hogwild:  # pylint: disable=too-many-instance-attributes
+    """
+    Trains a network with several workers that update it without locks.
+
+    Each worker trains a replica of the network on its own share of the
+    examples. The replicas share the parameters of the network, so every step
+    lands in the same arrays, without waiting for the other workers. Updates
+    are small and rarely touch the same values at once, so the lost writes do
+    little harm.
+
+    Workers are threads by default. NumPy releases the GIL for matrix products,
+    so threads overlap well for wide layers. With processes, the parameters are
+    moved into shared memory, which needs flat parameters. The processes are
+    forked once, when this is created, and keep running until `close`, so the
+    optimizer state of each worker carries over from one call to `train` to
+    the next, as it does with threads. The examples of each call are pickled
+    to them.
+
+    More information can be found in the paper:
+    https://arxiv.org/abs/1106.5730
+    """
+
+    def __init__(
+        self,
+        backpropagation: Backpropagation,
+        workers: int = 2,
+        processes: bool = False,
+        seed: Union[None, int, np.random.Generator] = None,
+    ):
+        """
+        Initialize the workers.
+
+        Parameters
+        ----------
+        backpropagation : Backpropagation
+            Trains the network. Each worker gets a copy of its optimizer, so
+            any optimizer state is kept per worker.
+        workers : int
+            The number of workers to train with.
+        processes : bool
+            Whether the workers are forked processes instead of threads.
+        seed : int or np.random.Generator, optional
+            Seeds the order that the examples are shared out in.
+
+        """
+        super().__init__()
+        if workers < 1:
+            raise ValueError("There must be at least one worker")
+
+        network = backpropagation.network
+        self.backpropagation = backpropagation
+        self.workers = workers
+        self.processes = processes
+        self._rng = np.random.default_rng(seed)
+
+        self._shared: Optional[SharedArray] = None
+        if processes:
+            if network.parameter_buffer is None:
+                raise ValueError("Training in processes needs flat parameters")
+
+            self._shared = SharedArray(network.parameter_buffer.shape, network.dtype)
+            network.set_flat_buffers(
+                self._shared.array, np.zeros_like(network.parameter_buffer)
+            )
+
+        self._replicas = [
+            Backpropagation(
+                network.replicate(),
+                copy.deepcopy(backpropagation.loss_function),
+                backpropagation.loss_delta_function,
+                backpropagation.alpha,
+                copy.deepcopy(backpropagation.optimizer),
+            )
+            for _ in range(workers)
+        ]
+
+        self._connections: List[Connection] = []
+        self._workers: List[Any] = []
+        if processes:
+            context = multiprocessing.get_context("fork")
+            for index in range(workers):
+                connection, worker_connection = context.Pipe()
+                worker = context.Process(
+                    target=self._work, args=(index, worker_connection), daemon=True
+                )
+                worker.start()
+                worker_connection.close()
+                self._connections.append(connection)
+                self._workers.append(worker)
+
+    def train(self, x: np.ndarray, y: np.ndarray, batch_size: int = 1) -> np.ndarray:
+        """
+        Train on every example once, in a random order.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The input training examples, as an (examples, inputs) matrix.
+        y : np.ndarray
+            The expected outputs, as an (examples, outputs) matrix.
+        batch_size : int
+            The number of examples in each step of a worker. Defaults to one,
+            as in plain stochastic gradient descent.
+
+        Returns
+        -------
+        The loss for each output, averaged over the examples.
+
+        """
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("Can only train on (examples, values) matrices")
+
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("The inputs and outputs must have the same length")
+
+        if not self._replicas:
+            raise ValueError("The workers have been closed")
+
+        shards = [
+            shard
+            for shard in np.array_split(self._rng.permutation(x.shape[0]), self.workers)
+            if shard.size
+        ]
+        if self.processes:
+            losses = self._train_processes(x, y, shards, batch_size)
+        else:
+            losses = self._train_threads(x, y, shards, batch_size)
+
+        loss_sum = losses[0]
+        for loss in losses[1:]:
+            loss_sum += loss
+        np.divide(loss_sum, x.shape[0], out=loss_sum)
+        return loss_sum
+
+    def close(self) -> None:
+        """
+        Stop the worker processes and release their shared memory.
+
+        The network is moved back into memory of its own, so it can still be
+        used afterwards. Closing twice is a no-op.
+        """
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for worker in self._workers:
+            worker.join()
+        self._connections = []
+        self._workers = []
+
+        self._replicas = []
+        if self._shared is None:
+            return
+
+        parameters = self._shared.array.copy()
+        self.backpropagation.network.set_flat_buffers(
+            parameters, np.zeros_like(parameters)
+        )
+        self._shared.close()
+        self._shared = None
+
+    def _train_threads(
+        self, x: np.ndarray, y: np.ndarray, shards: List[np.ndarray], batch_size: int
+    ) -> List[np.ndarray]:
+        """Train each shard on a thread, and return the loss sum of each."""
+        results: List[Union[np.ndarray, Exception]] = [np.zeros(0)] * len(shards)
+
+        def work(index: int) -> None:
+            try:
+                results[index] = _train_shard(
+                    self._replicas[index],
+                    x[shards[index]],
+                    y[shards[index]],
+                    batch_size,
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                results[index] = error
+
+        threads = [
+            threading.Thread(target=work, args=(index,)) for index in range(len(shards))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return _raise_errors(results)
+
+    def _train_processes(
+        self, x: np.ndarray, y: np.ndarray, shards: List[np.ndarray], batch_size: int
+    ) -> List[np.ndarray]:
+        """Train each shard in a worker process, and return the loss sum of each."""
+        for index, shard in enumerate(shards):
+            self._connections[index].send((x[shard], y[shard], batch_size))
+        return _raise_errors(
+            [self._connections[index].recv() for index in range(len(shards))]
+        )
+
+    def _work(self, index: int, connection: Connection) -> None:
+        """
+        Train each shard sent to a worker process.
+
+        The forked replica already shares the parameters of the network, and
+        keeps its optimizer state between shards.
+        """
+        for other in self._connections:
+            other.close()
+
+        backpropagation = self._replicas[index]
+        while True:
+            work = connection.recv()
+            if work is None:
+                return
+
+            x, y, batch_size = work
+            try:
+                connection.send(_train_shard(backpropagation, x, y, batch_size))
+            except Exception as error:  # pylint: disable=broad-except
+                connection.send(error)
+
+    def __enter__(self) -> "Hogwild":
+        """Use the workers in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Release the workers at the end of a with statement."""
+        self.close()
+
+
+def _train_shard(
+    backpropagation: Backpropagation, x: np.ndarray, y: np.ndarray, batch_size: int
+) -> np.ndarray:
+    """Train on the examples in order, and return the summed loss."""
+    loss_sum = np.zeros(y.shape[1])
+    for start in range(0, x.shape[0], batch_size):
+        end = min(start + batch_size, x.shape[0])
+        loss_sum += backpropagation.train_batch(x[start:end], y[start:end]) * (
+            end - start
+        )
+    return loss_sum
+
+
+def _raise_errors(results: List[Union[np.ndarray, Exception]]) -> List[np.ndarray]:
+    """Raise the first error from a worker, or return the losses."""
+    losses = []
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+        losses.append(result)
+    return losses
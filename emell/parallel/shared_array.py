@@ -0,0 +1,58 @@
+"""Contains a NumPy array backed by shared memory."""
+
+import mmap
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class SharedArray:
+    """
+    A NumPy array whose memory can be shared between processes.
+
+    The array lives in an anonymous shared memory map, so forked processes see
+    the same array, and writes from any process are visible to all of them
+    without pickling. The memory is owned by the process that created it,
+    which must call `close` when done.
+
+    Only processes forked after the array is created can share it. The map
+    has no name, so it cannot be attached to by a process started with
+    "spawn" or "forkserver", and it cannot be pickled. This keeps Python 3.7
+    supported, which lacks `multiprocessing.shared_memory`.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: DTypeLike = np.float64):
+        """
+        Allocate the shared array.
+
+        Parameters
+        ----------
+        shape : tuple
+            The shape of the array.
+        dtype : np.dtype
+            The type of each element.
+
+        """
+        super().__init__()
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+
+        # A memory map can't be empty, even if the array is.
+        self.memory: Optional[mmap.mmap] = mmap.mmap(-1, max(size, 1))
+        self.array: np.ndarray = np.ndarray(shape, dtype, buffer=self.memory)
+
+    def close(self) -> None:
+        """
+        Release the shared memory.
+
+        Every view of the array must be released first. Closing twice is a
+        no-op.
+        """
+        if self.memory is None:
+            return
+
+        memory = self.memory
+        self.memory = None
+        del self.array
+        memory.close()
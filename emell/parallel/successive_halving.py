@@ -0,0 +1,182 @@
+"""Contains a hyperparameter search that stops poor configurations early."""
+
+import concurrent.futures
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from emell.data import Dataset
+from emell.neuralnetwork import Backpropagation, Trainer
+from emell.optimizer import Optimizer
+
+# The datasets of the current worker process, set once when it starts.
+_DATASETS: Dict[str, Optional[Dataset]] = {}
+
+
+class SuccessiveHalving:
+    """
+    Searches for the best configuration by successive halving.
+
+    Every configuration is trained for a few epochs on a pool of processes.
+    Only the best fraction, by their latest loss, is trained further, for a
+    multiple of the epochs. This repeats until one configuration remains, or
+    the most epochs have been trained, so poor configurations are stopped
+    long before they would finish a full grid search.
+
+    Networks are built from each configuration by `build`, which must be a
+    top-level function so that it can be sent to the worker processes. Between
+    rounds, the parameters and optimizer of each network are sent back and
+    forth, so training resumes where it stopped.
+
+    More information can be found in the paper:
+    https://arxiv.org/abs/1502.07943
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        build: Callable[[Dict[str, Any]], Backpropagation],
+        dataset: Dataset,
+        validation: Optional[Dataset] = None,
+        min_epochs: int = 1,
+        max_epochs: int = 27,
+        reduction_factor: int = 3,
+        processes: Optional[int] = None,
+    ):
+        """
+        Initialize the search.
+
+        Parameters
+        ----------
+        build : callable
+            Builds the backpropagation of a network from a configuration.
+        dataset : Dataset
+            The training examples.
+        validation : Dataset, optional
+            The examples that configurations are compared on. Without it,
+            they are compared on their training loss.
+        min_epochs : int
+            The number of epochs to train every configuration for.
+        max_epochs : int
+            The largest number of epochs to train any configuration for.
+        reduction_factor : int
+            Only one in this many configurations is kept after each round, and
+            the survivors train for this many times as many epochs.
+        processes : int, optional
+            The number of worker processes. Defaults to the number of CPUs.
+
+        """
+        super().__init__()
+        if not 1 <= min_epochs <= max_epochs:
+            raise ValueError("Need 1 <= min_epochs <= max_epochs")
+
+        if reduction_factor < 2:
+            raise ValueError("The reduction factor must be at least two")
+
+        self.build = build
+        self.dataset = dataset
+        self.validation = validation
+        self.min_epochs = min_epochs
+        self.max_epochs = max_epochs
+        self.reduction_factor = reduction_factor
+        self.processes = processes
+
+    def search(
+        self, configurations: List[Dict[str, Any]]
+    ) -> List["SuccessiveHalving.Trial"]:
+        """
+        Find the best of the configurations.
+
+        Parameters
+        ----------
+        configurations : list
+            The configurations to try, each passed to `build`.
+
+        Returns
+        -------
+        A trial for each configuration, from best to worst. Configurations
+        that trained for longer come first, then those with a lower loss.
+
+        """
+        trials = [SuccessiveHalving.Trial(c, [], []) for c in configurations]
+        optimizers: List[Optional[Optimizer]] = [None] * len(trials)
+        survivors = list(range(len(trials)))
+        epochs = self.min_epochs
+
+        with concurrent.futures.ProcessPoolExecutor(
+            self.processes,
+            initializer=_set_datasets,
+            initargs=(self.dataset, self.validation),
+        ) as executor:
+            while survivors:
+                futures = {
+                    index: executor.submit(
+                        _train,
+                        self.build,
+                        trials[index].configuration,
+                        trials[index].parameters,
+                        optimizers[index],
+                        epochs - len(trials[index].losses),
+                    )
+                    for index in survivors
+                }
+                for index, future in futures.items():
+                    losses, parameters, optimizers[index] = future.result()
+                    trials[index] = trials[index]._replace(
+                        losses=trials[index].losses + losses, parameters=parameters
+                    )
+
+                if len(survivors) == 1 or epochs == self.max_epochs:
+                    break
+
+                survivors.sort(key=lambda index: _sort_key(trials[index]))
+                survivors = survivors[: len(survivors) // self.reduction_factor or 1]
+                epochs = min(epochs * self.reduction_factor, self.max_epochs)
+
+        return sorted(trials, key=_sort_key)
+
+    class Trial(NamedTuple):
+        """Represents the training of one configuration."""
+
+        configuration: Dict[str, Any]
+        # The loss after each epoch, on the validation dataset if there is one.
+        losses: List[float]
+        # The parameters of the network when it stopped training.
+        parameters: List[np.ndarray]
+
+
+def _sort_key(trial: SuccessiveHalving.Trial) -> Tuple[int, float]:
+    """Sort longer trials first, then lower losses, with NaN losses last."""
+    loss = trial.losses[-1] if trial.losses else math.inf
+    return -len(trial.losses), math.inf if math.isnan(loss) else loss
+
+
+def _set_datasets(dataset: Dataset, validation: Optional[Dataset]) -> None:
+    """Keep the datasets in a worker process, so they are sent only once."""
+    _DATASETS["dataset"] = dataset
+    _DATASETS["validation"] = validation
+
+
+def _train(
+    build: Callable[[Dict[str, Any]], Backpropagation],
+    configuration: Dict[str, Any],
+    parameters: List[np.ndarray],
+    optimizer: Optional[Optimizer],
+    epochs: int,
+) -> Tuple[List[float], List[np.ndarray], Optimizer]:
+    """Resume training a configuration in a worker process."""
+    backpropagation = build(configuration)
+    network = backpropagation.network
+    for parameter, value in zip(network.parameters(), parameters):
+        np.copyto(parameter, value)
+    if optimizer is not None:
+        backpropagation.optimizer = optimizer
+
+    dataset = _DATASETS["dataset"]
+    assert dataset is not None
+    validation = _DATASETS["validation"]
+    history = Trainer(backpropagation).fit(dataset, epochs, validation)
+    losses = (
+        history.validation_losses if validation is not None else history.training_losses
+    )
+    return losses, network.parameters(), backpropagation.optimizer
@@ -0,0 +1,144 @@
+"""Contains tests for data_parallel.py"""
+
+import unittest
+
+import numpy as np
+
+from emell.computation import (
+    constant,
+    delta_quadratic_loss,
+    identity,
+    quadratic_loss,
+    relu,
+    relu_prime,
+)
+from emell.data import ArrayDataset
+from emell.initializer import Normal
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network, Trainer
+from emell.optimizer import Adam
+from emell.parallel import DataParallel
+
+
+def make_network() -> Network:
+    """Make a small network with flat parameters, the same on every call."""
+    network = Network(3, flat_parameters=True)
+    network.add_layer(DenseLayer(4, relu, relu_prime, initializer=Normal(seed=1)))
+    network.add_layer(
+        DenseLayer(2, identity, constant(np.ones(1)), initializer=Normal(seed=2))
+    )
+    return network
+
+
+class DataParallelTest(unittest.TestCase):
+    """Tests for the DataParallel class."""
+
+    def test_matches_backpropagation(self) -> None:
+        """Checks that sharded gradients match those of the whole batch."""
+        network = make_network()
+        serial = Backpropagation(
+            make_network(), quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(7, 3))
+        y = rng.normal(size=(7, 2))
+
+        with DataParallel(
+            network, quadratic_loss, delta_quadratic_loss, 0.1, processes=3
+        ) as parallel:
+            for _ in range(3):
+                np.testing.assert_allclose(
+                    serial.train_batch(x, y), parallel.train_batch(x, y)
+                )
+                np.testing.assert_allclose(
+                    serial.network.gradients()[0], network.gradients()[0]
+                )
+                np.testing.assert_allclose(
+                    serial.network.parameters()[0], network.parameters()[0]
+                )
+
+            # Batches smaller than the number of processes leave workers idle.
+            np.testing.assert_allclose(
+                serial.compute_gradients(x[:2], y[:2]),
+                parallel.compute_gradients(x[:2], y[:2]),
+            )
+            np.testing.assert_allclose(
+                serial.network.gradients()[0], network.gradients()[0]
+            )
+
+    def test_trainer(self) -> None:
+        """Checks that the trainer can run data-parallel backpropagation."""
+        x = np.random.default_rng(0).integers(-5, 6, size=(200, 3))
+        y = np.stack([x[:, 0] + x[:, 1], x[:, 2]], axis=1)
+        network = Network(3, flat_parameters=True)
+        network.add_layer(DenseLayer(2, identity, constant(np.ones(1))))
+
+        with DataParallel(
+            network,
+            quadratic_loss,
+            delta_quadratic_loss,
+            0.1,
+            optimizer=Adam(0.1),
+            processes=2,
+            max_batch_size=20,
+        ) as parallel:
+            history = Trainer(parallel).fit(ArrayDataset(x, y, 20), 30)
+
+        self.assertLess(history.training_losses[-1], 1e-3)
+
+        # The network still works once the workers are gone.
+        np.testing.assert_allclose(y, network.predict(x), atol=0.1)
+        self.assertFalse(np.shares_memory(network.parameters()[0], x))
+
+    def test_invalid(self) -> None:
+        """Checks that invalid configurations and batches are rejected."""
+        with self.assertRaises(ValueError):
+            network = Network(3)
+            network.add_layer(DenseLayer(2, identity, constant(np.ones(1))))
+            DataParallel(network, quadratic_loss, delta_quadratic_loss, 0.1)
+
+        with self.assertRaises(ValueError):
+            DataParallel(
+                make_network(), quadratic_loss, delta_quadratic_loss, 0.1, processes=0
+            )
+
+        parallel = DataParallel(
+            make_network(),
+            quadratic_loss,
+            delta_quadratic_loss,
+            0.1,
+            max_batch_size=4,
+        )
+        try:
+            with self.assertRaises(ValueError):
+                parallel.train_batch(np.ones((5, 3)), np.ones((5, 2)))
+
+            with self.assertRaises(ValueError):
+                parallel.train_batch(np.ones((2, 3)), np.ones((3, 2)))
+
+            with self.assertRaises(ValueError):
+                parallel.train_batch(np.ones(3), np.ones(2))
+
+        finally:
+            parallel.close()
+
+        with self.assertRaises(ValueError):
+            parallel.train_batch(np.ones((2, 3)), np.ones((2, 2)))
+        parallel.close()
+
+    def test_worker_error(self) -> None:
+        """Checks that errors in the workers are raised in this process."""
+
+        def fail(output: np.ndarray, expected: np.ndarray) -> np.ndarray:
+            raise ArithmeticError("Failed in a worker")
+
+        with DataParallel(make_network(), quadratic_loss, fail, 0.1) as parallel:
+            with self.assertRaises(ArithmeticError):
+                parallel.train_batch(np.ones((2, 3)), np.ones((2, 2)))
+
+            # The workers are still running after an error.
+            with self.assertRaises(ArithmeticError):
+                parallel.train_batch(np.ones((2, 3)), np.ones((2, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Contains tests for hogwild.py"""
+
+import unittest
+from typing import Tuple
+
+import numpy as np
+
+from emell.computation import constant, delta_quadratic_loss, identity, quadratic_loss
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network
+from emell.optimizer import Adam
+from emell.parallel import Hogwild
+
+
+def make_backpropagation(flat_parameters: bool) -> Backpropagation:
+    """Make backpropagation for a network that learns a linear function."""
+    network = Network(3, flat_parameters=flat_parameters)
+    network.add_layer(DenseLayer(2, identity, constant(np.ones(1))))
+    return Backpropagation(network, quadratic_loss, delta_quadratic_loss, 0.01)
+
+
+def make_examples() -> Tuple[np.ndarray, np.ndarray]:
+    """Make examples of the linear function."""
+    x = np.random.default_rng(0).integers(-5, 6, size=(300, 3))
+    y = np.stack([x[:, 0] + x[:, 1], 0.5 * x[:, 2] - 1], axis=1)
+    return x, y
+
+
+class HogwildTest(unittest.TestCase):
+    """Tests for the Hogwild class."""
+
+    def test_threads(self) -> None:
+        """Checks that threads train the shared parameters."""
+        backpropagation = make_backpropagation(False)
+        x, y = make_examples()
+
+        with Hogwild(backpropagation, workers=3, seed=0) as hogwild:
+            losses = [hogwild.train(x, y) for _ in range(20)]
+            self.assertEqual((2,), losses[0].shape)
+            self.assertLess(np.sum(losses[-1]), 1e-6)
+
+        network = backpropagation.network
+        np.testing.assert_allclose(y, network.predict(x), atol=1e-3)
+
+    def test_processes(self) -> None:
+        """Checks that forked processes train the shared parameters."""
+        backpropagation = make_backpropagation(True)
+        x, y = make_examples()
+
+        with Hogwild(backpropagation, workers=2, processes=True, seed=0) as hogwild:
+            for _ in range(20):
+                loss = hogwild.train(x, y, batch_size=2)
+            self.assertLess(np.sum(loss), 1e-6)
+
+        # The network still works once the shared memory is gone.
+        network = backpropagation.network
+        np.testing.assert_allclose(y, network.predict(x), atol=1e-3)
+
+    def test_optimizer_state(self) -> None:
+        """Checks that worker processes keep their optimizer state between calls."""
+        x, y = make_examples()
+        parameters = []
+        for processes in (False, True):
+            backpropagation = make_backpropagation(True)
+            backpropagation.optimizer = Adam(0.01)
+            for parameter in backpropagation.network.parameters():
+                parameter[...] = 0.5
+            with Hogwild(
+                backpropagation, workers=1, processes=processes, seed=0
+            ) as hogwild:
+                for _ in range(3):
+                    hogwild.train(x, y, batch_size=10)
+            parameters.append(backpropagation.network.parameters())
+
+        # A single worker trains the same way in a thread and in a process,
+        # as long as its Adam moments carry over.
+        for thread_parameter, process_parameter in zip(*parameters):
+            np.testing.assert_allclose(thread_parameter, process_parameter)
+
+    def test_more_workers_than_examples(self) -> None:
+        """Checks that workers without examples are left idle."""
+        hogwild = Hogwild(make_backpropagation(False), workers=4)
+        loss = hogwild.train(np.ones((2, 3)), np.ones((2, 2)))
+        self.assertEqual((2,), loss.shape)
+
+    def test_errors(self) -> None:
+        """Checks that invalid input and errors in the workers are raised."""
+        with self.assertRaises(ValueError):
+            Hogwild(make_backpropagation(False), workers=0)
+
+        with self.assertRaises(ValueError):
+            Hogwild(make_backpropagation(False), processes=True)
+
+        def fail(output: np.ndarray, expected: np.ndarray) -> np.ndarray:
+            raise ArithmeticError("Failed in a worker")
+
+        for processes in (False, True):
+            backpropagation = make_backpropagation(True)
+            backpropagation.loss_delta_function = fail
+            with Hogwild(backpropagation, processes=processes) as hogwild:
+                with self.assertRaises(ArithmeticError):
+                    hogwild.train(np.ones((4, 3)), np.ones((4, 2)))
+
+                with self.assertRaises(ValueError):
+                    hogwild.train(np.ones((4, 3)), np.ones((3, 2)))
+
+                with self.assertRaises(ValueError):
+                    hogwild.train(np.ones(3), np.ones(2))
+
+            with self.assertRaises(ValueError):
+                hogwild.train(np.ones((4, 3)), np.ones((4, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Contains tests for shared_array.py"""
+
+import multiprocessing
+import unittest
+
+import numpy as np
+
+from emell.parallel import SharedArray
+
+
+def _fill(shared: SharedArray) -> None:
+    """Write into the shared array from a forked process."""
+    shared.array[...] = 7
+
+
+class SharedArrayTest(unittest.TestCase):
+    """Tests for the SharedArray class."""
+
+    def test_shared_array(self) -> None:
+        """Checks that writes from a forked process are visible."""
+        shared = SharedArray((2, 3), np.float32)
+        try:
+            self.assertEqual((2, 3), shared.array.shape)
+            self.assertEqual(np.float32, shared.array.dtype)
+
+            process = multiprocessing.get_context("fork").Process(
+                target=_fill, args=(shared,)
+            )
+            process.start()
+            process.join()
+            np.testing.assert_array_equal(np.full((2, 3), 7), shared.array)
+        finally:
+            shared.close()
+
+        self.assertIsNone(shared.memory)
+        shared.close()
+
+    def test_empty(self) -> None:
+        """Checks that empty arrays can be allocated."""
+        shared = SharedArray((0, 3))
+        self.assertEqual((0, 3), shared.array.shape)
+        shared.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Contains tests for successive_halving.py"""
+
+import unittest
+from typing import Any, Dict
+
+import numpy as np
+
+from emell.computation import constant, delta_quadratic_loss, identity, quadratic_loss
+from emell.data import ArrayDataset
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network
+from emell.optimizer import Momentum
+from emell.parallel import SuccessiveHalving
+
+
+def build(configuration: Dict[str, Any]) -> Backpropagation:
+    """Build a network that learns a linear function."""
+    network = Network(2)
+    network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+    return Backpropagation(
+        network,
+        quadratic_loss,
+        delta_quadratic_loss,
+        configuration["alpha"],
+        optimizer=Momentum(configuration["alpha"]),
+    )
+
+
+def make_dataset(seed: int) -> ArrayDataset:
+    """Make examples of the linear function."""
+    x = np.random.default_rng(seed).uniform(-1, 1, size=(100, 2))
+    return ArrayDataset(x, x[:, :1] - 2 * x[:, 1:] + 0.5, 10)
+
+
+class SuccessiveHalvingTest(unittest.TestCase):
+    """Tests for the SuccessiveHalving class."""
+
+    def test_search(self) -> None:
+        """Checks that the best configuration trains for longest."""
+        alphas = [0.0, 1e-4, 0.05, 1e-3, 10.0, 1e-5]
+        search = SuccessiveHalving(
+            build,
+            make_dataset(0),
+            make_dataset(1),
+            min_epochs=2,
+            max_epochs=20,
+            reduction_factor=2,
+            processes=2,
+        )
+        trials = search.search([{"alpha": alpha} for alpha in alphas])
+
+        self.assertEqual(len(alphas), len(trials))
+        self.assertEqual({"alpha": 0.05}, trials[0].configuration)
+        self.assertLess(trials[0].losses[-1], 1e-4)
+
+        # 6 configurations train for 2 epochs, then 3 for 4, then 1 for 8.
+        self.assertEqual([8, 4, 4, 2, 2, 2], [len(t.losses) for t in trials])
+
+        # The diverging configuration is ranked last.
+        self.assertEqual({"alpha": 10.0}, trials[-1].configuration)
+
+        # Training resumed from the parameters of the previous round.
+        losses = trials[0].losses
+        self.assertLess(losses[-1], losses[1])
+
+        # The parameters can be loaded into a new network.
+        backpropagation = build(trials[0].configuration)
+        for parameter, value in zip(
+            backpropagation.network.parameters(), trials[0].parameters
+        ):
+            np.copyto(parameter, value)
+        np.testing.assert_allclose(
+            np.array([[1.0, -2.0]]),
+            backpropagation.network.layers[1].get_weights(),
+            atol=0.01,
+        )
+
+    def test_max_epochs(self) -> None:
+        """Checks that training stops at the most epochs."""
+        search = SuccessiveHalving(
+            build, make_dataset(0), min_epochs=2, max_epochs=3, processes=1
+        )
+        trials = search.search([{"alpha": 0.01}, {"alpha": 0.02}, {"alpha": 0.03}])
+        self.assertEqual([3, 2, 2], [len(t.losses) for t in trials])
+        self.assertEqual({"alpha": 0.03}, trials[0].configuration)
+
+    def test_invalid(self) -> None:
+        """Checks that invalid schedules are rejected."""
+        with self.assertRaises(ValueError):
+            SuccessiveHalving(build, make_dataset(0), min_epochs=0)
+
+        with self.assertRaises(ValueError):
+            SuccessiveHalving(build, make_dataset(0), min_epochs=3, max_epochs=2)
+
+        with self.assertRaises(ValueError):
+            SuccessiveHalving(build, make_dataset(0), reduction_factor=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Saves and loads networks in a binary model format."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.serialization.activations import (
+        get_activation,
+        get_activation_name,
+        register_activation,
+        register_activation_type,
+    )
+    from emell.serialization.checkpointer import Checkpointer
+    from emell.serialization.load import load
+    from emell.serialization.save import save
+
+__all__ = [
+    "Checkpointer",
+    "get_activation",
+    "get_activation_name",
+    "load",
+    "register_activation",
+    "register_activation_type",
+    "save",
+]
+
+lazy_import(
+    __name__,
+    {
+        "Checkpointer": "checkpointer",
+        "get_activation": "activations",
+        "get_activation_name": "activations",
+        "load": "load",
+        "register_activation": "activations",
+        "register_activation_type": "activations",
+        "save": "save",
+    },
+)
@@ -0,0 +1,130 @@
+"""Contains the registry of activation functions that can be saved by name."""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from emell.activation import (
+    Activation,
+    Identity,
+    LeakyReLU,
+    ReLU,
+    Sigmoid,
+    Softmax,
+    Softplus,
+    Tanh,
+)
+from emell.computation import identity, identity_prime, relu, relu_prime
+
+ActivationFunction = Callable[[np.ndarray], np.ndarray]
+
+# Each activation function and its derivative, by the name saved in files.
+_ACTIVATIONS: Dict[str, Tuple[ActivationFunction, ActivationFunction]] = {}
+
+# Each Activation class, by the name saved in files. Instances are saved with
+# their config, so that differently configured instances share a name.
+_ACTIVATION_TYPES: Dict[str, Type[Activation]] = {}
+
+
+def register_activation(
+    name: str, activation: ActivationFunction, activation_prime: ActivationFunction
+) -> None:
+    """
+    Register an activation function, so that layers using it can be saved.
+
+    Parameters
+    ----------
+    name : str
+        The name that the activation is saved under.
+    activation : function(np.ndarray) -> np.ndarray
+        The activation function.
+    activation_prime : function(np.ndarray) -> np.ndarray
+        The derivative of the activation function, given to loaded layers.
+
+    """
+    if name in _ACTIVATION_TYPES or (
+        name in _ACTIVATIONS and _ACTIVATIONS[name][0] is not activation
+    ):
+        raise ValueError(f"Another activation is registered as {name}")
+
+    _ACTIVATIONS[name] = (activation, activation_prime)
+
+
+def register_activation_type(name: str, activation_type: Type[Activation]) -> None:
+    """
+    Register an Activation class, so that layers using any instance can be saved.
+
+    Parameters
+    ----------
+    name : str
+        The name that the activation is saved under.
+    activation_type : type
+        The class, which is recreated from the config of the saved instance.
+
+    """
+    if name in _ACTIVATIONS or (
+        name in _ACTIVATION_TYPES and _ACTIVATION_TYPES[name] is not activation_type
+    ):
+        raise ValueError(f"Another activation is registered as {name}")
+
+    _ACTIVATION_TYPES[name] = activation_type
+
+
+def get_activation(
+    name: str, config: Optional[Dict[str, Any]] = None
+) -> Tuple[ActivationFunction, ActivationFunction]:
+    """
+    Get a registered activation function and its derivative by name.
+
+    Parameters
+    ----------
+    name : str
+        The name that the activation was registered under.
+    config : dict, optional
+        The config of a saved Activation, passed to its constructor.
+
+    """
+    if name in _ACTIVATION_TYPES:
+        activation = _ACTIVATION_TYPES[name](**(config or {}))
+        return activation, activation.prime
+
+    if name not in _ACTIVATIONS:
+        raise ValueError(f"No activation is registered as {name}")
+
+    if config:
+        raise ValueError(f"The activation {name} takes no config")
+
+    return _ACTIVATIONS[name]
+
+
+def get_activation_name(activation: ActivationFunction) -> str:
+    """
+    Get the name that an activation function was registered under.
+
+    Parameters
+    ----------
+    activation : Activation or function(np.ndarray) -> np.ndarray
+        The activation function.
+
+    """
+    if isinstance(activation, Activation):
+        for name, activation_type in _ACTIVATION_TYPES.items():
+            if activation.__class__ is activation_type:
+                return name
+    else:
+        for name, (registered, _) in _ACTIVATIONS.items():
+            if registered is activation:
+                return name
+
+    raise ValueError(f"The activation {activation} is not registered")
+
+
+register_activation("identity", identity, identity_prime)
+register_activation("relu", relu, relu_prime)
+register_activation_type("Identity", Identity)
+register_activation_type("LeakyReLU", LeakyReLU)
+register_activation_type("ReLU", ReLU)
+register_activation_type("Sigmoid", Sigmoid)
+register_activation_type("Softmax", Softmax)
+register_activation_type("Softplus", Softplus)
+register_activation_type("Tanh", Tanh)
@@ -0,0 +1,188 @@
+"""Contains a checkpointer that writes snapshots on a background thread."""
+
+import os
+import queue
+import threading
+from typing import List, Optional, Tuple, Type
+
+import numpy as np
+
+from emell.neuralnetwork import Network
+from emell.serialization.save import save
+
+
+class Checkpointer:  # pylint: disable=too-many-instance-attributes
+    """
+    Periodically saves a network while it trains, without waiting on disk.
+
+    Every `interval` training steps, the parameters are copied into a snapshot
+    buffer that is allocated once. The snapshot is saved on a background
+    thread, to a temporary file that is then renamed into place, so a crash
+    never leaves a partial checkpoint behind. Only the newest `keep`
+    checkpoints are kept.
+
+    There are two snapshot buffers, so one can be filled while the other is
+    written. If both are still being written when a checkpoint is due, that
+    checkpoint is skipped rather than stalling training.
+    """
+
+    def __init__(
+        self, directory: str, interval: int, keep: int = 3, prefix: str = "checkpoint"
+    ):
+        """
+        Initialize the checkpointer.
+
+        Parameters
+        ----------
+        directory : str
+            The directory to write checkpoints to. Created if missing.
+        interval : int
+            The number of training steps between checkpoints.
+        keep : int
+            The number of the newest checkpoints to keep.
+        prefix : str
+            The start of each checkpoint's file name, which is followed by
+            the step number.
+
+        """
+        super().__init__()
+        if interval < 1 or keep < 1:
+            raise ValueError("The interval and number to keep must be positive")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self.prefix = prefix
+        self.steps = 0
+        self.skipped = 0
+        # The paths of the checkpoints written so far, oldest first.
+        self.paths: List[str] = []
+
+        self._free: "queue.Queue[List[np.ndarray]]" = queue.Queue()
+        self._buffer_count = 0
+        self._pending: "queue.Queue[Optional[Tuple[Network, List[np.ndarray], int]]]"
+        self._pending = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+
+    def update(self, network: Network) -> bool:
+        """
+        Count a training step, and snapshot the network if a checkpoint is due.
+
+        Parameters
+        ----------
+        network : Network
+            The network being trained.
+
+        Returns
+        -------
+        Whether a snapshot was taken.
+
+        """
+        self.steps += 1
+        if self.steps % self.interval:
+            return False
+
+        return self.checkpoint(network)
+
+    def checkpoint(self, network: Network) -> bool:
+        """
+        Snapshot the network now, and save it on the background thread.
+
+        Parameters
+        ----------
+        network : Network
+            The network to save.
+
+        Returns
+        -------
+        Whether a snapshot was taken. False if both snapshot buffers are
+        still being written.
+
+        """
+        self._raise_error()
+        snapshot = self._get_buffer(network.parameters())
+        if snapshot is None:
+            self.skipped += 1
+            return False
+
+        for buffer, parameter in zip(snapshot, network.parameters()):
+            np.copyto(buffer, parameter)
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write, daemon=True)
+            self._thread.start()
+        self._pending.put((network, snapshot, self.steps))
+        return True
+
+    def flush(self) -> None:
+        """Wait for every snapshot taken so far to be written."""
+        self._pending.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write the remaining snapshots, and stop the background thread."""
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _get_buffer(self, parameters: List[np.ndarray]) -> Optional[List[np.ndarray]]:
+        """Get a free snapshot buffer, allocating up to two of them."""
+        try:
+            snapshot = self._free.get_nowait()
+        except queue.Empty:
+            if self._buffer_count == 2:
+                return None
+            self._buffer_count += 1
+            return [np.empty_like(parameter) for parameter in parameters]
+
+        if [b.shape for b in snapshot] != [p.shape for p in parameters]:
+            return [np.empty_like(parameter) for parameter in parameters]
+        return snapshot
+
+    def _write(self) -> None:
+        """Save each snapshot, until told to stop."""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                self._pending.task_done()
+                return
+
+            network, snapshot, step = item
+            try:
+                self._save(network, snapshot, step)
+            except Exception as error:  # pylint: disable=broad-except
+                self._error = error
+            self._free.put(snapshot)
+            self._pending.task_done()
+
+    def _save(self, network: Network, snapshot: List[np.ndarray], step: int) -> None:
+        """Atomically save a snapshot, and delete the oldest checkpoints."""
+        path = os.path.join(self.directory, f"{self.prefix}-{step}.emell")
+        temporary_path = path + ".tmp"
+        save(network, temporary_path, snapshot)
+        os.replace(temporary_path, path)
+
+        if path in self.paths:
+            self.paths.remove(path)
+        self.paths.append(path)
+        while len(self.paths) > self.keep:
+            os.remove(self.paths.pop(0))
+
+    def _raise_error(self) -> None:
+        """Raise the last error from the background thread, if any."""
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def __enter__(self) -> "Checkpointer":
+        """Use the checkpointer in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Write the remaining snapshots at the end of a with statement."""
+        self.close()
@@ -0,0 +1,105 @@
+"""Contains a function to load a network from the binary model format."""
+
+import json
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from emell.initializer import Initializer
+from emell.neuralnetwork import DenseLayer, EmbeddingLayer, Network
+from emell.serialization.activations import get_activation
+from emell.serialization.model_format import MAGIC, PREFIX, VERSION, parameter_offset
+
+
+def load(path: str, mmap_mode: Optional[str] = "r") -> Network:
+    """
+    Load a network from a file in the binary model format.
+
+    By default, the parameters are memory-mapped rather than read, so loading
+    takes about the same time whatever the size of the network. Pages of the
+    file are only read as predictions touch them, and are shared by every
+    process that loads the same file.
+
+    Parameters
+    ----------
+    path : str
+        The file written by `save`.
+    mmap_mode : str, optional
+        "r" to map the parameters read-only, which suits inference. "c" to map
+        them copy-on-write, so the network can be trained without changing the
+        file. None to read them into memory.
+
+    Returns
+    -------
+    A network with flat parameters, holding the saved values.
+
+    """
+    if mmap_mode not in ("r", "c", None):
+        raise ValueError("The mmap mode must be 'r', 'c' or None")
+
+    with open(path, "rb") as file:
+        prefix = file.read(PREFIX.size)
+        if len(prefix) < PREFIX.size or prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a model file")
+
+        _, version, header_length = PREFIX.unpack(prefix)
+        if version != VERSION:
+            raise ValueError(f"Unsupported model format version {version}")
+
+        header = json.loads(file.read(header_length).decode("utf-8"))
+
+    dtype = np.dtype(str(header["dtype"]))
+    network = Network(header["input_count"], dtype=dtype)
+    for layer in header["layers"]:
+        if layer["type"] == "EmbeddingLayer":
+            network.add_layer(
+                EmbeddingLayer(
+                    layer["vocabulary_size"],
+                    layer["dimension"],
+                    initializer=_Uninitialized(),
+                )
+            )
+            continue
+
+        if layer["type"] != "DenseLayer":
+            raise ValueError(f"Unknown layer type {layer['type']}")
+
+        activation, activation_prime = get_activation(
+            layer["activation"], layer.get("activation_config")
+        )
+        network.add_layer(
+            DenseLayer(
+                layer["neuron_count"],
+                activation,
+                activation_prime,
+                initializer=_Uninitialized(),
+            )
+        )
+
+    count = int(header["parameter_count"])
+    offset = parameter_offset(header_length)
+    if mmap_mode is None:
+        with open(path, "rb") as file:
+            file.seek(offset)
+            parameters = np.fromfile(file, dtype, count)
+    elif count:
+        parameters = np.memmap(
+            path, dtype, "r" if mmap_mode == "r" else "c", offset, (count,)
+        )
+    else:
+        parameters = np.empty(0, dtype)
+
+    if parameters.size != count:
+        raise ValueError(f"{path} is truncated")
+
+    network.set_flat_buffers(parameters, np.zeros(count, dtype), copy=False)
+    return network
+
+
+class _Uninitialized(Initializer):
+    """Leaves weights uninitialized, as they are about to be replaced."""
+
+    def initialize(self, shape: Tuple[int, int], dtype: DTypeLike) -> np.ndarray:
+        """Create an uninitialized weight matrix."""
+        return np.empty(shape, dtype)
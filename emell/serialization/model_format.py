@@ -0,0 +1,44 @@
+"""
+Contains the constants of the binary model format.
+
+A model file is laid out as:
+
+1. The 8 magic bytes `EMELLNET`.
+2. The format version, as a little-endian uint32.
+3. The length of the header in bytes, as a little-endian uint32.
+4. The header, as UTF-8 JSON. It holds the input count, the dtype of the
+   parameters, and the type, neuron count and activation name of each dense
+   layer, with the constructor arguments of Activation objects. Embedding
+   layers have their vocabulary size and dimension instead. It also holds the
+   number of parameters.
+5. Zero padding, up to the next multiple of 64 bytes.
+6. Every parameter of the network as one raw C-ordered array, in the order of
+   `Network.parameters`. This is exactly the flat parameter buffer of the
+   network, so it can be memory-mapped in place.
+"""
+
+import struct
+
+MAGIC = b"EMELLNET"
+VERSION = 1
+
+# The magic bytes, the version and the header length.
+PREFIX = struct.Struct("<8sII")
+
+# The parameters start at a multiple of this many bytes, which is the size of a
+# cache line and suits any SIMD width.
+ALIGNMENT = 64
+
+
+def parameter_offset(header_length: int) -> int:
+    """
+    Get the offset of the parameters from the start of a model file.
+
+    Parameters
+    ----------
+    header_length : int
+        The length of the JSON header in bytes.
+
+    """
+    end = PREFIX.size + header_length
+    return -(-end // ALIGNMENT) * ALIGNMENT
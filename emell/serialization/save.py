@@ -0,0 +1,79 @@
+"""Contains a function to save a network to the binary model format."""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from emell.activation import Activation
+from emell.neuralnetwork import DenseLayer, EmbeddingLayer, Network
+from emell.serialization.activations import get_activation_name
+from emell.serialization.model_format import MAGIC, PREFIX, VERSION, parameter_offset
+
+
+def save(
+    network: Network, path: str, parameters: Optional[List[np.ndarray]] = None
+) -> None:
+    """
+    Save a network to a file in the binary model format.
+
+    Dense layers are saved by size and the registered name of their
+    activation, along with the config of an Activation. Embedding layers are
+    saved by vocabulary size and dimension. The parameters are
+    saved as raw arrays, aligned so that `load` can memory-map them.
+
+    Parameters
+    ----------
+    network : Network
+        The network to save. Every layer after the input must be an
+        EmbeddingLayer, or a DenseLayer with a registered activation.
+    path : str
+        The file to write.
+    parameters : list, optional
+        Values to save in place of the network's current parameters, such as
+        a snapshot taken earlier. Must match the shapes of `Network.parameters`.
+
+    """
+    layers: List[Dict[str, Any]] = []
+    for layer in network.layers[1:]:
+        if isinstance(layer, EmbeddingLayer):
+            layers.append(
+                {
+                    "type": "EmbeddingLayer",
+                    "vocabulary_size": layer.vocabulary_size,
+                    "dimension": layer.dimension,
+                }
+            )
+            continue
+
+        if not isinstance(layer, DenseLayer):
+            raise ValueError(f"Can't save layers of type {type(layer).__name__}")
+
+        description: Dict[str, Any] = {
+            "type": "DenseLayer",
+            "neuron_count": layer.neuron_count,
+            "activation": get_activation_name(layer.activation),
+        }
+        if isinstance(layer.activation, Activation):
+            description["activation_config"] = layer.activation.get_config()
+        layers.append(description)
+
+    if parameters is None:
+        parameters = network.parameters()
+    elif [p.shape for p in parameters] != [p.shape for p in network.parameters()]:
+        raise ValueError("The parameters must match the shapes of the network's")
+
+    header: Dict[str, Any] = {
+        "input_count": network.layers[0].neuron_count,
+        "dtype": network.dtype.str,
+        "layers": layers,
+        "parameter_count": sum(parameter.size for parameter in parameters),
+    }
+    encoded = json.dumps(header).encode("utf-8")
+
+    with open(path, "wb") as file:
+        file.write(PREFIX.pack(MAGIC, VERSION, len(encoded)))
+        file.write(encoded)
+        file.write(bytes(parameter_offset(len(encoded)) - file.tell()))
+        for parameter in parameters:
+            file.write(np.ascontiguousarray(parameter, network.dtype).data)
@@ -0,0 +1,86 @@
+"""Contains tests for activations.py"""
+
+import unittest
+
+import numpy as np
+
+from emell.activation import LeakyReLU, ReLU, Tanh
+from emell.computation import identity, identity_prime, relu, relu_prime
+from emell.serialization import (
+    get_activation,
+    get_activation_name,
+    register_activation,
+    register_activation_type,
+)
+
+
+def softsign(x: np.ndarray) -> np.ndarray:
+    """An activation that isn't registered by default."""
+    result = x.copy()
+    np.abs(result, out=result)
+    result += 1
+    np.divide(x, result, out=result)
+    return result
+
+
+def softsign_prime(x: np.ndarray) -> np.ndarray:
+    """The derivative of softsign."""
+    result = x.copy()
+    np.abs(result, out=result)
+    result += 1
+    result *= result
+    np.reciprocal(result, out=result)
+    return result
+
+
+class ActivationsTest(unittest.TestCase):
+    """Tests for the activation registry."""
+
+    def test_builtin(self) -> None:
+        """Checks that the built-in activations are registered."""
+        self.assertEqual((identity, identity_prime), get_activation("identity"))
+        self.assertEqual((relu, relu_prime), get_activation("relu"))
+        self.assertEqual("relu", get_activation_name(relu))
+
+    def test_register(self) -> None:
+        """Checks that new activations can be registered once per name."""
+        register_activation("softsign", softsign, softsign_prime)
+        register_activation("softsign", softsign, softsign_prime)
+        self.assertEqual("softsign", get_activation_name(softsign))
+        self.assertEqual((softsign, softsign_prime), get_activation("softsign"))
+
+        with self.assertRaises(ValueError):
+            register_activation("softsign", relu, relu_prime)
+
+    def test_activation_types(self) -> None:
+        """Checks that Activation classes are registered with their configs."""
+        self.assertEqual("ReLU", get_activation_name(ReLU()))
+        self.assertEqual("LeakyReLU", get_activation_name(LeakyReLU(0.3)))
+        activation, activation_prime = get_activation("LeakyReLU", {"slope": 0.3})
+        self.assertIsInstance(activation, LeakyReLU)
+        np.testing.assert_allclose(np.array([0.3]), activation_prime(np.array([-1.0])))
+
+        register_activation_type("Tanh", Tanh)
+        with self.assertRaises(ValueError):
+            register_activation_type("Tanh", ReLU)
+
+        with self.assertRaises(ValueError):
+            register_activation_type("relu", ReLU)
+
+        with self.assertRaises(ValueError):
+            register_activation("ReLU", relu, relu_prime)
+
+        with self.assertRaises(ValueError):
+            get_activation("relu", {"slope": 0.3})
+
+    def test_unregistered(self) -> None:
+        """Checks that unregistered activations are rejected."""
+        with self.assertRaises(ValueError):
+            get_activation("unknown")
+
+        with self.assertRaises(ValueError):
+            get_activation_name(np.tanh)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Contains tests for checkpointer.py"""
+
+import os
+import tempfile
+import threading
+import unittest
+from typing import Any
+from unittest import mock
+
+import numpy as np
+
+from emell.computation import constant, delta_quadratic_loss, identity, quadratic_loss
+from emell.data import ArrayDataset
+from emell.neuralnetwork import Backpropagation, DenseLayer, Network, Trainer
+from emell.serialization import Checkpointer, load, save
+
+
+def make_network() -> Network:
+    """Make a small network to checkpoint."""
+    network = Network(2)
+    network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+    return network
+
+
+class CheckpointerTest(unittest.TestCase):
+    """Tests for the Checkpointer class."""
+
+    def setUp(self) -> None:
+        """Create a directory to write checkpoints to."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, "checkpoints")
+
+    def tearDown(self) -> None:
+        """Delete the checkpoints."""
+        self.directory.cleanup()
+
+    def test_interval_and_keep(self) -> None:
+        """Checks that only the newest checkpoints are kept."""
+        network = make_network()
+        with Checkpointer(self.path, interval=2, keep=2) as checkpointer:
+            taken = []
+            for step in range(7):
+                network.parameters()[1][...] = step
+                taken.append(checkpointer.update(network))
+                checkpointer.flush()
+
+        self.assertEqual([False, True] * 3 + [False], taken)
+        self.assertEqual(
+            ["checkpoint-4.emell", "checkpoint-6.emell"],
+            sorted(os.listdir(self.path)),
+        )
+        self.assertEqual(
+            [os.path.join(self.path, "checkpoint-4.emell"), checkpointer.paths[-1]],
+            checkpointer.paths,
+        )
+
+        # Each checkpoint holds the parameters from when it was taken.
+        np.testing.assert_array_equal(
+            np.array([5.0]), load(checkpointer.paths[-1]).parameters()[0][2:]
+        )
+
+    def test_snapshot(self) -> None:
+        """Checks that training can change the network while it is saved."""
+        network = make_network()
+        network.parameters()[1][...] = 1
+        written = threading.Event()
+        release = threading.Event()
+
+        def slow_save(*args: Any) -> None:
+            release.wait()
+            save(*args)
+            written.set()
+
+        with mock.patch("emell.serialization.checkpointer.save", slow_save):
+            with Checkpointer(self.path, interval=1) as checkpointer:
+                self.assertTrue(checkpointer.update(network))
+                network.parameters()[1][...] = 2
+                self.assertTrue(checkpointer.update(network))
+
+                # Both buffers are being written, so training isn't held up.
+                self.assertFalse(checkpointer.update(network))
+                self.assertEqual(1, checkpointer.skipped)
+                release.set()
+
+        self.assertTrue(written.is_set())
+        self.assertEqual(2, len(checkpointer.paths))
+        np.testing.assert_array_equal(
+            np.ones(1), load(checkpointer.paths[0]).parameters()[0][2:]
+        )
+        np.testing.assert_array_equal(
+            np.full(1, 2.0), load(checkpointer.paths[1]).parameters()[0][2:]
+        )
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(self.path)))
+
+    def test_trainer(self) -> None:
+        """Checks that the trainer takes checkpoints as it trains."""
+        network = make_network()
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        dataset = ArrayDataset(np.ones((10, 2)), np.ones((10, 1)), 2)
+        with Checkpointer(self.path, interval=3, keep=10) as checkpointer:
+            Trainer(backpropagation, checkpointer=checkpointer).fit(dataset, 2)
+
+        # Checkpoints are skipped if the disk falls behind.
+        self.assertEqual(3, len(checkpointer.paths) + checkpointer.skipped)
+        self.assertEqual(2, len(load(checkpointer.paths[-1]).layers))
+
+    def test_errors(self) -> None:
+        """Checks that errors from the background thread are raised."""
+        network = make_network()
+        network.add_layer(DenseLayer(1, np.tanh, constant(np.ones(1))))
+        checkpointer = Checkpointer(self.path, interval=1)
+        checkpointer.update(network)
+        with self.assertRaises(ValueError):
+            checkpointer.flush()
+        checkpointer.close()
+
+        with self.assertRaises(ValueError):
+            Checkpointer(self.path, interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
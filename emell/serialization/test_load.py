@@ -0,0 +1,151 @@
+"""Contains tests for load.py"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from emell.activation import LeakyReLU, Sigmoid
+from emell.computation import (
+    constant,
+    delta_quadratic_loss,
+    identity,
+    quadratic_loss,
+    relu,
+    relu_prime,
+)
+from emell.initializer import Normal
+from emell.neuralnetwork import (
+    Backpropagation,
+    DenseLayer,
+    EmbeddingLayer,
+    Network,
+)
+from emell.serialization import load, save
+
+
+class LoadTest(unittest.TestCase):
+    """Tests for the load function."""
+
+    def setUp(self) -> None:
+        """Save a network to load."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, "model.emell")
+
+        self.network = Network(3)
+        self.network.add_layer(
+            DenseLayer(4, relu, relu_prime, initializer=Normal(seed=0))
+        )
+        self.network.add_layer(
+            DenseLayer(2, identity, constant(np.ones(1)), initializer=Normal(seed=1))
+        )
+        self.network.layers[1].update_bias(np.arange(4.0))
+        save(self.network, self.path)
+
+        self.x = np.random.default_rng(2).normal(size=(5, 3))
+
+    def tearDown(self) -> None:
+        """Delete the saved files."""
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Checks that each way of loading gives the same network."""
+        for mmap_mode in ("r", "c", None):
+            network = load(self.path, mmap_mode)
+            self.assertEqual(3, len(network.layers))
+            self.assertEqual(relu, network.layers[1].activation)
+            self.assertEqual(identity, network.layers[2].activation)
+            for expected, parameter in zip(
+                self.network.parameters(), network.layers[1].get_parameters()
+            ):
+                np.testing.assert_array_equal(expected, parameter)
+            np.testing.assert_array_equal(
+                self.network.predict(self.x), network.predict(self.x)
+            )
+
+    def test_memory_map(self) -> None:
+        """Checks that parameters are mapped from the file, not read."""
+        network = load(self.path)
+        self.assertIsInstance(network.parameter_buffer, np.memmap)
+        self.assertFalse(network.parameters()[0].flags.writeable)
+        self.assertTrue(
+            np.shares_memory(
+                network.layers[1].get_parameters()[1], network.parameters()[0]
+            )
+        )
+
+    def test_copy_on_write(self) -> None:
+        """Checks that copy-on-write networks train without changing the file."""
+        network = load(self.path, "c")
+        backpropagation = Backpropagation(
+            network, quadratic_loss, delta_quadratic_loss, 0.1
+        )
+        backpropagation.train_batch(self.x, np.ones((5, 2)))
+
+        saved = load(self.path)
+        self.assertFalse(np.array_equal(saved.parameters()[0], network.parameters()[0]))
+        np.testing.assert_array_equal(
+            self.network.predict(self.x), saved.predict(self.x)
+        )
+
+    def test_activations(self) -> None:
+        """Checks that Activation objects are recreated with their config."""
+        network = Network(3)
+        network.add_layer(DenseLayer(4, LeakyReLU(0.2), initializer=Normal(seed=0)))
+        network.add_layer(DenseLayer(2, Sigmoid(), initializer=Normal(seed=1)))
+        save(network, self.path)
+
+        loaded = load(self.path)
+        activation = loaded.layers[1].activation
+        self.assertIsInstance(activation, LeakyReLU)
+        assert isinstance(activation, LeakyReLU)
+        self.assertEqual(0.2, activation.slope)
+        self.assertIsInstance(loaded.layers[2].activation, Sigmoid)
+        np.testing.assert_array_equal(network.predict(self.x), loaded.predict(self.x))
+
+    def test_embedding(self) -> None:
+        """Checks that embedding layers are recreated with their table."""
+        network = Network(2)
+        network.add_layer(EmbeddingLayer(10, 3, initializer=Normal(seed=0)))
+        network.add_layer(DenseLayer(2, Sigmoid(), initializer=Normal(seed=1)))
+        save(network, self.path)
+
+        loaded = load(self.path)
+        layer = loaded.layers[1]
+        self.assertIsInstance(layer, EmbeddingLayer)
+        assert isinstance(layer, EmbeddingLayer)
+        self.assertEqual((10, 3), (layer.vocabulary_size, layer.dimension))
+        ids = np.array([[0.0, 9.0], [4.0, 4.0]])
+        np.testing.assert_array_equal(network.predict(ids), loaded.predict(ids))
+
+    def test_dtype(self) -> None:
+        """Checks that the dtype of the saved network is kept."""
+        network = Network(2, dtype=np.float32)
+        network.add_layer(DenseLayer(1, identity, constant(np.ones(1))))
+        save(network, self.path)
+        self.assertEqual(np.float32, load(self.path).dtype)
+        self.assertEqual(np.float32, load(self.path).parameters()[0].dtype)
+
+    def test_invalid(self) -> None:
+        """Checks that invalid files and modes are rejected."""
+        with self.assertRaises(ValueError):
+            load(self.path, "r+")
+
+        with open(self.path, "rb") as file:
+            contents = file.read()
+
+        with open(self.path, "wb") as file:
+            file.write(b"NOTMODEL" + contents[8:])
+        with self.assertRaises(ValueError):
+            load(self.path)
+
+        with open(self.path, "wb") as file:
+            file.write(contents[:-8])
+        for mmap_mode in ("r", None):
+            with self.assertRaises(ValueError):
+                load(self.path, mmap_mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
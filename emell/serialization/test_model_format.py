@@ -0,0 +1,20 @@
+"""Contains tests for model_format.py"""
+
+import unittest
+
+from emell.serialization.model_format import ALIGNMENT, PREFIX, parameter_offset
+
+
+class ModelFormatTest(unittest.TestCase):
+    """Tests for the model format constants."""
+
+    def test_parameter_offset(self) -> None:
+        """Checks that parameters start at the next aligned offset."""
+        self.assertEqual(16, PREFIX.size)
+        self.assertEqual(ALIGNMENT, parameter_offset(1))
+        self.assertEqual(ALIGNMENT, parameter_offset(ALIGNMENT - PREFIX.size))
+        self.assertEqual(2 * ALIGNMENT, parameter_offset(ALIGNMENT - PREFIX.size + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Contains tests for save.py"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from emell.computation import constant, identity, relu, relu_prime
+from emell.neuralnetwork import DenseLayer, InputLayer, Network
+from emell.serialization import save
+from emell.serialization.model_format import MAGIC, PREFIX, VERSION, parameter_offset
+
+
+class SaveTest(unittest.TestCase):
+    """Tests for the save function."""
+
+    def setUp(self) -> None:
+        """Create a directory to save into."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, "model.emell")
+
+    def tearDown(self) -> None:
+        """Delete the saved files."""
+        self.directory.cleanup()
+
+    def test_layout(self) -> None:
+        """Checks the header and the aligned raw parameters."""
+        network = Network(3, dtype=np.float32)
+        network.add_layer(DenseLayer(4, relu, relu_prime))
+        network.add_layer(DenseLayer(2, identity, constant(np.ones(1))))
+        save(network, self.path)
+
+        with open(self.path, "rb") as file:
+            contents = file.read()
+
+        magic, version, header_length = PREFIX.unpack(contents[: PREFIX.size])
+        self.assertEqual(MAGIC, magic)
+        self.assertEqual(VERSION, version)
+        header = json.loads(contents[PREFIX.size : PREFIX.size + header_length])
+        self.assertEqual(
+            {
+                "input_count": 3,
+                "dtype": "<f4",
+                "layers": [
+                    {"type": "DenseLayer", "neuron_count": 4, "activation": "relu"},
+                    {"type": "DenseLayer", "neuron_count": 2, "activation": "identity"},
+                ],
+                "parameter_count": 26,
+            },
+            header,
+        )
+
+        offset = parameter_offset(header_length)
+        self.assertEqual(0, offset % 64)
+        self.assertEqual(offset + 26 * 4, len(contents))
+        np.testing.assert_array_equal(
+            np.concatenate([p.ravel() for p in network.parameters()]),
+            np.frombuffer(contents[offset:], np.float32),
+        )
+
+    def test_unsupported(self) -> None:
+        """Checks that unregistered activations and layer types are rejected."""
+        network = Network(3)
+        network.add_layer(DenseLayer(2, np.tanh, constant(np.ones(1))))
+        with self.assertRaises(ValueError):
+            save(network, self.path)
+
+        # Only dense layers can be saved after the input layer.
+        network = Network(3)
+        network.layers.append(InputLayer(3))
+        with self.assertRaises(ValueError):
+            save(network, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
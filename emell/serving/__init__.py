@@ -0,0 +1,25 @@
+"""Serves predictions from networks to other processes."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.serving.client import Client
+    from emell.serving.micro_batcher import MicroBatcher
+    from emell.serving.server import Server
+
+__all__ = [
+    "Client",
+    "MicroBatcher",
+    "Server",
+]
+
+lazy_import(
+    __name__,
+    {
+        "Client": "client",
+        "MicroBatcher": "micro_batcher",
+        "Server": "server",
+    },
+)
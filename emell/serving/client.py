@@ -0,0 +1,79 @@
+"""Contains a client for the prediction server."""
+
+import json
+import socket
+from typing import Type
+
+import numpy as np
+
+from emell.serving.protocol import ERROR, OK, receive_frame, send_frame
+from emell.serving.server import Address
+
+
+class Client:
+    """
+    Sends examples to a prediction server, one at a time.
+
+    A client holds one connection, and waits for each answer before sending
+    the next example. Use a client per thread to send requests concurrently.
+    """
+
+    def __init__(self, address: Address):
+        """
+        Connect to the server.
+
+        Parameters
+        ----------
+        address : str or tuple
+            The Unix socket path, or (host, port) pair, of the server.
+
+        """
+        super().__init__()
+        if isinstance(address, str):
+            self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._connection.connect(address)
+
+        _, payload = receive_frame(self._connection)
+        hello = json.loads(payload.decode("utf-8"))
+        self.input_count: int = hello["input_count"]
+        self.output_count: int = hello["output_count"]
+        self.dtype = np.dtype(str(hello["dtype"]))
+
+    def predict(self, example: np.ndarray) -> np.ndarray:
+        """
+        Predict the output for one example.
+
+        Parameters
+        ----------
+        example : np.ndarray
+            A single input vector.
+
+        Returns
+        -------
+        The output vector.
+
+        """
+        if example.shape != (self.input_count,):
+            raise ValueError("The example does not match the input size")
+
+        send_frame(self._connection, OK, np.asarray(example, self.dtype).tobytes())
+        status, payload = receive_frame(self._connection)
+        if status == ERROR:
+            raise ValueError(payload.decode("utf-8"))
+
+        return np.frombuffer(payload, self.dtype)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "Client":
+        """Use the client in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Close the connection at the end of a with statement."""
+        self.close()
@@ -0,0 +1,163 @@
+"""Contains a batcher that coalesces concurrent predictions."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple, Type
+
+import numpy as np
+
+from emell.neuralnetwork import Network
+
+
+class MicroBatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Coalesces concurrent single-example predictions into batches.
+
+    Requests from any number of threads are queued. A background thread takes
+    the first waiting request, then keeps collecting requests until the batch
+    is full or `max_latency` seconds have passed. The whole batch is run as one
+    forward pass, and each row of the output is handed back to its request.
+
+    Under load, batches fill without waiting. When idle, a lone request waits
+    at most `max_latency` seconds longer than it would on its own.
+    """
+
+    def __init__(
+        self, network: Network, max_batch_size: int = 64, max_latency: float = 0.002
+    ):
+        """
+        Start the batching thread.
+
+        Parameters
+        ----------
+        network : Network
+            The network to predict with. Only used from the batching thread.
+        max_batch_size : int
+            The largest number of requests in one forward pass.
+        max_latency : float
+            The longest time in seconds to wait for a batch to fill, from when
+            its first request is taken.
+
+        """
+        super().__init__()
+        if max_batch_size < 1:
+            raise ValueError("The batch size must be at least one")
+
+        self.network = network
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.input_count = network.layers[0].neuron_count
+        # The number of forward passes, and of the requests that they ran.
+        self.batches = 0
+        self.requests = 0
+
+        self._inputs = np.empty((max_batch_size, self.input_count), network.dtype)
+        self._requests: "queue.Queue[Optional[Tuple[np.ndarray, Future[np.ndarray]]]]"
+        self._requests = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, example: np.ndarray) -> "Future[np.ndarray]":
+        """
+        Queue a prediction for one example.
+
+        Parameters
+        ----------
+        example : np.ndarray
+            A single input vector.
+
+        Returns
+        -------
+        A future of the output vector.
+
+        """
+        if self._closed:
+            raise ValueError("The batcher has been closed")
+
+        if example.shape != (self.input_count,):
+            raise ValueError("The example does not match the input size")
+
+        future: "Future[np.ndarray]" = Future()
+        self._requests.put((example, future))
+        return future
+
+    def predict(self, example: np.ndarray) -> np.ndarray:
+        """
+        Predict the output for one example, waiting for its batch to run.
+
+        Parameters
+        ----------
+        example : np.ndarray
+            A single input vector.
+
+        """
+        return self.submit(example).result()
+
+    def close(self) -> None:
+        """Run the requests queued so far, and stop the batching thread."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._requests.put(None)
+        self._thread.join()
+
+        # Requests that raced with closing are failed rather than left waiting.
+        while not self._requests.empty():
+            request = self._requests.get()
+            if request is not None:
+                request[1].set_exception(ValueError("The batcher has been closed"))
+
+    def _run(self) -> None:
+        """Collect and run batches until closed."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+
+            batch = [request]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self._requests.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+                if request is None:
+                    self._run_batch(batch)
+                    return
+                batch.append(request)
+
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, "Future[np.ndarray]"]]) -> None:
+        """Run one forward pass, and set the result of each request."""
+        inputs = self._inputs[: len(batch)]
+        for row, (example, _) in zip(inputs, batch):
+            row[...] = example
+        self.batches += 1
+        self.requests += len(batch)
+
+        try:
+            outputs = self.network.predict(inputs)
+        except Exception as error:  # pylint: disable=broad-except
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        # The output is a buffer that the next batch overwrites.
+        for output, (_, future) in zip(outputs, batch):
+            future.set_result(output.copy())
+
+    def __enter__(self) -> "MicroBatcher":
+        """Use the batcher in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Stop the batcher at the end of a with statement."""
+        self.close()
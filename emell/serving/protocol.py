@@ -0,0 +1,70 @@
+"""
+Contains the framing of messages between the server and clients.
+
+Every message is a frame: a status byte and a payload length, as a
+little-endian `<BI`, followed by the payload.
+
+1. On connecting, the server sends a frame whose payload is UTF-8 JSON, with
+   the input count, output count and dtype of the network.
+2. Each request from the client is a frame holding one raw input vector.
+3. The server answers each request with a frame holding the raw output vector.
+   If the request failed, the status is ERROR and the payload is the UTF-8
+   error message.
+"""
+
+import socket
+import struct
+from typing import Tuple
+
+OK = 0
+ERROR = 1
+
+HEADER = struct.Struct("<BI")
+
+
+def send_frame(connection: socket.socket, status: int, payload: bytes) -> None:
+    """
+    Send one frame.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connected socket.
+    status : int
+        OK or ERROR.
+    payload : bytes
+        The contents of the frame.
+
+    """
+    connection.sendall(HEADER.pack(status, len(payload)) + payload)
+
+
+def receive_frame(connection: socket.socket) -> Tuple[int, bytes]:
+    """
+    Receive one frame.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connected socket.
+
+    Returns
+    -------
+    The status and payload of the frame.
+
+    """
+    status, length = HEADER.unpack(_receive(connection, HEADER.size))
+    return status, _receive(connection, length)
+
+
+def _receive(connection: socket.socket, length: int) -> bytes:
+    """Receive exactly the given number of bytes."""
+    data = bytearray(length)
+    view = memoryview(data)
+    received = 0
+    while received < length:
+        count = connection.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("The connection was closed")
+        received += count
+    return bytes(data)
@@ -0,0 +1,139 @@
+"""Contains a socket server for network predictions."""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from typing import Optional, Tuple, Type, Union, cast
+
+import numpy as np
+
+from emell.serving.micro_batcher import MicroBatcher
+from emell.serving.protocol import ERROR, OK, receive_frame, send_frame
+
+# A Unix socket path, or a (host, port) pair for TCP.
+Address = Union[str, Tuple[str, int]]
+
+
+class Server:
+    """
+    Serves predictions from a network over a Unix socket or TCP.
+
+    Each connection is handled on its own thread, and sends its examples to a
+    shared MicroBatcher. Concurrent requests, from one or many clients, are
+    run together as batches. The framing is described in `protocol`.
+    """
+
+    def __init__(self, batcher: MicroBatcher, address: Address):
+        """
+        Bind the server, without serving yet.
+
+        Parameters
+        ----------
+        batcher : MicroBatcher
+            Runs the predictions.
+        address : str or tuple
+            A Unix socket path, or a (host, port) pair to listen on with TCP.
+            Port 0 picks a free port.
+
+        """
+        super().__init__()
+        self.batcher = batcher
+        network = batcher.network
+        hello = {
+            "input_count": batcher.input_count,
+            "output_count": network.layers[-1].neuron_count,
+            "dtype": network.dtype.str,
+        }
+        self._hello = json.dumps(hello).encode("utf-8")
+
+        handler = _make_handler(batcher, self._hello)
+        self._server: socketserver.BaseServer
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.remove(address)
+            self._server = _UnixServer(address, handler)
+        else:
+            self._server = _TCPServer(address, handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Address:
+        """Get the address that the server is listening on."""
+        return cast(Address, self._server.server_address)
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve on this thread, until shut down from another."""
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving, and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+
+    def __enter__(self) -> "Server":
+        """Serve in the background in a with statement."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Type[BaseException]) -> None:
+        """Stop serving at the end of a with statement."""
+        self.close()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Handles each Unix socket connection on a thread."""
+
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Handles each TCP connection on a thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _make_handler(
+    batcher: MicroBatcher, hello: bytes
+) -> Type[socketserver.BaseRequestHandler]:
+    """Make a handler class that serves predictions from the batcher."""
+    dtype = batcher.network.dtype
+
+    class Handler(socketserver.BaseRequestHandler):
+        """Answers every request on one connection."""
+
+        def handle(self) -> None:
+            """Predict each example that is sent, until the client leaves."""
+            connection: socket.socket = self.request
+            if connection.family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            send_frame(connection, OK, hello)
+
+            while True:
+                try:
+                    _, payload = receive_frame(connection)
+                except ConnectionError:
+                    return
+
+                try:
+                    example = np.frombuffer(payload, dtype)
+                    output = batcher.predict(example)
+                except Exception as error:  # pylint: disable=broad-except
+                    send_frame(connection, ERROR, str(error).encode("utf-8"))
+                    continue
+                send_frame(connection, OK, output.tobytes())
+
+    return Handler
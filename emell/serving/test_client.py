@@ -0,0 +1,45 @@
+"""Contains tests for client.py"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from emell.computation import relu
+from emell.serving import Client, MicroBatcher, Server
+from emell.serving.test_micro_batcher import make_network
+
+
+class ClientTest(unittest.TestCase):
+    """Tests for the Client class."""
+
+    def test_client(self) -> None:
+        """Checks that the client learns the network's shape and errors."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "emell.sock")
+            network = make_network()
+            with MicroBatcher(network) as batcher, Server(batcher, path):
+                with Client(path) as client:
+                    self.assertEqual(3, client.input_count)
+                    self.assertEqual(2, client.output_count)
+                    self.assertEqual(np.float64, client.dtype)
+
+                    with self.assertRaises(ValueError):
+                        client.predict(np.ones(2))
+
+                    # Errors on the server are raised, and the connection kept.
+                    network.layers[1].activation = _fail
+                    with self.assertRaises(ValueError):
+                        client.predict(np.ones(3))
+                    network.layers[1].activation = relu
+                    self.assertEqual((2,), client.predict(np.ones(3)).shape)
+
+
+def _fail(x: np.ndarray) -> np.ndarray:
+    """An activation that always fails."""
+    raise ArithmeticError("Failed on the server")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Contains tests for micro_batcher.py"""
+
+import threading
+import unittest
+from typing import List
+
+import numpy as np
+
+from emell.computation import constant, identity, relu, relu_prime
+from emell.initializer import Normal
+from emell.neuralnetwork import DenseLayer, Network
+from emell.serving import MicroBatcher
+
+
+def make_network() -> Network:
+    """Make a small network to serve."""
+    network = Network(3)
+    network.add_layer(DenseLayer(4, relu, relu_prime, initializer=Normal(seed=0)))
+    network.add_layer(
+        DenseLayer(2, identity, constant(np.ones(1)), initializer=Normal(seed=1))
+    )
+    return network
+
+
+class MicroBatcherTest(unittest.TestCase):
+    """Tests for the MicroBatcher class."""
+
+    def test_batches(self) -> None:
+        """Checks that concurrent requests share forward passes."""
+        network = make_network()
+        examples = np.random.default_rng(0).normal(size=(40, 3))
+        expected = network.compute(examples).output
+
+        with MicroBatcher(network, max_batch_size=8, max_latency=0.05) as batcher:
+            futures = [batcher.submit(example) for example in examples]
+            for future, output in zip(futures, expected):
+                np.testing.assert_allclose(output, future.result())
+
+        self.assertEqual(40, batcher.requests)
+        self.assertLessEqual(batcher.batches, 10)
+        self.assertGreaterEqual(batcher.batches, 5)
+
+    def test_threads(self) -> None:
+        """Checks that each thread gets back its own output."""
+        network = make_network()
+        examples = np.random.default_rng(1).normal(size=(16, 3))
+        expected = network.compute(examples).output
+        outputs: List[np.ndarray] = [np.empty(0)] * len(examples)
+
+        with MicroBatcher(network, max_batch_size=4) as batcher:
+
+            def predict(index: int) -> None:
+                outputs[index] = batcher.predict(examples[index])
+
+            threads = [
+                threading.Thread(target=predict, args=(index,))
+                for index in range(len(examples))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        np.testing.assert_allclose(expected, np.stack(outputs))
+
+    def test_lone_request(self) -> None:
+        """Checks that a lone request runs once the latency window ends."""
+        with MicroBatcher(make_network(), max_latency=0.001) as batcher:
+            self.assertEqual((2,), batcher.predict(np.ones(3)).shape)
+            self.assertEqual(1, batcher.batches)
+
+    def test_errors(self) -> None:
+        """Checks that invalid requests and failed batches are reported."""
+        with self.assertRaises(ValueError):
+            MicroBatcher(make_network(), max_batch_size=0)
+
+        network = make_network()
+        with MicroBatcher(network) as batcher:
+            with self.assertRaises(ValueError):
+                batcher.submit(np.ones(4))
+
+            with self.assertRaises(ValueError):
+                batcher.submit(np.ones((1, 3)))
+
+            def fail(x: np.ndarray) -> np.ndarray:
+                raise ArithmeticError("Failed in a batch")
+
+            network.layers[2].activation = fail
+            with self.assertRaises(ArithmeticError):
+                batcher.predict(np.ones(3))
+
+        with self.assertRaises(ValueError):
+            batcher.submit(np.ones(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
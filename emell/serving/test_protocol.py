@@ -0,0 +1,29 @@
+"""Contains tests for protocol.py"""
+
+import socket
+import unittest
+
+from emell.serving.protocol import ERROR, OK, receive_frame, send_frame
+
+
+class ProtocolTest(unittest.TestCase):
+    """Tests for the framing of messages."""
+
+    def test_frames(self) -> None:
+        """Checks that frames arrive whole and in order."""
+        left, right = socket.socketpair()
+        with left, right:
+            send_frame(left, OK, b"hello")
+            send_frame(left, ERROR, b"")
+            send_frame(left, OK, bytes(range(256)) * 10)
+            self.assertEqual((OK, b"hello"), receive_frame(right))
+            self.assertEqual((ERROR, b""), receive_frame(right))
+            self.assertEqual((OK, bytes(range(256)) * 10), receive_frame(right))
+
+            left.close()
+            with self.assertRaises(ConnectionError):
+                receive_frame(right)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Contains tests for server.py"""
+
+import os
+import tempfile
+import threading
+import unittest
+from typing import List
+
+import numpy as np
+
+from emell.serving import Client, MicroBatcher, Server
+from emell.serving.test_micro_batcher import make_network
+
+
+class ServerTest(unittest.TestCase):
+    """Tests for the Server class."""
+
+    def setUp(self) -> None:
+        """Create a directory for the Unix socket."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, "emell.sock")
+
+    def tearDown(self) -> None:
+        """Delete the Unix socket."""
+        self.directory.cleanup()
+
+    def test_unix_socket(self) -> None:
+        """Checks that concurrent clients are batched together."""
+        network = make_network()
+        examples = np.random.default_rng(0).normal(size=(24, 3))
+        expected = network.compute(examples).output
+        outputs: List[np.ndarray] = [np.empty(0)] * len(examples)
+
+        with MicroBatcher(network, max_batch_size=8, max_latency=0.01) as batcher:
+            with Server(batcher, self.path) as server:
+
+                def predict(client_index: int) -> None:
+                    with Client(self.path) as client:
+                        for index in range(client_index, len(examples), 8):
+                            outputs[index] = client.predict(examples[index])
+
+                threads = [
+                    threading.Thread(target=predict, args=(index,))
+                    for index in range(8)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(self.path, server.address)
+
+        np.testing.assert_allclose(expected, np.stack(outputs))
+        self.assertLess(batcher.batches, len(examples))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_tcp(self) -> None:
+        """Checks that predictions can be served on a local TCP port."""
+        network = make_network()
+        with MicroBatcher(network) as batcher:
+            with Server(batcher, ("127.0.0.1", 0)) as server:
+                with Client(server.address) as client:
+                    np.testing.assert_allclose(
+                        network.compute(np.ones(3)).output, client.predict(np.ones(3))
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
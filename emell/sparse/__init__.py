@@ -0,0 +1,19 @@
+"""Sparse matrices for high-dimensional inputs that are mostly zero."""
+
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.sparse.csr_matrix import CSRMatrix
+
+__all__ = [
+    "CSRMatrix",
+]
+
+lazy_import(
+    __name__,
+    {
+        "CSRMatrix": "csr_matrix",
+    },
+)
@@ -0,0 +1,299 @@
+"""Contains a compressed sparse row matrix built on NumPy index arrays."""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class CSRMatrix:
+    """
+    A (rows, columns) matrix that only stores its nonzero entries.
+
+    The entries of row i are `data[indptr[i]:indptr[i + 1]]`, in the columns
+    `indices[indptr[i]:indptr[i + 1]]`. Products with dense matrices gather
+    and scatter only the nonzero entries, so they cost time in proportion to
+    the number of nonzeros rather than the number of columns.
+
+    The row and column groupings that the products need are computed on first
+    use and kept, so a batch that is reused across epochs only groups its
+    entries once.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        shape: Tuple[int, int],
+    ):
+        """
+        Initialize the matrix.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The value of each nonzero entry, row by row.
+        indices : np.ndarray
+            The column of each nonzero entry.
+        indptr : np.ndarray
+            The offset of each row's first entry, followed by the number of
+            entries.
+        shape : (int, int)
+            The number of rows and columns.
+
+        """
+        super().__init__()
+        rows, columns = shape
+        if data.ndim != 1 or indices.shape != data.shape:
+            raise ValueError("data and indices must be vectors of the same size")
+
+        if indptr.shape != (rows + 1,) or indptr[0] != 0 or indptr[-1] != data.size:
+            raise ValueError("indptr must have an offset for each row and the end")
+
+        if np.any(np.diff(indptr) < 0):
+            raise ValueError("indptr must not decrease")
+
+        if indices.size and (indices.min() < 0 or indices.max() >= columns):
+            raise ValueError("Every index must be a column of the matrix")
+
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = (rows, columns)
+        self._rows: Optional[CSRMatrix._Groups] = None
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray, CSRMatrix._Groups]] = None
+
+    @staticmethod
+    def from_dense(matrix: np.ndarray) -> "CSRMatrix":
+        """
+        Make a sparse copy of a dense matrix.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            The (rows, columns) matrix.
+
+        """
+        if matrix.ndim != 2:
+            raise ValueError("Can only convert (rows, columns) matrices")
+
+        rows, columns = np.nonzero(matrix)
+        indptr = np.zeros(matrix.shape[0] + 1, np.intp)
+        np.cumsum(np.bincount(rows, minlength=matrix.shape[0]), out=indptr[1:])
+        return CSRMatrix(matrix[rows, columns], columns, indptr, matrix.shape)
+
+    @property
+    def ndim(self) -> int:
+        """Get the number of dimensions, which is always 2."""
+        return 2
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Get the type of the values."""
+        return self.data.dtype
+
+    @property
+    def nnz(self) -> int:
+        """Get the number of stored entries."""
+        return int(self.data.size)
+
+    def astype(self, dtype: DTypeLike) -> "CSRMatrix":
+        """
+        Get the matrix with values of the given type.
+
+        Returns
+        -------
+        The matrix itself if the type already matches. Otherwise, a matrix
+        that shares the index arrays.
+
+        """
+        if self.data.dtype == dtype:
+            return self
+
+        return CSRMatrix(self.data.astype(dtype), self.indices, self.indptr, self.shape)
+
+    def to_dense(self) -> np.ndarray:
+        """Get the matrix as a dense array."""
+        dense = np.zeros(self.shape, self.data.dtype)
+        dense[self._row_ids(), self.indices] = self.data
+        return dense
+
+    def __array__(
+        self, dtype: Optional[DTypeLike] = None, copy: Optional[bool] = None
+    ) -> np.ndarray:
+        """Convert to a dense array, so that NumPy functions accept the matrix."""
+        del copy  # A new array is always made.
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype, copy=False)
+
+    def __getitem__(self, rows: slice) -> "CSRMatrix":
+        """
+        Get a range of rows, sharing the value and index arrays.
+
+        Parameters
+        ----------
+        rows : slice
+            The rows, with a step of one.
+
+        """
+        start, stop, step = rows.indices(self.shape[0])
+        if step != 1:
+            raise ValueError("Can only take contiguous rows")
+
+        stop = max(start, stop)
+        begin, end = self.indptr[start], self.indptr[stop]
+        return CSRMatrix(
+            self.data[begin:end],
+            self.indices[begin:end],
+            self.indptr[start : stop + 1] - begin,
+            (stop - start, self.shape[1]),
+        )
+
+    def matmul(self, dense: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Multiply this matrix by a dense matrix.
+
+        Only the rows of `dense` that match a nonzero column are read.
+
+        Parameters
+        ----------
+        dense : np.ndarray
+            The (columns, k) matrix.
+        out : np.ndarray, optional
+            A (rows, k) buffer for the product.
+
+        Returns
+        -------
+        The (rows, k) product.
+
+        """
+        if dense.ndim != 2 or dense.shape[0] != self.shape[1]:
+            raise ValueError("The dense matrix must have a row for each column")
+
+        if out is None:
+            out = np.empty((self.shape[0], dense.shape[1]), dense.dtype)
+
+        out.fill(0)
+        if self.data.size:
+            rows = self._row_groups()
+            products = dense[self.indices]
+            products *= self.data[:, np.newaxis]
+            out[rows.keys] = CSRMatrix._sum_groups(products, rows)
+        return out
+
+    def transposed_matmul(
+        self, dense: np.ndarray, out: Optional[np.ndarray] = None, zero: bool = True
+    ) -> np.ndarray:
+        """
+        Multiply the transpose of this matrix by a dense matrix.
+
+        Only the rows of the product that match a nonzero column are written.
+        The others are zeroed, unless `zero` is False.
+
+        Parameters
+        ----------
+        dense : np.ndarray
+            The (rows, k) matrix.
+        out : np.ndarray, optional
+            A (columns, k) buffer for the product. May be a transposed view,
+            such as `weight_gradient.T`.
+        zero : bool
+            Whether to zero the rows of `out` that don't match a nonzero
+            column. If not, they are left as they are, which saves touching
+            the whole buffer when the caller knows that they are already zero.
+
+        Returns
+        -------
+        The (columns, k) product.
+
+        """
+        if dense.ndim != 2 or dense.shape[0] != self.shape[0]:
+            raise ValueError("The dense matrix must have a row for each row")
+
+        if out is None:
+            out = np.zeros((self.shape[1], dense.shape[1]), dense.dtype)
+        elif zero:
+            out.fill(0)
+
+        if self.data.size:
+            order, rows, columns = self._column_groups()
+            products = dense[rows]
+            products *= self.data[order, np.newaxis]
+            out[columns.keys] = CSRMatrix._sum_groups(products, columns)
+        return out
+
+    def nonzero_columns(self) -> np.ndarray:
+        """
+        Get the columns that have a nonzero entry.
+
+        Returns
+        -------
+        The sorted columns, each listed once.
+
+        """
+        if not self.data.size:
+            return np.empty(0, np.intp)
+
+        return self._column_groups()[2].keys
+
+    def _row_ids(self) -> np.ndarray:
+        """Get the row of each entry."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def _row_groups(self) -> "CSRMatrix._Groups":
+        """Group the entries by row."""
+        if self._rows is None:
+            self._rows = CSRMatrix._group(self._row_ids())
+        return self._rows
+
+    def _column_groups(self) -> Tuple[np.ndarray, np.ndarray, "CSRMatrix._Groups"]:
+        """
+        Group the entries by column.
+
+        Returns the order that sorts the entries by column, the row of each
+        sorted entry, and the groups of the sorted entries.
+        """
+        if self._columns is None:
+            order = np.argsort(self.indices, kind="stable")
+            self._columns = (
+                order,
+                self._row_ids()[order],
+                CSRMatrix._group(self.indices[order]),
+            )
+        return self._columns
+
+    @staticmethod
+    def _group(keys: np.ndarray) -> "CSRMatrix._Groups":
+        """Group sorted keys into runs of equal keys."""
+        unique, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+        later = []
+        for rank in range(1, int(counts.max())):
+            groups = np.flatnonzero(counts > rank)
+            later.append((groups, starts[groups] + rank))
+        return CSRMatrix._Groups(unique, starts, later)
+
+    @staticmethod
+    def _sum_groups(products: np.ndarray, groups: "CSRMatrix._Groups") -> np.ndarray:
+        """
+        Sum the products of each group of entries.
+
+        Adds the nth entry of every group that has one at once, which takes as
+        many vectorized steps as the largest group has entries. This is much
+        faster than np.add.reduceat for many small groups.
+        """
+        sums: np.ndarray = products[groups.starts]
+        for indices, entries in groups.later:
+            sums[indices] += products[entries]
+        return sums
+
+    class _Groups(NamedTuple):
+        """Runs of entries that share a row or a column."""
+
+        # The row or column of each group.
+        keys: np.ndarray
+        # The offset of the first entry of each group.
+        starts: np.ndarray
+        # For each later rank n, the groups with an nth entry and the offsets
+        # of those entries.
+        later: List[Tuple[np.ndarray, np.ndarray]]
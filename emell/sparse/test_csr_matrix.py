@@ -0,0 +1,115 @@
+"""Contains tests for csr_matrix.py"""
+
+import unittest
+
+import numpy as np
+
+from emell.sparse import CSRMatrix
+
+
+def make_matrix() -> np.ndarray:
+    """Make a mostly-zero matrix with an empty first and last row."""
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(6, 10))
+    matrix[rng.random(size=matrix.shape) < 0.7] = 0
+    matrix[0] = 0
+    matrix[-1] = 0
+    matrix[2, 3] = 1.5
+    return matrix
+
+
+class CSRMatrixTest(unittest.TestCase):
+    """Tests for the CSRMatrix class."""
+
+    def test_from_dense(self) -> None:
+        """Checks the conversion to and from dense matrices."""
+        matrix = make_matrix()
+        sparse = CSRMatrix.from_dense(matrix)
+        self.assertEqual((6, 10), sparse.shape)
+        self.assertEqual(2, sparse.ndim)
+        self.assertEqual(np.count_nonzero(matrix), sparse.nnz)
+        np.testing.assert_array_equal(matrix, sparse.to_dense())
+        np.testing.assert_array_equal(matrix, np.asarray(sparse))
+
+        single = sparse.astype(np.float32)
+        self.assertEqual(np.float32, single.dtype)
+        self.assertIs(sparse.indices, single.indices)
+        self.assertIs(sparse, sparse.astype(np.float64))
+
+    def test_matmul(self) -> None:
+        """Checks products with dense matrices against dense products."""
+        matrix = make_matrix()
+        sparse = CSRMatrix.from_dense(matrix)
+        rng = np.random.default_rng(1)
+
+        dense = rng.normal(size=(10, 4))
+        np.testing.assert_allclose(matrix @ dense, sparse.matmul(dense))
+        out = np.full((6, 4), np.nan)
+        self.assertIs(out, sparse.matmul(dense, out=out))
+        np.testing.assert_allclose(matrix @ dense, out)
+
+        dense = rng.normal(size=(6, 4))
+        np.testing.assert_allclose(matrix.T @ dense, sparse.transposed_matmul(dense))
+
+        # Gradients are written through a transposed view.
+        gradient = np.full((4, 10), np.nan)
+        sparse.transposed_matmul(dense, out=gradient.T)
+        np.testing.assert_allclose(dense.T @ matrix, gradient)
+
+        # Without zeroing, only the nonzero columns are written.
+        partial = matrix.copy()
+        partial[:, [2, 7]] = 0
+        sparse_partial = CSRMatrix.from_dense(partial)
+        columns = sparse_partial.nonzero_columns()
+        np.testing.assert_array_equal([0, 1, 3, 4, 5, 6, 8, 9], columns)
+        gradient.fill(np.nan)
+        sparse_partial.transposed_matmul(dense, out=gradient.T, zero=False)
+        np.testing.assert_allclose(
+            (dense.T @ partial)[:, columns], gradient[:, columns]
+        )
+        self.assertTrue(np.all(np.isnan(gradient[:, [2, 7]])))
+
+        empty = CSRMatrix.from_dense(np.zeros((2, 10)))
+        np.testing.assert_array_equal(np.zeros((2, 4)), empty.matmul(np.ones((10, 4))))
+        np.testing.assert_array_equal(
+            np.zeros((10, 4)), empty.transposed_matmul(np.ones((2, 4)))
+        )
+        self.assertEqual(0, empty.nonzero_columns().size)
+
+        with self.assertRaises(ValueError):
+            sparse.matmul(np.ones((9, 4)))
+
+        with self.assertRaises(ValueError):
+            sparse.transposed_matmul(np.ones((5, 4)))
+
+    def test_rows(self) -> None:
+        """Checks that row ranges share the arrays of the matrix."""
+        matrix = make_matrix()
+        sparse = CSRMatrix.from_dense(matrix)
+        np.testing.assert_array_equal(matrix[2:5], sparse[2:5].to_dense())
+        np.testing.assert_array_equal(matrix[4:], sparse[4:].to_dense())
+        self.assertEqual((0, 10), sparse[3:1].shape)
+        self.assertTrue(np.shares_memory(sparse.data, sparse[1:3].data))
+
+        with self.assertRaises(ValueError):
+            _ = sparse[::2]
+
+    def test_errors(self) -> None:
+        """Checks that malformed matrices are rejected."""
+        data = np.ones(2)
+        indices = np.array([0, 3])
+        with self.assertRaises(ValueError):
+            CSRMatrix(data, indices[:1], np.array([0, 2]), (1, 4))
+
+        with self.assertRaises(ValueError):
+            CSRMatrix(data, indices, np.array([0, 1]), (1, 4))
+
+        with self.assertRaises(ValueError):
+            CSRMatrix(data, indices, np.array([0, 2, 1, 2]), (3, 4))
+
+        with self.assertRaises(ValueError):
+            CSRMatrix(data, indices, np.array([0, 2]), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Contains tests for lazy_import.py"""
+
+import importlib
+import subprocess
+import sys
+import unittest
+from typing import Set
+
+PACKAGES = (
+    "activation",
+    "computation",
+    "data",
+    "initializer",
+    "loss",
+    "neuralnetwork",
+    "optimizer",
+    "parallel",
+    "serialization",
+    "serving",
+    "sparse",
+    "testutil",
+)
+
+
+def imported_after(statement: str) -> Set[str]:
+    """Get the emell modules that a fresh interpreter imports for a statement."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\n"
+            "print(' '.join(m for m in sys.modules if m.startswith('emell')))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class LazyImportTest(unittest.TestCase):
+    """Tests for the lazy_import function."""
+
+    def test_exports(self) -> None:
+        """Checks that every export of every package resolves."""
+        for name in PACKAGES:
+            package = importlib.import_module(f"emell.{name}")
+            for export in package.__all__:
+                value = getattr(package, export)
+                self.assertEqual(export, value.__name__)
+                self.assertIn(export, dir(package))
+
+            with self.assertRaises(AttributeError):
+                getattr(package, "missing")
+
+    def test_same_name_as_module(self) -> None:
+        """Checks that importing a module doesn't hide the export it shares."""
+        statement = (
+            "import emell.serialization.save\n"
+            "from emell.serialization import save\n"
+            "assert callable(save), save\n"
+            "import emell.computation.relu\n"
+            "from emell.computation import relu\n"
+            "assert callable(relu), relu\n"
+        )
+        imported_after(statement)
+
+    def test_lazy(self) -> None:
+        """Checks that packages only import the modules that are used."""
+        self.assertEqual({"emell", "emell.lazy_import"}, imported_after("import emell"))
+        self.assertEqual(
+            {"emell", "emell.lazy_import", "emell.neuralnetwork"},
+            imported_after("import emell.neuralnetwork"),
+        )
+
+        modules = imported_after("from emell.serialization import load")
+        self.assertIn("emell.neuralnetwork.network", modules)
+        for module in (
+            "emell.data",
+            "emell.loss",
+            "emell.neuralnetwork.backpropagation",
+            "emell.optimizer",
+            "emell.parallel",
+            "emell.serialization.checkpointer",
+            "emell.serving",
+        ):
+            self.assertNotIn(module, modules)
+
+        self.assertIn(
+            "emell.neuralnetwork", imported_after("import emell\nemell.neuralnetwork")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,25 @@
 """Contains utilities exclusively for testing."""
 
-from emell.testutil.make_random_function import make_random_function
+from typing import TYPE_CHECKING
+
+from emell.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from emell.testutil.assert_no_allocations import assert_no_allocations
+    from emell.testutil.check_activation import check_activation
+    from emell.testutil.make_random_function import make_random_function
 
 __all__ = [
+    "assert_no_allocations",
+    "check_activation",
     "make_random_function",
 ]
+
+lazy_import(
+    __name__,
+    {
+        "assert_no_allocations": "assert_no_allocations",
+        "check_activation": "check_activation",
+        "make_random_function": "make_random_function",
+    },
+)
@@ -0,0 +1,64 @@
+"""Contains an assertion that a function allocates no new arrays."""
+
+from typing import Any, Callable, Optional
+
+from emell.neuralnetwork import AllocationTracker, Network
+
+
+def assert_no_allocations(
+    function: Callable[[], Any],
+    calls: int = 10,
+    max_bytes: int = 0,
+    network: Optional[Network] = None,
+) -> None:
+    """
+    Check that a function allocates nothing once it has warmed up.
+
+    The function is called once to warm up, and then `calls` more times while
+    allocations are traced. Raises an AssertionError if any of those calls
+    allocates more than `max_bytes` above what was in use before it.
+
+    By default, nothing may be allocated at all, not even small Python objects
+    such as array views. Callers that need slack, such as for NumPy's iteration
+    buffer of up to 8192 elements that broadcasting operations like adding a
+    bias may use, pass a `max_bytes` below the size of the smallest array that
+    they want to catch.
+
+    Parameters
+    ----------
+    function : function() -> Any
+        Runs one step, such as a prediction or a training step.
+    calls : int
+        The number of steps to check.
+    max_bytes : int
+        The most bytes that a step may allocate.
+    network : Network, optional
+        The network that the function runs. If given, the bytes allocated by
+        each of its layers are included in the error message.
+
+    """
+    function()
+
+    tracker = AllocationTracker()
+    previous_profiler = None
+    if network is not None:
+        previous_profiler = network.profiler
+        network.profiler = tracker
+
+    try:
+        for call in range(calls):
+            with tracker.step(f"call {call}") as step:
+                function()
+            if step["allocated_bytes"] > max_bytes:
+                layers = ", ".join(
+                    f"layer {layer['layer']} {layer['phase']}: "
+                    f"{layer['allocated_bytes']} bytes"
+                    for layer in step["layers"]
+                )
+                raise AssertionError(
+                    f"Call {call} allocated {step['allocated_bytes']} bytes, "
+                    f"more than {max_bytes}" + (f" ({layers})" if layers else "")
+                )
+    finally:
+        if network is not None:
+            network.profiler = previous_profiler
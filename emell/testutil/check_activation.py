@@ -0,0 +1,54 @@
+"""Contains a check that the kernels of an activation agree."""
+
+import numpy as np
+
+from emell.activation import Activation
+
+
+def check_activation(activation: Activation, x: np.ndarray) -> None:
+    """
+    Check that every kernel of an activation computes the same thing.
+
+    The derivative is compared to central differences, and the fused and
+    in-place kernels are compared to the allocating ones. Raises an
+    AssertionError if anything differs.
+
+    Parameters
+    ----------
+    activation : Activation
+        The activation to check.
+    x : np.ndarray
+        float64 inputs, away from any point where the derivative jumps.
+
+    """
+    output = activation(x)
+    derivative = activation.prime(x)
+    step = 1e-6
+    np.testing.assert_allclose(
+        (activation(x + step) - activation(x - step)) / (2 * step),
+        derivative,
+        rtol=1e-5,
+        atol=1e-8,
+    )
+
+    out = np.empty_like(x)
+    fused_derivative = np.empty_like(x)
+    np.testing.assert_allclose(output, activation(x, out=out))
+    np.testing.assert_allclose(derivative, activation.prime(x, out=out))
+    fused = activation.forward_and_derivative(x, out, fused_derivative)
+    np.testing.assert_allclose(output, fused)
+    np.testing.assert_allclose(derivative, fused_derivative, atol=1e-15)
+
+    np.testing.assert_allclose(output, activation(x.copy(), out=x.copy()))
+    in_place = x.copy()
+    np.testing.assert_allclose(output, activation(in_place, out=in_place))
+    in_place = x.copy()
+    np.testing.assert_allclose(derivative, activation.prime(in_place, out=in_place))
+    in_place = x.copy()
+    activation.forward_and_derivative(in_place, in_place, fused_derivative)
+    np.testing.assert_allclose(output, in_place)
+    np.testing.assert_allclose(derivative, fused_derivative, atol=1e-15)
+
+    single = x.astype(np.float32)
+    assert activation(single).dtype == np.float32
+    assert activation.prime(single).dtype == np.float32
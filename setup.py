@@ -71,7 +71,9 @@ setup(
     author_email=EMAIL,
     python_requires=REQUIRES_PYTHON,
     url=URL,
-    packages=find_packages(exclude=["tests", "*.tests", "*.tests.*", "tests.*"]),
+    packages=find_packages(
+        exclude=["tests", "*.tests", "*.tests.*", "tests.*", "benchmarks", "benchmarks.*"]
+    ),
     test_suite = 'setup.test_suite',
     install_requires=REQUIRED,
     extras_require=EXTRAS,
@@ -80,6 +82,8 @@ setup(
     entry_points={
         'console_scripts': [
             'train_add = bin.neuralnetwork.train_add:main',
+            'search_add = bin.neuralnetwork.search_add:main',
+            'serve_model = bin.neuralnetwork.serve_model:main',
         ],
     },
     classifiers=[